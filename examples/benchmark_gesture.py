@@ -0,0 +1,46 @@
+"""
+Gesture detector benchmark: per-frame cost against the number of registered templates.
+
+Feeds a synthetic angle stream through GestureDetector with a growing template library
+and reports the mean and 99th percentile time of one `update` call, for incremental DTW
+and for the fixed-window Euclidean matcher.
+
+    python3 -m examples.benchmark_gesture --frames 2000 --length 30
+"""
+import argparse
+import time
+import numpy as np
+from open_cyber_glove.gesture import GestureDetector
+
+
+def run(method: str, num_templates: int, length: int, frames: int, seed: int = 0) -> dict:
+    """Time `update` for one configuration."""
+    rng = np.random.default_rng(seed)
+    detector = GestureDetector(num_features=22, window=length, method=method)
+    for i in range(num_templates):
+        # Varying lengths around `length`, as a real library would have
+        template_length = int(rng.integers(max(1, length // 2), length + 1))
+        detector.register(f'gesture_{i}', rng.normal(0, 0.5, (template_length, 22)), threshold=1e-3)
+    stream = np.cumsum(rng.normal(0, 0.02, (frames, 22)), axis=0)
+    for x in stream[:length]:
+        detector.update(x, 0.0)  # Warm-up: fill window and cost columns
+    times = np.empty(frames)
+    for i, x in enumerate(stream):
+        t0 = time.perf_counter()
+        detector.update(x, i / 120)
+        times[i] = time.perf_counter() - t0
+    return {'mean_us': times.mean() * 1e6, 'p99_us': np.percentile(times, 99) * 1e6}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=2000)
+    parser.add_argument('--length', type=int, default=30, help='Maximum template length in frames')
+    parser.add_argument('--templates', type=int, nargs='+', default=[1, 4, 16, 64, 256])
+    args = parser.parse_args()
+
+    print(f"{'method':>10} {'templates':>10} {'mean us':>9} {'p99 us':>9} {'us/template':>12}")
+    for method in GestureDetector.METHODS:
+        for k in args.templates:
+            r = run(method, k, args.length, args.frames)
+            print(f"{method:>10} {k:>10} {r['mean_us']:9.1f} {r['p99_us']:9.1f} {r['mean_us'] / k:12.2f}")
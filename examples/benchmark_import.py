@@ -0,0 +1,57 @@
+"""
+Cold-start import benchmark for the acquisition core.
+
+Imports `open_cyber_glove` in fresh interpreters, reports the median import time and
+fails if it exceeds the budget or if any heavy optional stack got pulled in eagerly.
+
+    python3 -m examples.benchmark_import --runs 10 --budget_ms 300
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Modules that must only be loaded on first use of inference, plotting or visualization
+HEAVY_MODULES = ['matplotlib', 'onnxruntime', 'open3d', 'scipy', 'tqdm', 'onnx']
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import open_cyber_glove
+elapsed = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{'elapsed': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure(runs: int) -> dict:
+    """Import the package `runs` times in fresh interpreters and collect timings."""
+    probe = PROBE.format(heavy=HEAVY_MODULES)
+    elapsed = []
+    heavy = set()
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', probe], check=True, capture_output=True, text=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        elapsed.append(result['elapsed'])
+        heavy.update(result['heavy'])
+    return {'median_ms': statistics.median(elapsed) * 1000, 'max_ms': max(elapsed) * 1000, 'heavy': sorted(heavy)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget_ms', type=float, default=300.0)
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(f"import open_cyber_glove: median {result['median_ms']:.1f} ms, max {result['max_ms']:.1f} ms "
+          f"over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+    failed = False
+    if result['heavy']:
+        print(f"FAIL: heavy modules imported eagerly: {', '.join(result['heavy'])}")
+        failed = True
+    if result['median_ms'] > args.budget_ms:
+        print("FAIL: cold-start import time over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,121 @@
+"""
+Reader loop benchmark: 'poll' vs 'blocking' serial I/O.
+
+Emulates a glove on a pseudo-terminal (POSIX only) streaming valid packets at a fixed
+rate, runs the background reader in each I/O mode and reports reader CPU usage, serial
+calls (wakeups) per second, delivered packets and shutdown time.
+
+    python3 -m examples.benchmark_reader --duration 5 --rate 120
+"""
+import argparse
+import os
+import struct
+import threading
+import time
+import zlib
+import numpy as np
+from open_cyber_glove.glove import Glove
+
+
+def make_packet(tensile: np.ndarray, timestamp: int) -> bytes:
+    """Build a valid 132-byte packet with CRC."""
+    body = bytearray(Glove.CRC_DATA_SIZE)
+    body[Glove.TENSILE_DATA_OFFSET:Glove.TENSILE_DATA_OFFSET + Glove.TENSILE_DATA_SIZE] = np.asarray(tensile, dtype='<i4').tobytes()
+    struct.pack_into('<I', body, Glove.TIMESTAMP_OFFSET, timestamp)
+    padding = bytes(Glove.PACKET_SIZE - Glove.CRC_DATA_SIZE - 4)
+    return bytes(body) + padding + struct.pack('<I', zlib.crc32(body) & 0xFFFFFFFF)
+
+
+class CountingSerial:
+    """Proxy counting the serial calls the reader makes (each one is at least one syscall/wakeup)."""
+
+    def __init__(self, port):
+        self._port = port
+        self.calls = 0
+
+    @property
+    def in_waiting(self):
+        self.calls += 1
+        return self._port.in_waiting
+
+    def read(self, size=1):
+        self.calls += 1
+        return self._port.read(size)
+
+    def readinto(self, b):
+        self.calls += 1
+        return self._port.readinto(b)
+
+    def __getattr__(self, name):
+        return getattr(self._port, name)
+
+
+def stream(fd: int, rate: float, stop: threading.Event) -> None:
+    """Write packets to the pty master at a fixed rate."""
+    rng = np.random.default_rng(0)
+    period = 1.0 / rate
+    next_time = time.perf_counter()
+    count = 0
+    while not stop.is_set():
+        os.write(fd, make_packet(rng.integers(1000, 9000, Glove.NUM_TENSILE_SENSORS), int(count * period * 1e6) & 0xFFFFFFFF))
+        count += 1
+        next_time += period
+        time.sleep(max(0.0, next_time - time.perf_counter()))
+
+
+def run(io_mode: str, duration: float, rate: float) -> dict:
+    """Benchmark one I/O mode."""
+    master, slave = os.openpty()
+    glove = Glove('right')
+    stop = threading.Event()
+    writer = threading.Thread(target=stream, args=(master, rate, stop), daemon=True)
+    try:
+        glove.connect(os.ttyname(slave), io_mode=io_mode)
+        glove.serial_port = CountingSerial(glove.serial_port)
+        writer.start()
+
+        glove.start_reader()
+        thread_id = glove._reader_thread.ident
+        t0 = time.perf_counter()
+        cpu0 = time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+        delivered = 0
+        while time.perf_counter() - t0 < duration:
+            time.sleep(0.05)
+            with glove._queue_lock:
+                while not glove._data_queue.empty():
+                    glove._data_queue.get_nowait()
+                    delivered += 1
+        cpu = time.clock_gettime(time.pthread_getcpuclockid(thread_id)) - cpu0
+        elapsed = time.perf_counter() - t0
+        calls = glove.serial_port.calls
+
+        t_stop = time.perf_counter()
+        glove.stop_reader()
+        shutdown = time.perf_counter() - t_stop
+    finally:
+        glove.stop_reader()
+        stop.set()
+        if writer.is_alive():
+            writer.join()
+        if glove.serial_port is not None:
+            glove.serial_port.close()
+        os.close(master)
+        os.close(slave)
+    return {
+        'cpu_percent': cpu / elapsed * 100,
+        'calls_per_s': calls / elapsed,
+        'packets_per_s': delivered / elapsed,
+        'shutdown_ms': shutdown * 1000,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--rate', type=float, default=120.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':>9} {'cpu %':>7} {'calls/s':>9} {'packets/s':>10} {'shutdown ms':>12}")
+    for mode in (Glove.IO_MODE_POLL, Glove.IO_MODE_BLOCKING):
+        r = run(mode, args.duration, args.rate)
+        print(f"{mode:>9} {r['cpu_percent']:7.2f} {r['calls_per_s']:9.0f} {r['packets_per_s']:10.1f} {r['shutdown_ms']:12.1f}")
@@ -1,10 +1,12 @@
 from open_cyber_glove.sdk import OpenCyberGlove
 from open_cyber_glove.visualizer import HandVisualizer
 import argparse
+import logging
 import time
 import numpy as np
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     parser = argparse.ArgumentParser()
     parser.add_argument('--left_port', type=str, default=None)
     parser.add_argument('--right_port', type=str, default=None)
@@ -21,12 +23,13 @@ if __name__ == "__main__":
     sdk.calibrate()
     sdk.diagnose()
 
-    visualizer = HandVisualizer(model_path=args.calib_path)    
+    # Renders on its own thread (on macOS from this loop via render_once); update() only hands over the latest pose
+    visualizer = HandVisualizer(model_path=args.calib_path, target_fps=60)
     
     # Real-time update loop
     try:
         print("Starting real-time update loop...")
-        while True:
+        while visualizer.render_once():
             # Update poses with timeout protection
             if sdk.left_glove is not None:
                 angles = sdk.get_angles(hand_type='left', method='model')                
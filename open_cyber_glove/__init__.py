@@ -1,2 +1,3 @@
-from .glove import Glove
-from .sdk import OpenCyberGlove 
\ No newline at end of file
+from .glove import Glove, GloveFrame, GloveSensorData
+from .sdk import OpenCyberGlove 
+from .linear import LinearModel
@@ -0,0 +1,248 @@
+"""
+Headless batch conversion of raw glove recordings to joint angles and 3D joint positions.
+
+A recording (written by `Glove.start_recording`) is split into chunks that a process
+pool decodes, normalizes with the glove calibration, runs through batched inference
+and batched forward kinematics. Results are written in place into columnar .npy files,
+so output order never depends on completion order. Finished chunks are tracked in
+progress.json together with the inputs that produced them; rerunning with --resume
+continues where a previous run stopped, or starts over if any input has changed.
+
+    python3 -m open_cyber_glove.convert recording.bin --calibration right_calib.npz \\
+        --model model/best.onnx --hand_model model/hand_model.pkl --hand_type right --out out/
+"""
+import argparse
+import json
+import logging
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+from .glove import Glove, PACKET_DTYPE
+from .linear import LinearModel
+from .session import model_hash
+from .utils import DEFAULT_GT_ORDER, NUM_JOINTS, forward_kinematics_batch, load_hand_model
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_FILE = 'progress.json'
+
+# Per-process state, set up once by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _output_columns(num_frames: int, with_joints: bool) -> Dict[str, Tuple[Tuple[int, ...], np.dtype]]:
+    """Shape and dtype of every output column."""
+    columns = {
+        'device_timestamp': ((num_frames,), np.dtype(np.uint32)),
+        'angles': ((num_frames, len(DEFAULT_GT_ORDER)), np.dtype(np.float32)),
+    }
+    if with_joints:
+        columns['joints'] = ((num_frames, NUM_JOINTS, 3), np.dtype(np.float32))
+    return columns
+
+
+def _init_worker(args: Dict[str, Any]) -> None:
+    """Load calibration, model and hand model once per worker process."""
+    glove = Glove(args['hand_type'])
+    glove.load_calibration(args['calibration'])
+    _worker['glove'] = glove
+    _worker['method'] = args['method']
+    if args['method'] == 'linear':
+        _worker['model'] = glove.fused_linear_model(LinearModel.load(args['model']))
+    else:
+        from .executor import load_session
+        from .session import SessionConfig
+        # One thread per process: parallelism comes from the pool
+        config = SessionConfig(intra_op_num_threads=1, inter_op_num_threads=1)
+        _worker['model'] = load_session(args['model'], args['backend'], config)
+    _worker['hand_model'] = load_hand_model(args['hand_model'])[args['hand_type']] if args['hand_model'] else None
+    _worker['recording'] = np.memmap(args['recording'], dtype=PACKET_DTYPE, mode='r')
+    _worker['out'] = {
+        name: np.load(os.path.join(args['out'], f"{name}.npy"), mmap_mode='r+')
+        for name in _output_columns(0, args['hand_model'] is not None)
+    }
+
+
+def _infer_batch(delta: np.ndarray) -> np.ndarray:
+    """Batched model inference on calibrated tensile vectors (device sensor order)."""
+    glove = _worker['glove']
+    model = _worker['model']
+    x = delta[:, glove.SENSOR_ORDER].astype(np.float32)
+    batch_dim = model.get_inputs()[0].shape[0]
+    if isinstance(batch_dim, int) and batch_dim == 1:
+        # Model exported with a fixed batch size of one
+        return np.concatenate([model.run(None, {'input': row[None]})[0] for row in x])
+    return model.run(None, {'input': x})[0]
+
+
+def _convert_chunk(index: int, start: int, stop: int) -> Tuple[int, int]:
+    """Decode, normalize, infer and run FK on one chunk, writing results into the output columns."""
+    packets = np.asarray(_worker['recording'][start:stop])
+    tensile = packets['tensile']
+    if _worker['method'] == 'linear':
+        angles = _worker['model'].predict(tensile)
+    else:
+        angles = _infer_batch(tensile - _worker['glove'].avg_val)
+    out = _worker['out']
+    out['device_timestamp'][start:stop] = packets['timestamp']
+    out['angles'][start:stop] = angles
+    if _worker['hand_model'] is not None:
+        joints, _ = forward_kinematics_batch(_worker['hand_model'], angles, _worker['glove'].hand_type)
+        out['joints'][start:stop] = joints / 1000  # mm -> m, as HandVisualizer.get_joints
+    for column in out.values():
+        column.flush()
+    return index, stop - start
+
+
+def _run_key(num_frames: int, chunk_size: int, calibration: str, model: str, hand_type: str,
+             method: str, hand_model: Optional[str]) -> Dict[str, Any]:
+    """Everything that determines the output of a run; progress is only reused if it matches."""
+    return {
+        'num_frames': num_frames,
+        'chunk_size': chunk_size,
+        'model': model_hash(model),
+        'calibration': model_hash(calibration),
+        'hand_model': model_hash(hand_model) if hand_model else None,
+        'hand_type': hand_type,
+        'method': method,
+        'with_joints': hand_model is not None,
+    }
+
+
+def _load_progress(out_dir: str, key: Dict[str, Any]) -> Optional[List[int]]:
+    """Finished chunk indices from a previous run with the same key, or None."""
+    path = os.path.join(out_dir, PROGRESS_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        progress = json.load(f)
+    changed = sorted(name for name in key if progress.get(name) != key[name])
+    if changed:
+        logger.warning(f"Existing progress does not match this run ({', '.join(changed)} changed), starting over")
+        return None
+    return progress['done']
+
+
+def _save_progress(out_dir: str, key: Dict[str, Any], done: List[int]) -> None:
+    """Atomically write the run key and the list of finished chunks."""
+    path = os.path.join(out_dir, PROGRESS_FILE)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({**key, 'done': sorted(done)}, f)
+    os.replace(tmp, path)
+
+
+def unwrap_timestamps(device_timestamp: np.ndarray) -> np.ndarray:
+    """Unwrap uint32 microsecond device timestamps into float64 seconds from the first frame."""
+    ts = np.asarray(device_timestamp, dtype=np.int64)
+    if not len(ts):
+        return ts.astype(np.float64)
+    wraps = np.concatenate([[0], np.cumsum(np.diff(ts) < -(1 << 31))])
+    ts += wraps << 32
+    return (ts - ts[0]) * 1e-6
+
+
+def convert(recording: str, calibration: str, model: str, out: str, hand_type: str = 'right',
+            method: str = 'model', backend: str = 'onnxruntime', hand_model: Optional[str] = None,
+            chunk_size: int = 4096, workers: Optional[int] = None, resume: bool = False,
+            progress: bool = True) -> Dict[str, float]:
+    """
+    Convert a raw recording to columnar angle/joint outputs.
+
+    Args:
+        recording: Raw packet file written by `Glove.start_recording`
+        calibration: Calibration .npz written by `Glove.save_calibration`
+        model: ONNX model (method 'model') or LinearModel .npz (method 'linear')
+        out: Output directory for device_timestamp.npy, time.npy, angles.npy and joints.npy
+        hand_type: 'left' or 'right'
+        method: 'model' or 'linear'
+        backend: Backend for ONNX models ('onnxruntime' or 'numpy')
+        hand_model: Hand model .pkl; joints are skipped if None
+        chunk_size: Frames per task
+        workers: Number of worker processes (default: CPU count)
+        resume: Continue a previous run into the same output directory; ignored (full
+            restart) if the recording, model, calibration, hand model, hand type, method
+            or chunk size differ from that run
+        progress: Show a progress bar
+
+    Returns:
+        Dict with 'frames', 'seconds' and 'frames_per_second' for this run
+    """
+    num_frames = os.path.getsize(recording) // PACKET_DTYPE.itemsize
+    if num_frames == 0:
+        raise ValueError(f"Recording {recording} contains no complete packets")
+    if os.path.getsize(recording) % PACKET_DTYPE.itemsize:
+        logger.warning(f"{recording} ends with a partial packet, ignoring it")
+    os.makedirs(out, exist_ok=True)
+    columns = _output_columns(num_frames, hand_model is not None)
+
+    key = _run_key(num_frames, chunk_size, calibration, model, hand_type, method, hand_model)
+    done = _load_progress(out, key) if resume else None
+    if done is None:
+        done = []
+        for name, (shape, dtype) in columns.items():
+            np.lib.format.open_memmap(os.path.join(out, f"{name}.npy"), mode='w+', dtype=dtype, shape=shape).flush()
+        _save_progress(out, key, done)
+
+    finished = set(done)
+    tasks = [(i, start, min(start + chunk_size, num_frames))
+             for i, start in enumerate(range(0, num_frames, chunk_size)) if i not in finished]
+    init_args = {
+        'recording': recording, 'calibration': calibration, 'model': model, 'out': out,
+        'hand_type': hand_type, 'method': method, 'backend': backend, 'hand_model': hand_model,
+    }
+
+    bar = None
+    if progress:
+        from tqdm import tqdm
+        bar = tqdm(total=num_frames, initial=min(len(finished) * chunk_size, num_frames), unit='frame', desc='convert')
+    t0 = time.perf_counter()
+    converted = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(init_args,)) as pool:
+        futures = [pool.submit(_convert_chunk, *task) for task in tasks]
+        for future in as_completed(futures):
+            index, count = future.result()
+            done.append(index)
+            converted += count
+            _save_progress(out, key, done)
+            if bar is not None:
+                bar.update(count)
+    elapsed = time.perf_counter() - t0
+    if bar is not None:
+        bar.close()
+
+    device_timestamp = np.load(os.path.join(out, 'device_timestamp.npy'), mmap_mode='r')
+    np.save(os.path.join(out, 'time.npy'), unwrap_timestamps(device_timestamp))
+    return {
+        'frames': converted,
+        'seconds': elapsed,
+        'frames_per_second': converted / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('recording', type=str)
+    parser.add_argument('--calibration', type=str, required=True)
+    parser.add_argument('--model', type=str, required=True)
+    parser.add_argument('--out', type=str, required=True)
+    parser.add_argument('--hand_type', type=str, default='right', choices=['left', 'right'])
+    parser.add_argument('--method', type=str, default='model', choices=['model', 'linear'])
+    parser.add_argument('--backend', type=str, default='onnxruntime', choices=['onnxruntime', 'numpy'])
+    parser.add_argument('--hand_model', type=str, default=None)
+    parser.add_argument('--chunk_size', type=int, default=4096)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--resume', action='store_true')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stats = convert(args.recording, args.calibration, args.model, args.out, args.hand_type, args.method,
+                    args.backend, args.hand_model, args.chunk_size, args.workers, args.resume)
+    print(f"Converted {stats['frames']} frames in {stats['seconds']:.1f} s ({stats['frames_per_second']:.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .glove import Glove, PACKET_DTYPE
+
+TIMESTAMP_WRAP = 1 << 32
+
+
+@dataclass
+class RecordingSession:
+    """
+    One raw recording with per-frame training targets.
+
+    Attributes:
+        recording: Raw packet file written by `Glove.start_recording`
+        targets: .npy file with one target row per recorded packet, e.g. (N, 22) joint angles
+        calibration: Calibration .npz (`Glove.save_calibration`) in effect from the first frame
+        recalibrations: (frame, calibration .npz) pairs for recordings that were appended to
+            across a recalibration; windows never span the given frame
+    """
+    recording: str
+    targets: str
+    calibration: Optional[str] = None
+    recalibrations: Sequence[Tuple[int, str]] = ()
+
+
+def find_gaps(timestamp: np.ndarray, max_gap: float, block: int = 1 << 20) -> np.ndarray:
+    """
+    Frame indices that start a new contiguous run.
+
+    A run is broken where the device timestamp does not advance or advances by more than
+    `max_gap`, e.g. after dropped packets, a device reset or between appended recordings.
+    The uint32 timestamp wrap is handled with modular differences. Timestamps are read in
+    blocks, so a memory-mapped column is never loaded as a whole.
+
+    Args:
+        timestamp: Raw uint32 device timestamps in microseconds
+        max_gap: Largest allowed step between consecutive frames in seconds
+        block: Frames read per block
+
+    Returns:
+        np.ndarray: Sorted indices i > 0 where frame i does not continue frame i - 1
+    """
+    max_gap_us = max_gap * 1e6
+    breaks = []
+    for start in range(1, len(timestamp), block):
+        ts = np.asarray(timestamp[start - 1:start + block], dtype=np.int64)
+        step = np.diff(ts) % TIMESTAMP_WRAP
+        breaks.append(np.flatnonzero((step == 0) | (step > max_gap_us)) + start)
+    return np.concatenate(breaks) if breaks else np.zeros(0, dtype=np.int64)
+
+
+class GloveWindowDataset:
+    """
+    Fixed-length training windows over raw glove recordings, read through memory maps.
+
+    Recordings and targets are never loaded into RAM. On construction only the timestamp
+    column is scanned to split every session into contiguous segments (see `find_gaps`)
+    that also end at calibration boundaries; the index stores one row per segment, so its
+    size does not depend on the number of windows. A window never spans a gap, a
+    calibration change or two sessions.
+
+    `dataset[i]` returns 'tensile', 'timestamp' and 'target' as read-only views into the
+    memory-mapped files, while 'imu' and 'input' are computed into new arrays.
+    `iter_batches` gathers several windows at once with optional shuffling and worker
+    sharding and returns new arrays only. Both return dicts with:
+
+    - 'tensile': (..., window, 19) int32 raw tensile values
+    - 'imu': (..., window, 9) float32 accelerometer, gyroscope and magnetometer readings
+    - 'timestamp': (..., window) uint32 device timestamps
+    - 'target': (..., window, T) target rows
+    - 'input': (..., window, 19) float32 calibrated model input, i.e. tensile minus the
+      static average reordered by `Glove.SENSOR_ORDER` as in `Glove.inference`; only
+      present if every session has a calibration
+
+    Attributes:
+        window: Frames per window
+        stride: Frames between the starts of consecutive windows in a segment
+        segments: (num_segments, 3) array of session index, first frame and frame count
+    """
+
+    def __init__(self, sessions: Sequence[RecordingSession], window: int, stride: int = 1,
+                 max_gap: float = 0.05):
+        """
+        Args:
+            sessions: Recordings to serve windows from
+            window: Frames per window
+            stride: Frames between consecutive window starts
+            max_gap: Largest step between device timestamps (seconds) inside a window
+        """
+        if window < 1 or stride < 1:
+            raise ValueError("Window and stride must be positive")
+        self.window = window
+        self.stride = stride
+        self._recordings: List[np.memmap] = []
+        self._targets: List[np.ndarray] = []
+        self._offsets: List[np.ndarray] = []
+        segments = []
+        segment_offsets = []
+        for index, session in enumerate(sessions):
+            recording = np.memmap(session.recording, dtype=PACKET_DTYPE, mode='r')
+            targets = np.load(session.targets, mmap_mode='r')
+            if len(targets) != len(recording):
+                raise ValueError(
+                    f"{session.targets} has {len(targets)} rows but {session.recording} has {len(recording)} packets"
+                )
+            self._recordings.append(recording)
+            self._targets.append(targets)
+
+            calibrations = [(0, session.calibration)] + sorted(session.recalibrations)
+            offsets = np.zeros((len(calibrations), Glove.NUM_TENSILE_SENSORS), dtype=np.float32)
+            for c, (_, path) in enumerate(calibrations):
+                if path is None:
+                    offsets[c] = np.nan
+                else:
+                    with np.load(path) as data:
+                        offsets[c] = data['avg_val']
+            self._offsets.append(offsets)
+
+            calibration_starts = np.array([frame for frame, _ in calibrations[1:]], dtype=np.int64)
+            bounds = np.unique(np.concatenate([
+                [0], find_gaps(recording['timestamp'], max_gap), calibration_starts, [len(recording)],
+            ]))
+            starts, counts = bounds[:-1], np.diff(bounds)
+            keep = counts >= window
+            starts, counts = starts[keep], counts[keep]
+            segments.append(np.stack([np.full_like(starts, index), starts, counts], axis=1))
+            segment_offsets.append(np.searchsorted(calibration_starts, starts, side='right'))
+
+        self.segments = np.concatenate(segments) if segments else np.zeros((0, 3), dtype=np.int64)
+        self._segment_offset = np.concatenate(segment_offsets) if segment_offsets else np.zeros(0, dtype=np.int64)
+        self._cumulative = np.cumsum((self.segments[:, 2] - window) // stride + 1)
+        self.has_input = all(not np.isnan(offsets).any() for offsets in self._offsets)
+
+    def __len__(self) -> int:
+        return int(self._cumulative[-1]) if len(self._cumulative) else 0
+
+    def locate(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Map window indices to session, first frame and calibration index.
+
+        Args:
+            indices: Window indices in [0, len(dataset))
+
+        Returns:
+            Tuple of session indices, first frames and per-session calibration indices
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if np.any((indices < 0) | (indices >= len(self))):
+            raise IndexError("Window index out of range")
+        segment = np.searchsorted(self._cumulative, indices, side='right')
+        first = np.where(segment > 0, self._cumulative[segment - 1], 0)
+        starts = self.segments[segment, 1] + (indices - first) * self.stride
+        return self.segments[segment, 0], starts, self._segment_offset[segment]
+
+    def _window_dict(self, packets: np.ndarray, target: np.ndarray, offset: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+        imu = np.concatenate([packets['acc'], packets['gyro'], packets['mag']], axis=-1)
+        out = {'tensile': packets['tensile'], 'imu': imu, 'timestamp': packets['timestamp'], 'target': target}
+        if offset is not None:
+            out['input'] = (packets['tensile'] - offset)[..., Glove.SENSOR_ORDER].astype(np.float32)
+        return out
+
+    def __getitem__(self, index: int) -> Dict[str, np.ndarray]:
+        """Window `index`; raw fields are read-only views, 'imu' and 'input' are copies."""
+        session, start, calibration = (int(v[0]) for v in self.locate([index]))
+        stop = start + self.window
+        offset = self._offsets[session][calibration] if self.has_input else None
+        return self._window_dict(self._recordings[session][start:stop], self._targets[session][start:stop], offset)
+
+    def iter_batches(self, batch_size: int, shuffle: bool = False, seed: Optional[int] = None,
+                     drop_last: bool = False, worker_id: int = 0, num_workers: int = 1) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Iterate over batches of windows.
+
+        Windows are gathered with one fancy-indexed read per session in the batch, which
+        only touches the pages holding the requested frames.
+
+        Args:
+            batch_size: Windows per batch
+            shuffle: Visit windows in random order
+            seed: Shuffle seed; all workers of one epoch must use the same seed
+            drop_last: Skip a final batch smaller than batch_size
+            worker_id: Index of this worker
+            num_workers: Number of workers; each one gets a disjoint share of the batches
+
+        Yields:
+            Dict of (batch, window, ...) arrays, see the class docstring
+        """
+        if not 0 <= worker_id < num_workers:
+            raise ValueError(f"worker_id must be in [0, {num_workers}), got {worker_id}")
+        order = np.random.default_rng(seed).permutation(len(self)) if shuffle else np.arange(len(self))
+        batch_starts = range(0, len(order), batch_size)
+        for b, begin in enumerate(batch_starts):
+            if b % num_workers != worker_id:
+                continue
+            indices = order[begin:begin + batch_size]
+            if drop_last and len(indices) < batch_size:
+                break
+            yield self._gather(indices)
+
+    def _gather(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        sessions, starts, calibrations = self.locate(indices)
+        frames = np.arange(self.window)
+        packets = np.empty((len(indices), self.window), dtype=PACKET_DTYPE)
+        target_shape = self._targets[int(sessions[0])].shape[1:]
+        target = np.empty((len(indices), self.window) + target_shape, dtype=self._targets[int(sessions[0])].dtype)
+        offset = np.empty((len(indices), 1, Glove.NUM_TENSILE_SENSORS), dtype=np.float32) if self.has_input else None
+        for session in np.unique(sessions):
+            rows = np.flatnonzero(sessions == session)
+            # Sorted reads keep the access pattern sequential within the file
+            rows = rows[np.argsort(starts[rows], kind='stable')]
+            frame_index = starts[rows, None] + frames
+            packets[rows] = self._recordings[session][frame_index]
+            target[rows] = self._targets[session][frame_index]
+            if offset is not None:
+                offset[rows, 0] = self._offsets[session][calibrations[rows]]
+        return self._window_dict(packets, target, offset)
@@ -0,0 +1,402 @@
+import logging
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+WEIGHT_DTYPES = ('float32', 'float16', 'int8')
+
+
+class UnsupportedModelError(ValueError):
+    """Raised when an ONNX graph uses operators the NumPy executor does not implement."""
+
+
+def _attr(node: Any, name: str, default: Any) -> Any:
+    """Read a scalar node attribute."""
+    import onnx
+    for attr in node.attribute:
+        if attr.name == name:
+            return onnx.helper.get_attribute_value(attr)
+    return default
+
+
+def _quantize(weight: np.ndarray, weight_dtype: str, transposed: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize a weight tensor and return (stored, dequantized).
+
+    int8 uses symmetric per-output-channel scales: one per column of an (in, out) weight,
+    or one per row if `transposed`, i.e. an (out, in) weight consumed by Gemm with transB=1.
+    """
+    if weight_dtype == 'float32':
+        return weight, weight
+    if weight_dtype == 'float16':
+        stored = weight.astype(np.float16)
+        return stored, stored.astype(np.float32)
+    axis = (1 if transposed else 0) if weight.ndim == 2 else None
+    scale = np.max(np.abs(weight), axis=axis, keepdims=axis is not None) / 127.0
+    scale = np.where(scale == 0, 1.0, scale).astype(np.float32)
+    stored = np.clip(np.round(weight / scale), -127, 127).astype(np.int8)
+    return stored, stored.astype(np.float32) * scale
+
+
+def _matmul(a: np.ndarray, b: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """Matrix product; np.dot has less per-call overhead than np.matmul for tiny 2D operands."""
+    if out is not None and a.ndim == 2 and b.ndim == 2 and a.flags.c_contiguous:
+        return np.dot(a, b, out=out)
+    return np.matmul(a, b, out=out)
+
+
+class _Input:
+    """Minimal stand-in for onnxruntime.NodeArg, used by `session.warm_up`."""
+    __slots__ = ('name', 'shape', 'type')
+
+    def __init__(self, name: str, shape: List[Any], type: str = 'tensor(float)'):
+        self.name = name
+        self.shape = shape
+        self.type = type
+
+
+class NumpySession:
+    """
+    Pure-NumPy executor for small MLP ONNX graphs.
+
+    Mirrors the `run`/`get_inputs` API of onnxruntime.InferenceSession so it can be passed
+    as the model to `Glove.inference`. The graph is compiled once into a list of NumPy
+    steps; intermediate buffers are allocated on the first run for a given batch size and
+    reused afterwards, so steady-state calls allocate only the returned output. Buffers
+    are kept for the `MAX_CACHED_SHAPES` most recently used input shapes.
+
+    Weights can be stored as float16 or int8 (symmetric, per output channel) to shrink the
+    model and reproduce the accuracy of a quantized deployment. Compute always runs in
+    float32 BLAS on the dequantized weights.
+
+    Note:
+        A session reuses its buffers across calls, so `run` holds an internal lock; threads
+        sharing a session (e.g. both hands) take turns. Use one session per thread to run
+        in parallel.
+    """
+    MAX_CACHED_SHAPES = 8  # Input shapes (e.g. batch sizes) whose buffers are kept
+    SUPPORTED_OPS = ('Gemm', 'MatMul', 'Add', 'Sub', 'Mul', 'Div', 'Relu', 'LeakyRelu',
+                     'Sigmoid', 'Tanh', 'Identity', 'Flatten', 'Reshape', 'Constant')
+
+    def __init__(self, model_path: str, weight_dtype: str = 'float32'):
+        """
+        Load weights from an ONNX file and compile the graph.
+
+        Args:
+            model_path: Path to the ONNX model
+            weight_dtype: Weight storage precision ('float32', 'float16' or 'int8')
+
+        Raises:
+            UnsupportedModelError: If the graph contains operators outside SUPPORTED_OPS
+        """
+        try:
+            import onnx
+            from onnx import numpy_helper
+        except ImportError:
+            raise ImportError("The NumPy executor needs the 'onnx' package to read model files: "
+                              "pip install open_cyber_glove[numpy-backend]")
+        if weight_dtype not in WEIGHT_DTYPES:
+            raise ValueError(f"Invalid weight dtype: {weight_dtype}")
+        self.model_path = model_path
+        self.weight_dtype = weight_dtype
+
+        graph = onnx.load(model_path).graph
+        unsupported = sorted({node.op_type for node in graph.node} - set(self.SUPPORTED_OPS))
+        if unsupported:
+            raise UnsupportedModelError(f"Unsupported operators in {model_path}: {', '.join(unsupported)}")
+
+        # Gemm weights stored as (out, in); their output channels are rows, not columns
+        transposed = {node.input[1] for node in graph.node
+                      if node.op_type == 'Gemm' and _attr(node, 'transB', 0)}
+        self.quantized: Dict[str, np.ndarray] = {}
+        self._constants: Dict[str, np.ndarray] = {}
+        for init in graph.initializer:
+            value = numpy_helper.to_array(init)
+            if value.dtype == np.float64:
+                value = value.astype(np.float32)
+            if value.dtype == np.float32 and value.ndim == 2:
+                self.quantized[init.name], value = _quantize(value, weight_dtype, init.name in transposed)
+            self._constants[init.name] = value
+
+        initializer_names = set(self._constants)
+        self._inputs = []
+        for inp in graph.input:
+            if inp.name in initializer_names:
+                continue
+            dims = [d.dim_value if d.HasField('dim_value') else (d.dim_param or None)
+                    for d in inp.type.tensor_type.shape.dim]
+            self._inputs.append(_Input(inp.name, dims))
+        self._output_names = [out.name for out in graph.output]
+
+        # Every tensor gets a slot index; constants are prefilled, the rest is written per run
+        consumers: Dict[str, int] = {}
+        for node in graph.node:
+            for name in node.input:
+                consumers[name] = consumers.get(name, 0) + 1
+        for name in self._output_names:
+            consumers[name] = consumers.get(name, 0) + 1
+        self._consumers = consumers
+        self._slot_index: Dict[str, int] = {}
+        self._slots: List[Optional[np.ndarray]] = []
+        self._steps: List[Tuple[Callable, int, bool]] = []
+        self._owned: set = set()
+        for node in graph.node:
+            self._compile_node(node, numpy_helper)
+        self._output_slots = [self._slot_index[name] for name in self._output_names]
+        self._lock = threading.Lock()
+        # Compiled steps with their output buffers, per input shapes (least recently used first)
+        self._plans: "OrderedDict[Tuple, List[Tuple[Callable, int, Optional[np.ndarray]]]]" = OrderedDict()
+
+    def _slot(self, name: str) -> int:
+        """Slot index of a tensor, allocating one on first use."""
+        if name not in self._slot_index:
+            self._slot_index[name] = len(self._slots)
+            self._slots.append(self._constants.get(name))
+        return self._slot_index[name]
+
+    def _compile_node(self, node: Any, numpy_helper: Any) -> None:
+        """
+        Translate an ONNX node into a NumPy step (or fold it into a constant).
+
+        Each step is a closure `fn(slots, out)` reading its inputs from fixed slot indices.
+        Element-wise ops whose first input is an intermediate with no other consumer run in
+        place on that buffer.
+        """
+        op = node.op_type
+        inputs = [name for name in node.input if name]
+        output = node.output[0]
+
+        if op == 'Constant':
+            self._constants[output] = numpy_helper.to_array(_attr(node, 'value', None))
+            return
+
+        in_place = (op in ('Add', 'Sub', 'Mul', 'Div', 'Relu', 'LeakyRelu', 'Sigmoid', 'Tanh')
+                    and inputs[0] in self._owned and self._consumers.get(inputs[0], 0) == 1)
+        if in_place and len(inputs) > 1:
+            # Binary ops only run in place against vectors/scalars that cannot grow the result
+            other = self._constants.get(inputs[1])
+            in_place = other is not None and other.ndim <= 1
+        x = self._slot(inputs[0])
+        y = self._slot(inputs[1]) if len(inputs) > 1 else None
+
+        if op == 'Gemm':
+            alpha = np.float32(_attr(node, 'alpha', 1.0))
+            beta = np.float32(_attr(node, 'beta', 1.0))
+            trans_a = _attr(node, 'transA', 0)
+            trans_b = _attr(node, 'transB', 0)
+            weight = self._constants.get(inputs[1])
+            if weight is not None:
+                # Fold transposition and alpha into constant weights once instead of on every call
+                weight = np.ascontiguousarray(weight.T if trans_b else weight) * alpha
+                alpha = np.float32(1.0)
+            bias = self._constants.get(inputs[2]) if len(inputs) > 2 else None
+            if bias is not None:
+                bias = bias * beta
+                if bias.ndim == 1:
+                    bias = bias.reshape(1, -1)  # Gemm outputs are 2D; a same-rank operand broadcasts faster
+            z = self._slot(inputs[2]) if len(inputs) > 2 else None
+
+            if weight is not None and not trans_a and alpha == 1.0 and (bias is not None or z is None):
+                # Common dense layer: constant weights and bias
+                def fn(slots, out):
+                    out = _matmul(slots[x], weight, out)
+                    if bias is not None:
+                        out += bias
+                    return out
+            else:
+                fn = self._generic_gemm(x, y, z, weight, bias, alpha, beta, trans_a, trans_b)
+        elif op == 'MatMul':
+            fn = lambda slots, out: _matmul(slots[x], slots[y], out)
+        elif op in ('Add', 'Sub', 'Mul', 'Div'):
+            ufunc = {'Add': np.add, 'Sub': np.subtract, 'Mul': np.multiply, 'Div': np.divide}[op]
+            other = self._constants.get(inputs[1])
+            if other is not None and other.ndim == 1:
+                # Constant vector (e.g. a bias after MatMul): use a row view for 2D inputs
+                row = other.reshape(1, -1)
+                fn = lambda slots, out: ufunc(slots[x], row if slots[x].ndim == 2 else other,
+                                              out=slots[x] if in_place else out)
+            else:
+                fn = lambda slots, out: ufunc(slots[x], slots[y], out=slots[x] if in_place else out)
+        elif op == 'Relu':
+            zero = np.float32(0.0)
+            fn = lambda slots, out: np.maximum(slots[x], zero, out=slots[x] if in_place else out)
+        elif op == 'LeakyRelu':
+            slope = np.float32(_attr(node, 'alpha', 0.01))
+
+            def fn(slots, out):
+                if in_place:
+                    return np.maximum(slots[x], slots[x] * slope, out=slots[x])
+                out = np.multiply(slots[x], slope, out=out)
+                return np.maximum(slots[x], out, out=out)
+        elif op == 'Sigmoid':
+            def fn(slots, out):
+                out = np.negative(slots[x], out=slots[x] if in_place else out)
+                np.exp(out, out=out)
+                out += 1.0
+                return np.reciprocal(out, out=out)
+        elif op == 'Tanh':
+            fn = lambda slots, out: np.tanh(slots[x], out=slots[x] if in_place else out)
+        elif op == 'Identity':
+            fn = lambda slots, out: slots[x]
+        elif op == 'Flatten':
+            axis = _attr(node, 'axis', 1)
+            fn = lambda slots, out: slots[x].reshape(int(np.prod(slots[x].shape[:axis])), -1)
+        else:  # Reshape
+            allow_zero = _attr(node, 'allowzero', 0)
+
+            def fn(slots, out):
+                shape = [int(s) for s in slots[y]]
+                if not allow_zero:
+                    shape = [slots[x].shape[i] if s == 0 else s for i, s in enumerate(shape)]
+                return slots[x].reshape(shape)
+
+        # View-producing and in-place ops never get a buffer of their own
+        buffered = op not in ('Identity', 'Flatten', 'Reshape') and not in_place
+        if buffered or in_place:
+            self._owned.add(output)
+        self._steps.append((fn, self._slot(output), buffered))
+
+    @staticmethod
+    def _generic_gemm(x: int, y: int, z: Optional[int], weight: Optional[np.ndarray], bias: Optional[np.ndarray],
+                      alpha: np.float32, beta: np.float32, trans_a: int, trans_b: int) -> Callable:
+        """Gemm step for runtime weights, transposed inputs or scaled outputs."""
+        def fn(slots, out):
+            a = slots[x].T if trans_a else slots[x]
+            if weight is not None:
+                out = _matmul(a, weight, out)
+            else:
+                out = _matmul(a, slots[y].T if trans_b else slots[y], out)
+            if alpha != 1.0:
+                out *= alpha
+            if bias is not None:
+                out += bias
+            elif z is not None:
+                out += beta * slots[z]
+            return out
+        return fn
+
+    def get_inputs(self) -> List[_Input]:
+        """Graph inputs with name, shape and type, as in onnxruntime."""
+        return list(self._inputs)
+
+    def run(self, output_names: Optional[Sequence[str]], input_feed: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        """
+        Execute the graph.
+
+        Args:
+            output_names: Names of outputs to return (all graph outputs if None)
+            input_feed: Mapping from input name to array
+
+        Returns:
+            List[np.ndarray]: Requested outputs (copies, safe to keep across calls)
+        """
+        with self._lock:
+            return self._run(output_names, input_feed)
+
+    def _run(self, output_names: Optional[Sequence[str]], input_feed: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        slots = self._slots
+        key = []
+        for name, value in input_feed.items():
+            if not isinstance(value, np.ndarray) or value.dtype != np.float32:
+                value = np.asarray(value, dtype=np.float32)
+            slots[self._slot_index[name]] = value
+            key.append(value.shape)
+        key = tuple(key)
+        plan = self._plans.get(key)
+        if plan is None:
+            # First run for these input shapes: let NumPy allocate, then keep the results as buffers
+            plan = []
+            for fn, out, buffered in self._steps:
+                slots[out] = result = fn(slots, None)
+                plan.append((fn, out, result if buffered else None))
+            self._plans[key] = plan
+            while len(self._plans) > self.MAX_CACHED_SHAPES:
+                self._plans.popitem(last=False)  # Drop the least recently used shape
+        else:
+            self._plans.move_to_end(key)
+            for fn, out, buffer in plan:
+                slots[out] = fn(slots, buffer)
+        if output_names is None:
+            return [slots[i].copy() for i in self._output_slots]
+        return [slots[self._slot_index[name]].copy() for name in output_names]
+
+    def weight_nbytes(self) -> int:
+        """Storage size of the (possibly quantized) 2D weights in bytes."""
+        return sum(w.nbytes for w in self.quantized.values())
+
+
+def load_session(model_path: str, backend: str = 'onnxruntime', config: Optional[Any] = None,
+                 weight_dtype: str = 'float32') -> Any:
+    """
+    Load an inference session with the requested backend.
+
+    Args:
+        model_path: Path to the ONNX model
+        backend: 'onnxruntime' or 'numpy'
+        config: SessionConfig used for onnxruntime (directly or as the fallback)
+        weight_dtype: Weight precision for the NumPy backend
+
+    Returns:
+        NumpySession or onnxruntime.InferenceSession
+
+    Note:
+        The NumPy backend falls back to onnxruntime when the graph contains unsupported
+        operators or the 'onnx' package is missing.
+    """
+    from .session import create_session
+    if backend == 'numpy':
+        try:
+            return NumpySession(model_path, weight_dtype=weight_dtype)
+        except (UnsupportedModelError, ImportError) as e:
+            logger.warning(f"Falling back to onnxruntime: {e}")
+    elif backend != 'onnxruntime':
+        raise ValueError(f"Invalid inference backend: {backend}")
+    return create_session(model_path, config)
+
+
+def parity_report(session: Any, reference: Any, inputs: Optional[np.ndarray] = None,
+                  num_samples: int = 1000, scale: float = 2000.0, seed: int = 0) -> Dict[str, float]:
+    """
+    Compare a session's outputs against a reference session (typically onnxruntime).
+
+    Args:
+        session: Session under test, e.g. NumpySession
+        reference: Reference session, e.g. onnxruntime.InferenceSession on the same model
+        inputs: Inputs of shape (N, num_features); random normal inputs if None
+        num_samples: Number of random samples when inputs is None
+        scale: Standard deviation of random inputs (calibrated tensile deltas are in the thousands)
+        seed: Random seed for generated inputs
+
+    Returns:
+        Dict with 'max_abs_error', 'mean_abs_error', 'num_samples' and the mean per-call
+        latency of both sessions in microseconds ('latency_us', 'reference_latency_us')
+    """
+    name = reference.get_inputs()[0].name
+    if inputs is None:
+        num_features = reference.get_inputs()[0].shape[-1]
+        inputs = np.random.default_rng(seed).normal(0.0, scale, size=(num_samples, num_features))
+    inputs = np.asarray(inputs, dtype=np.float32)
+    errors = []
+    elapsed = 0.0
+    reference_elapsed = 0.0
+    for row in inputs:
+        feed = {name: row.reshape(1, -1)}
+        t0 = time.perf_counter()
+        output = session.run(None, feed)[0]
+        t1 = time.perf_counter()
+        expected = reference.run(None, feed)[0]
+        reference_elapsed += time.perf_counter() - t1
+        elapsed += t1 - t0
+        errors.append(np.abs(output - expected).max())
+    errors = np.asarray(errors)
+    return {
+        'max_abs_error': float(errors.max()),
+        'mean_abs_error': float(errors.mean()),
+        'num_samples': int(len(errors)),
+        'latency_us': elapsed / len(errors) * 1e6,
+        'reference_latency_us': reference_elapsed / len(errors) * 1e6,
+    }
@@ -0,0 +1,251 @@
+import threading
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Union
+
+
+@dataclass
+class GestureEvent:
+    """
+    A detected gesture.
+
+    Attributes:
+        name: Name of the matched template
+        score: Match distance (lower is better), comparable to the template threshold
+        timestamp: Time of the frame that completed the match
+    """
+    name: str
+    score: float
+    timestamp: float
+
+
+GestureCallback = Callable[[GestureEvent], None]
+
+
+class GestureDetector:
+    """
+    Streaming template matcher over a rolling window of feature vectors (angles and/or tensile).
+
+    Every registered template is scored on every frame, all at once:
+
+    - 'dtw': subsequence DTW computed incrementally (SPRING). Each template keeps one cost
+      column; a new frame updates the columns of all templates with a few array operations
+      over a (templates, max_length) grid. The within-column recursion is solved as a
+      cumulative sum plus a running minimum, so there is no Python loop over template
+      positions. Templates may have different lengths and match at varying speed.
+    - 'euclidean': mean squared distance between the last `window` frames and templates
+      resampled to `window` frames, as one vectorized reduction.
+
+    Per-frame cost is O(templates * max_length * features) with no dependence on the
+    history length. Scores are mean squared distances per frame, after dividing features
+    by `scale`, so thresholds do not depend on template length.
+
+    A template fires when its score drops below its threshold, at most once per
+    `refractory` seconds. In 'dtw' mode its cost column is then reset, so the next
+    detection needs a new occurrence of the gesture.
+    """
+    METHODS = ('dtw', 'euclidean')
+
+    def __init__(self, num_features: int = 22, window: int = 30, method: str = 'dtw',
+                 scale: Union[float, Sequence[float]] = 1.0, refractory: float = 0.5):
+        """
+        Args:
+            num_features: Length of the feature vector passed to `update`
+            window: Frames kept in the rolling window (and template length in 'euclidean' mode)
+            method: 'dtw' or 'euclidean'
+            scale: Per-feature divisor (scalar or num_features values) before comparing
+            refractory: Default minimum time in seconds between two detections of a template
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Invalid method: {method}, expected one of {self.METHODS}")
+        self.num_features = num_features
+        self.window = window
+        self.method = method
+        self.refractory = refractory
+        self._inv_scale = 1.0 / np.broadcast_to(np.asarray(scale, dtype=np.float64), (num_features,))
+        self._callbacks: List[GestureCallback] = []
+        self._lock = threading.Lock()
+
+        self._names: List[str] = []
+        self._sources: List[np.ndarray] = []
+        self._thresholds = np.zeros(0)
+        self._refractory = np.zeros(0)
+        self._template_callbacks: List[Optional[GestureCallback]] = []
+        self._build()
+
+        self._buffer = np.zeros((window, num_features))
+        self._head = 0
+        self._count = 0
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def register(self, name: str, template: np.ndarray, threshold: float,
+                 callback: Optional[GestureCallback] = None, refractory: Optional[float] = None) -> None:
+        """
+        Add or replace a template.
+
+        Args:
+            name: Unique gesture name
+            template: Feature sequence of shape (length, num_features); a single pose (num_features,)
+                matches holding that pose
+            threshold: Score below which the gesture fires
+            callback: Called with the GestureEvent in addition to detector-wide callbacks
+            refractory: Minimum time between detections of this template (default: detector setting)
+        """
+        template = np.atleast_2d(np.asarray(template, dtype=np.float64))
+        if template.shape[1] != self.num_features or len(template) == 0:
+            raise ValueError(f"Template must have shape (length, {self.num_features}), got {template.shape}")
+        with self._lock:
+            if name in self._names:
+                self._remove(name)
+            self._names.append(name)
+            self._sources.append(template * self._inv_scale)
+            self._thresholds = np.append(self._thresholds, threshold)
+            self._refractory = np.append(self._refractory, self.refractory if refractory is None else refractory)
+            self._template_callbacks.append(callback)
+            self._build()
+
+    def unregister(self, name: str) -> None:
+        """Remove a template."""
+        with self._lock:
+            self._remove(name)
+            self._build()
+
+    def _remove(self, name: str) -> None:
+        i = self._names.index(name)
+        del self._names[i], self._sources[i], self._template_callbacks[i]
+        self._thresholds = np.delete(self._thresholds, i)
+        self._refractory = np.delete(self._refractory, i)
+
+    def _build(self) -> None:
+        """Pack templates into padded arrays for vectorized scoring."""
+        k = len(self._sources)
+        if self.method == 'euclidean':
+            self._templates = np.zeros((k, self.window, self.num_features))
+            for i, src in enumerate(self._sources):
+                # Resample to the window length by linear interpolation
+                pos = np.linspace(0, len(src) - 1, self.window)
+                lo = np.floor(pos).astype(int)
+                hi = np.minimum(lo + 1, len(src) - 1)
+                w = (pos - lo)[:, None]
+                self._templates[i] = src[lo] * (1 - w) + src[hi] * w
+            self._lengths = np.full(k, self.window)
+        else:
+            max_len = max((len(src) for src in self._sources), default=1)
+            self._templates = np.zeros((k, max_len, self.num_features))
+            for i, src in enumerate(self._sources):
+                self._templates[i, :len(src)] = src
+            self._lengths = np.array([len(src) for src in self._sources], dtype=np.int64)
+        if self.method == 'euclidean':
+            self._flat_templates = self._templates.reshape(k, self.window * self.num_features)
+        else:
+            self._flat_templates = self._templates.reshape(-1, self.num_features)
+        self._template_norms = np.einsum('ij,ij->i', self._flat_templates, self._flat_templates)
+        self._rows = np.arange(k)
+        self._cols = np.arange(self._templates.shape[1])
+        self._cost = np.full((k, self._templates.shape[1]), np.inf)
+        self._path = np.ones((k, self._templates.shape[1]))
+        self._last_fired = np.full(k, -np.inf)
+
+    def add_callback(self, callback: GestureCallback) -> None:
+        """Call `callback(event)` for every detection."""
+        self._callbacks.append(callback)
+
+    def reset(self) -> None:
+        """Clear the rolling window and all partial matches."""
+        with self._lock:
+            self._count = 0
+            self._head = 0
+            self._cost.fill(np.inf)
+            self._path.fill(1.0)
+
+    def window_values(self) -> np.ndarray:
+        """The rolling window, oldest frame first, in unscaled feature units."""
+        with self._lock:
+            idx = (self._head - self._count + np.arange(self._count)) % self.window
+            return self._buffer[idx] / self._inv_scale
+
+    def update(self, features: np.ndarray, timestamp: Optional[float] = None) -> List[GestureEvent]:
+        """
+        Add a frame and score all templates.
+
+        Args:
+            features: Feature vector of length num_features (e.g. joint angles)
+            timestamp: Frame time in seconds (default: time.perf_counter())
+
+        Returns:
+            List[GestureEvent]: Gestures detected on this frame (callbacks have been called)
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        x = np.asarray(features, dtype=np.float64) * self._inv_scale
+        with self._lock:
+            self._buffer[self._head] = x
+            self._head = (self._head + 1) % self.window
+            self._count = min(self._count + 1, self.window)
+            if not self._names:
+                return []
+            if self.method == 'dtw':
+                scores = self._update_dtw(x)
+            else:
+                scores = self._score_euclidean()
+            fired = np.flatnonzero((scores <= self._thresholds) & (timestamp - self._last_fired >= self._refractory))
+            events = []
+            for i in fired:
+                self._last_fired[i] = timestamp
+                if self.method == 'dtw':
+                    self._cost[i] = np.inf
+                events.append((GestureEvent(self._names[i], float(scores[i]), timestamp), self._template_callbacks[i]))
+        for event, callback in events:
+            if callback is not None:
+                callback(event)
+            for cb in self._callbacks:
+                cb(event)
+        return [event for event, _ in events]
+
+    def _update_dtw(self, x: np.ndarray) -> np.ndarray:
+        """
+        Advance the open-begin DTW columns of all templates by one frame.
+
+        With d[j] the frame-to-template distance, c[j] = min(D_old[j], D_old[j-1]) and
+        S the cumulative sum of d, the column recursion D[j] = d[j] + min(D[j-1], c[j])
+        unrolls to D[j] = S[j] + min_{i<=j}(c[i] - S[i-1]), a running minimum. The path
+        length of each cell follows from the position of that minimum.
+        """
+        # |t - x|^2 = |t|^2 - 2 t.x + |x|^2, one matrix-vector product for all templates
+        d = self._flat_templates @ (-2.0 * x)
+        d += self._template_norms + x @ x
+        d = d.reshape(self._cost.shape)
+        old, old_path = self._cost, self._path
+        c = np.empty_like(old)
+        c_path = np.empty_like(old_path)
+        c[:, 0] = 0.0  # Open begin: a match may start at any frame
+        c_path[:, 0] = 0.0
+        diagonal = old[:, :-1] < old[:, 1:]
+        np.minimum(old[:, 1:], old[:, :-1], out=c[:, 1:])
+        c_path[:, 1:] = np.where(diagonal, old_path[:, :-1], old_path[:, 1:])
+
+        s = np.cumsum(d, axis=1)
+        entry = c
+        entry[:, 1:] -= s[:, :-1]
+        best = np.minimum.accumulate(entry, axis=1)
+        self._cost = s + best
+        # Latest position at which the running minimum was set
+        cols = self._cols
+        start = np.maximum.accumulate(np.where(entry <= best, cols, 0), axis=1)
+        self._path = c_path[self._rows[:, None], start] + (cols - start + 1)
+
+        ends = self._lengths - 1
+        return self._cost[self._rows, ends] / self._path[self._rows, ends]
+
+    def _score_euclidean(self) -> np.ndarray:
+        """Mean squared distance between the full window and every template."""
+        if self._count < self.window:
+            return np.full(len(self._names), np.inf)
+        recent = np.roll(self._buffer, -self._head, axis=0).ravel()
+        d = self._flat_templates @ (-2.0 * recent)
+        d += self._template_norms + recent @ recent
+        return d / self.window
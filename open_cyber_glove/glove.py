@@ -3,15 +3,14 @@ import struct
 import zlib
 import time
 import numpy as np
-from typing import Optional, Any, Tuple
+from typing import Optional, Any, List, Tuple, Union
 from dataclasses import dataclass
 import threading
 import queue
-from tqdm import tqdm
 import logging
+from .linear import LinearModel, calibration_range
+from .cache import InferenceCache
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -34,6 +33,103 @@ class GloveSensorData:
     temperature: float
     timestamp: int
 
+PACKET_DTYPE = np.dtype({
+    'names': ['tensile', 'acc', 'gyro', 'mag', 'temperature', 'timestamp', 'crc'],
+    'formats': [('<i4', (19,)), ('<f4', (3,)), ('<f4', (3,)), ('<f4', (3,)), '<f4', '<u4', '<u4'],
+    'offsets': [0, 76, 88, 100, 112, 116, 128],
+    'itemsize': 132,
+})
+"""Structured dtype of one raw data packet, for decoding recordings with np.frombuffer / np.memmap."""
+
+class GloveFrame:
+    """
+    Lightweight, lazily decoded view over one raw data packet.
+    
+    Wraps the 132-byte packet without copying and decodes fields on access as read-only
+    NumPy views into the packet bytes, so reading a frame allocates no Python tuples.
+    Provides the same attributes as GloveSensorData (`tensile_data`, `acc_data`, ...)
+    in addition to the short array names.
+    
+    Attributes:
+        raw: The raw packet bytes
+    """
+    __slots__ = ('raw', '_tensile')
+
+    def __init__(self, raw: bytes):
+        if len(raw) < PACKET_DTYPE.itemsize:
+            raise ValueError(f"Failed to parse raw data: expected {PACKET_DTYPE.itemsize} bytes, got {len(raw)}")
+        self.raw = raw
+        self._tensile = None
+
+    @property
+    def record(self) -> np.void:
+        """The whole packet as a structured PACKET_DTYPE record."""
+        return np.frombuffer(self.raw, dtype=PACKET_DTYPE, count=1)[0]
+
+    @property
+    def tensile(self) -> np.ndarray:
+        """Raw tensile values of the 19 sensors, int32 view (decoded once)."""
+        if self._tensile is None:
+            self._tensile = np.frombuffer(self.raw, dtype='<i4', count=Glove.NUM_TENSILE_SENSORS, offset=Glove.TENSILE_DATA_OFFSET)
+        return self._tensile
+
+    @property
+    def acc(self) -> np.ndarray:
+        """Accelerometer (x, y, z) in m/s², float32 view."""
+        return np.frombuffer(self.raw, dtype='<f4', count=Glove.NUM_IMU_AXES, offset=Glove.ACC_DATA_OFFSET)
+
+    @property
+    def gyro(self) -> np.ndarray:
+        """Gyroscope (x, y, z) in rad/s, float32 view."""
+        return np.frombuffer(self.raw, dtype='<f4', count=Glove.NUM_IMU_AXES, offset=Glove.GYRO_DATA_OFFSET)
+
+    @property
+    def mag(self) -> np.ndarray:
+        """Magnetometer (x, y, z) in μT, float32 view."""
+        return np.frombuffer(self.raw, dtype='<f4', count=Glove.NUM_IMU_AXES, offset=Glove.MAG_DATA_OFFSET)
+
+    @property
+    def temperature(self) -> float:
+        """Temperature in Celsius."""
+        return struct.unpack_from('<f', self.raw, Glove.TEMP_DATA_OFFSET)[0]
+
+    @property
+    def timestamp(self) -> int:
+        """Microsecond device timestamp."""
+        return struct.unpack_from('<I', self.raw, Glove.TIMESTAMP_OFFSET)[0]
+
+    # GloveSensorData-compatible names
+    tensile_data = tensile
+    acc_data = acc
+    gyro_data = gyro
+    mag_data = mag
+
+    def to_sensor_data(self) -> GloveSensorData:
+        """Convert to a GloveSensorData with plain Python tuples."""
+        return GloveSensorData(
+            tensile_data=tuple(int(v) for v in self.tensile),
+            acc_data=tuple(float(v) for v in self.acc),
+            gyro_data=tuple(float(v) for v in self.gyro),
+            mag_data=tuple(float(v) for v in self.mag),
+            temperature=self.temperature,
+            timestamp=self.timestamp
+        )
+
+    def __repr__(self) -> str:
+        return f"GloveFrame(timestamp={self.timestamp}, tensile={self.tensile.tolist()})"
+
+
+def _snapshot(values: Any) -> Any:
+    """Copy of calibration values (list or array) for change detection."""
+    return values.copy() if isinstance(values, np.ndarray) else list(values)
+
+
+def _same_values(current: Any, snapshot: Any) -> bool:
+    """True if calibration values still equal a `_snapshot`; cheap for the usual lists."""
+    if isinstance(current, np.ndarray):
+        return isinstance(snapshot, np.ndarray) and current.shape == snapshot.shape and bool((current == snapshot).all())
+    return not isinstance(snapshot, np.ndarray) and list(current) == snapshot
+
 class Glove:
     """
     Abstract base class for cyber glove device management.
@@ -65,6 +161,8 @@ class Glove:
     SENSOR_MAX_VALUE = 8192 * 2
     DEFAULT_BAUDRATE = 1000000
     SENSOR_ORDER = [3, 1, 0, 4, 5, 6, 8, 9, 10, 12, 13, 14, 16, 17, 18, 2, 7, 11, 15]
+    IO_MODE_POLL = 'poll'
+    IO_MODE_BLOCKING = 'blocking'
 
     def __init__(self, hand_type: str):
         """
@@ -79,28 +177,48 @@ class Glove:
         """
         self.hand_type = hand_type
         self.serial_port: Optional[serial.Serial] = None
+        self.io_mode = self.IO_MODE_POLL
         self.min_val = [self.SENSOR_MAX_VALUE] * self.NUM_TENSILE_SENSORS
         self.max_val = [0] * self.NUM_TENSILE_SENSORS
         self.avg_val = [0.0] * self.NUM_TENSILE_SENSORS
         self.is_calibrated = False
+        self.linear_model: Optional[LinearModel] = None
+        self._fused_linear: Optional[Tuple[LinearModel, tuple, LinearModel]] = None
+        self.inference_cache: Optional[InferenceCache] = None
         self._data_queue = queue.Queue(maxsize=1200)  # 10 seconds of data at 120 Hz
         self._reader_thread = None
         self._reader_running = threading.Event()
         self._queue_lock = threading.Lock()
         self._buffer = bytearray()
+        self._receive_time = 0.0
+        self._record_file = None
+        self._record_lock = threading.Lock()
+        self.last_receive_time: Optional[float] = None
+        self.last_packets: List[bytes] = []
 
-    def connect(self, port: str, baudrate: int = DEFAULT_BAUDRATE) -> None:
+    def connect(self, port: str, baudrate: int = DEFAULT_BAUDRATE, io_mode: str = IO_MODE_POLL,
+                read_timeout: float = 0.1, inter_byte_timeout: float = 0.002) -> None:
         """
         Establish serial connection to the glove device.
         
         Args:
             port: Serial port identifier (e.g., 'COM3' on Windows, '/dev/ttyUSB0' on Linux)
             baudrate: Communication baud rate (default: 1,000,000 bps)
+            io_mode: Reader I/O strategy, 'poll' (in_waiting polling with 1 ms sleeps) or
+                'blocking' (blocking reads sized to complete the next packet)
+            read_timeout: Read timeout in 'blocking' mode, bounds how long shutdown can take
+            inter_byte_timeout: Inter-byte timeout in 'blocking' mode (honoured by backends that support it)
             
         Note:
-            Opens a serial connection with 1-second timeout for read operations.
+            In 'poll' mode opens a serial connection with 1-second timeout for read operations.
         """
-        self.serial_port = serial.Serial(port, baudrate, timeout=1)
+        if io_mode not in (self.IO_MODE_POLL, self.IO_MODE_BLOCKING):
+            raise ValueError(f"Invalid I/O mode: {io_mode}")
+        self.io_mode = io_mode
+        if io_mode == self.IO_MODE_BLOCKING:
+            self.serial_port = serial.Serial(port, baudrate, timeout=read_timeout, inter_byte_timeout=inter_byte_timeout)
+        else:
+            self.serial_port = serial.Serial(port, baudrate, timeout=1)
 
     def start_reader(self):
         """
@@ -113,7 +231,8 @@ class Glove:
         if self._reader_thread is not None and self._reader_thread.is_alive():
             return
         self._reader_running.set()
-        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        target = self._blocking_reader_loop if self.io_mode == self.IO_MODE_BLOCKING else self._reader_loop
+        self._reader_thread = threading.Thread(target=target, daemon=True)
         self._reader_thread.start()
 
     def stop_reader(self):
@@ -121,10 +240,16 @@ class Glove:
         Stop the background data reading thread.
         
         Signals the reader thread to stop and waits for it to complete.
-        Cleans up the thread reference after termination.
+        Cleans up the thread reference after termination. In 'blocking' mode a
+        pending read is cancelled so the thread exits immediately.
         """
         self._reader_running.clear()
         if self._reader_thread is not None:
+            if self.io_mode == self.IO_MODE_BLOCKING and hasattr(self.serial_port, 'cancel_read'):
+                try:
+                    self.serial_port.cancel_read()
+                except Exception as e:
+                    logger.debug(f"cancel_read failed: {e}")
             self._reader_thread.join()
             self._reader_thread = None
 
@@ -147,37 +272,10 @@ class Glove:
                 # Read all available data from serial and add to buffer
                 if self.serial_port and self.serial_port.in_waiting > 0:
                     data_in = self.serial_port.read(self.serial_port.in_waiting)
+                    self._receive_time = time.perf_counter()
                     self._buffer.extend(data_in)
 
-                # Process buffer to find packets
-                while len(self._buffer) >= self.PACKET_SIZE:
-                    found_packet = False
-                    for i in range(len(self._buffer) - self.PACKET_SIZE + 1):
-                        possible_packet = self._buffer[i:i + self.PACKET_SIZE]
-                        if self._is_valid_data(possible_packet):
-                            try:
-                                # Additional validation for tensile data range
-                                tensile_data = struct.unpack(f'<{self.NUM_TENSILE_SENSORS}i', possible_packet[self.TENSILE_DATA_OFFSET:self.TENSILE_DATA_OFFSET + self.TENSILE_DATA_SIZE])
-                                if not all(0 <= val <= self.SENSOR_MAX_VALUE for val in tensile_data):
-                                    continue  # Skip packet with invalid sensor values
-
-                                with self._queue_lock:
-                                    if self._data_queue.full():
-                                        self._data_queue.get_nowait()  # Drop oldest
-                                    self._data_queue.put_nowait(bytes(possible_packet))
-                                
-                                # Remove processed packet and any preceding bytes from buffer
-                                self._buffer = self._buffer[i + self.PACKET_SIZE:]
-                                found_packet = True
-                                break  # Restart search from the beginning of the modified buffer
-                            except struct.error:
-                                continue # Could not unpack, so not a valid packet.
-
-                    if not found_packet:
-                        # No valid packet found, discard bytes that cannot form a full packet
-                        # Keep the last part of the buffer that might be an incomplete packet
-                        self._buffer = self._buffer[-(self.PACKET_SIZE - 1):]
-                        break # Break from the inner while loop to wait for more data
+                self._extract_packets()
 
                 # If no data is available, sleep briefly to avoid busy-waiting
                 if not (self.serial_port and self.serial_port.in_waiting > 0):
@@ -187,33 +285,152 @@ class Glove:
                 logger.error(f"Error in reader loop: {e}")
                 time.sleep(0.01)
 
-    def get_raw_data(self) -> bytes:
+    def _blocking_reader_loop(self):
+        """
+        Reader loop for 'blocking' I/O mode.
+        
+        Each iteration performs one blocking read into a preallocated buffer, sized to
+        complete the next packet, so the thread wakes up about once per packet instead
+        of polling `in_waiting`. Reads return after `read_timeout` at the latest, and
+        `stop_reader` cancels a pending read, so shutdown is prompt.
+        """
+        read_buffer = bytearray(self.PACKET_SIZE)
+        view = memoryview(read_buffer)
+        while self._reader_running.is_set():
+            try:
+                if self.serial_port is None:
+                    time.sleep(0.01)
+                    continue
+                need = self.PACKET_SIZE - len(self._buffer) if len(self._buffer) < self.PACKET_SIZE else self.PACKET_SIZE
+                n = self.serial_port.readinto(view[:need])
+                if n:
+                    self._receive_time = time.perf_counter()
+                    self._buffer += view[:n]
+                    self._extract_packets()
+            except Exception as e:
+                if self._reader_running.is_set():
+                    logger.error(f"Error in reader loop: {e}")
+                    time.sleep(0.01)
+
+    def _extract_packets(self):
+        """Move every complete, valid packet from the byte buffer into the data queue."""
+        while len(self._buffer) >= self.PACKET_SIZE:
+            found_packet = False
+            for i in range(len(self._buffer) - self.PACKET_SIZE + 1):
+                possible_packet = self._buffer[i:i + self.PACKET_SIZE]
+                if self._is_valid_data(possible_packet):
+                    try:
+                        # Additional validation for tensile data range
+                        tensile_data = np.frombuffer(possible_packet, dtype='<i4', count=self.NUM_TENSILE_SENSORS, offset=self.TENSILE_DATA_OFFSET)
+                        if tensile_data.min() < 0 or tensile_data.max() > self.SENSOR_MAX_VALUE:
+                            continue  # Skip packet with invalid sensor values
+
+                        with self._queue_lock:
+                            if self._data_queue.full():
+                                self._data_queue.get_nowait()  # Drop oldest
+                            self._data_queue.put_nowait((self._receive_time, bytes(possible_packet)))
+                        if self._record_file is not None:
+                            with self._record_lock:
+                                if self._record_file is not None:
+                                    self._record_file.write(possible_packet)
+
+                        # Remove processed packet and any preceding bytes from buffer
+                        del self._buffer[:i + self.PACKET_SIZE]
+                        found_packet = True
+                        break  # Restart search from the beginning of the modified buffer
+                    except ValueError:
+                        continue # Could not decode, so not a valid packet.
+
+            if not found_packet:
+                # No valid packet found, discard bytes that cannot form a full packet
+                # Keep the last part of the buffer that might be an incomplete packet
+                del self._buffer[:-(self.PACKET_SIZE - 1)]
+                break # Break from the inner while loop to wait for more data
+
+    def start_recording(self, path: str) -> None:
+        """
+        Append every valid packet received by the reader to a raw recording file.
+        
+        Args:
+            path: Output file; packets are stored back to back (132 bytes each) and can be
+                read with `np.fromfile(path, dtype=PACKET_DTYPE)` or `np.memmap`
+        """
+        with self._record_lock:
+            if self._record_file is not None:
+                self._record_file.close()
+            self._record_file = open(path, 'ab')
+
+    def stop_recording(self) -> None:
+        """Stop recording and close the recording file."""
+        with self._record_lock:
+            if self._record_file is not None:
+                self._record_file.close()
+                self._record_file = None
+
+    def save_calibration(self, path: str) -> None:
+        """Save min/max/avg calibration values to a .npz file."""
+        np.savez(path, min_val=np.asarray(self.min_val), max_val=np.asarray(self.max_val),
+                 avg_val=np.asarray(self.avg_val), hand_type=self.hand_type)
+
+    def load_calibration(self, path: str) -> None:
+        """Load calibration values saved by `save_calibration`."""
+        try:
+            with np.load(path) as data:
+                self.min_val = data['min_val'].tolist()
+                self.max_val = data['max_val'].tolist()
+                self.avg_val = data['avg_val'].astype(np.float64)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Calibration file not found: {path}")
+        except KeyError as e:
+            raise RuntimeError(f"Error loading calibration from {path}: missing {e}")
+        self.is_calibrated = True
+        self._fused_linear = None
+        if self.inference_cache is not None:
+            self.inference_cache.clear()
+
+    def get_raw_data(self, timeout: Optional[float] = None) -> bytes:
         """
         Retrieve the most recent raw data packet from the queue.
         
+        Args:
+            timeout: Longest time to wait for a packet in seconds (default: no limit)
+        
         Returns:
             The most recent complete data packet as bytes
             
         Raises:
-            RuntimeError: If the serial port is not connected
+            RuntimeError: If the serial port is not connected, or the reader is stopped
+                while no packet is queued
+            TimeoutError: If no packet arrived within `timeout`
             
         Note:
             This method blocks until at least one data packet is available.
-            It drains all packets from the queue and returns only the most recent one.
+            It drains all packets from the queue and returns only the most recent one;
+            every drained packet, oldest first, is kept in `last_packets` for consumers
+            that must see the full packet stream (e.g. the orientation filter). The host time
+            (time.perf_counter) at which that packet was read from the serial port is
+            stored in `last_receive_time`.
         """
         if self.serial_port is None:
             raise RuntimeError("Serial port not connected.")
-        # Wait for at least one data packet
-        while self._data_queue.empty():
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            # Drain all but the last; another consumer may have emptied the queue, then wait
+            with self._queue_lock:
+                drained = []
+                while not self._data_queue.empty():
+                    drained.append(self._data_queue.get_nowait())
+                if drained:
+                    self.last_receive_time, packet = drained[-1]
+                    self.last_packets = [raw for _, raw in drained]
+                    return packet
+            if not self._reader_running.is_set():
+                raise RuntimeError("Reader not running.")
+            if deadline is not None and time.perf_counter() >= deadline:
+                raise TimeoutError(f"No data received from {self.hand_type} glove within {timeout} s")
             time.sleep(0.001)
-        # Drain all but the last
-        with self._queue_lock:
-            last = None
-            while not self._data_queue.empty():
-                last = self._data_queue.get()
-        return last
-
-    def parse_raw_data(self, raw: bytes) -> GloveSensorData:
+
+    def parse_raw_data(self, raw: bytes) -> GloveFrame:
         """
         Convert raw binary data packet into structured sensor data.
         
@@ -221,7 +438,7 @@ class Glove:
             raw: Raw binary data packet from the glove
             
         Returns:
-            GloveSensorData object containing parsed sensor readings
+            GloveFrame wrapping the packet; fields are decoded lazily on access
             
         Raises:
             ValueError: If the raw data cannot be parsed due to format issues
@@ -230,31 +447,16 @@ class Glove:
             Parses tensile sensors, IMU data (accelerometer, gyroscope, magnetometer),
             temperature, and timestamp according to the defined packet structure.
         """
-        try:
-            tensile_data = struct.unpack(f'<{self.NUM_TENSILE_SENSORS}i', raw[self.TENSILE_DATA_OFFSET:self.TENSILE_DATA_OFFSET + self.TENSILE_DATA_SIZE])
-            acc_data = struct.unpack(f'<{self.NUM_IMU_AXES}f', raw[self.ACC_DATA_OFFSET:self.ACC_DATA_OFFSET + self.ACC_DATA_SIZE])
-            gyro_data = struct.unpack(f'<{self.NUM_IMU_AXES}f', raw[self.GYRO_DATA_OFFSET:self.GYRO_DATA_OFFSET + self.GYRO_DATA_SIZE])
-            mag_data = struct.unpack(f'<{self.NUM_IMU_AXES}f', raw[self.MAG_DATA_OFFSET:self.MAG_DATA_OFFSET + self.MAG_DATA_SIZE])
-            temperature = struct.unpack('<f', raw[self.TEMP_DATA_OFFSET:self.TEMP_DATA_OFFSET + self.TEMP_DATA_SIZE])[0]
-            timestamp = struct.unpack('<I', raw[self.TIMESTAMP_OFFSET:self.TIMESTAMP_OFFSET + self.TIMESTAMP_SIZE])[0]
-            return GloveSensorData(
-                tensile_data=tensile_data,
-                acc_data=acc_data,
-                gyro_data=gyro_data,
-                mag_data=mag_data,
-                temperature=temperature,
-                timestamp=timestamp
-            )
-        except struct.error as e:
-            raise ValueError(f"Failed to parse raw data: {e}")
+        return GloveFrame(raw)
         
-    def get_data(self) -> GloveSensorData:
-        """Get the most recent parsed sensor data from the glove."""
-        raw_data = self.get_raw_data()
+    def get_data(self, timeout: Optional[float] = None) -> GloveFrame:
+        """Get the most recent parsed sensor data from the glove (see `get_raw_data`)."""
+        raw_data = self.get_raw_data(timeout)
         return self.parse_raw_data(raw_data)
 
     def calibrate(self, samples_min_max: int = 1000, samples_avg: int = 1000) -> None:
         """Calibrate the glove (min/max and static average)."""
+        from tqdm import tqdm
         if self.serial_port is None:
             raise RuntimeError("Serial port not connected.")
         # Min/max calibration
@@ -262,19 +464,19 @@ class Glove:
         self.max_val = [0] * self.NUM_TENSILE_SENSORS
         print(f"[{self.hand_type}] Calibration Pose 1: Make a fist and open your hand, multiple times. Press Enter to continue...")
         input()
+        min_val = np.array(self.min_val, dtype=np.int64)
+        max_val = np.array(self.max_val, dtype=np.int64)
         for i in tqdm(range(samples_min_max), desc=f"[{self.hand_type}] min/max calibration"):
             data = self.get_data()
-            for j in range(self.NUM_TENSILE_SENSORS):
-                v = data.tensile_data[j]
-                if v < self.min_val[j]:
-                    self.min_val[j] = v
-                if v > self.max_val[j]:
-                    self.max_val[j] = v
+            np.minimum(min_val, data.tensile_data, out=min_val)
+            np.maximum(max_val, data.tensile_data, out=max_val)
+        self.min_val = min_val.tolist()
+        self.max_val = max_val.tolist()
         print()
         # Static average calibration
         print(f"[{self.hand_type}] Calibration Pose 2: Hold your hand static, four fingers forward and thumb out 45°. Press Enter to continue...")
         input()
-        sums = [0] * self.NUM_TENSILE_SENSORS
+        sums = np.zeros(self.NUM_TENSILE_SENSORS, dtype=np.int64)
         last = None
         collected = 0
         with tqdm(total=samples_avg, desc=f"[{self.hand_type}] static avg calibration") as pbar:
@@ -283,14 +485,16 @@ class Glove:
                 current = data.tensile_data
                 if last is not None and not self._sensors_still(current, last, threshold=10):
                     continue
-                for j in range(self.NUM_TENSILE_SENSORS):
-                    sums[j] += current[j]
+                sums += current
                 last = current
                 collected += 1
                 pbar.update(1)
         print()
-        self.avg_val = np.array([s / samples_avg for s in sums])
+        self.avg_val = sums / samples_avg
         self.is_calibrated = True
+        self._fused_linear = None
+        if self.inference_cache is not None:
+            self.inference_cache.clear()
 
     @staticmethod
     def _sensors_still(current, last, threshold=10) -> bool:
@@ -305,7 +509,7 @@ class Glove:
         Returns:
             bool: True if all sensor differences are below threshold, False otherwise
         """
-        return all(abs(c - l) < threshold for c, l in zip(current, last))
+        return bool(np.all(np.abs(np.asarray(current, dtype=np.int64) - np.asarray(last, dtype=np.int64)) < threshold))
 
     def _is_valid_data(self, data: bytes) -> bool:
         if len(data) != self.PACKET_SIZE:
@@ -314,25 +518,76 @@ class Glove:
         computed_crc = zlib.crc32(data[:self.CRC_DATA_SIZE]) & 0xFFFFFFFF
         return received_crc == computed_crc
 
-    def inference(self, data: GloveSensorData, method: str = "model", model: Optional[Any] = None) -> np.ndarray:
+    def normalize_tensile(self, tensile: np.ndarray) -> np.ndarray:
+        """
+        Normalize raw tensile values with the current calibration.
+        
+        Args:
+            tensile: Raw tensile values of shape (19,) or (N, 19) in device sensor order
+            
+        Returns:
+            np.ndarray: (tensile - avg_val) / (max_val - min_val), reordered by SENSOR_ORDER.
+            These are the features expected by `LinearModel.fit` and `LinearModel.predict`.
+        """
+        delta = (np.asarray(tensile, dtype=np.float64) - np.asarray(self.avg_val)) / calibration_range(self.min_val, self.max_val)
+        return delta[..., self.SENSOR_ORDER].astype(np.float32)
+
+    def fused_linear_model(self, model: Optional[LinearModel] = None) -> LinearModel:
+        """
+        Get a linear model with this glove's calibration folded into its coefficients.
+        
+        Args:
+            model: Linear model on normalized features (default: `self.linear_model`)
+            
+        Returns:
+            LinearModel: Model mapping raw tensile values of shape (19,) or (N, 19) to joint angles
+            
+        Raises:
+            ValueError: If no linear model is given or attached to the glove
+            
+        Note:
+            The fused model is cached together with the calibration values it was built
+            from, so it is rebuilt when another model is passed or when `min_val`, `max_val`
+            or `avg_val` change, also if they are assigned or edited directly.
+        """
+        if model is None:
+            model = self.linear_model
+        if model is None:
+            raise ValueError("Linear model is required for linear inference")
+        calibration = (self.min_val, self.max_val, self.avg_val)
+        cached = self._fused_linear
+        if cached is None or cached[0] is not model or not all(map(_same_values, calibration, cached[1])):
+            fused = model.fuse(self.min_val, self.max_val, self.avg_val, self.SENSOR_ORDER)
+            self._fused_linear = (model, tuple(_snapshot(v) for v in calibration), fused)
+        return self._fused_linear[2]
+
+    def _run_model(self, model: Any, delta_input: np.ndarray) -> np.ndarray:
+        """Run the model on one calibrated tensile vector in device sensor order."""
+        outputs = model.run(None, {'input': delta_input[self.SENSOR_ORDER].reshape(1, -1)})
+        return outputs[0][0]
+
+    def inference(self, data: Union[GloveFrame, GloveSensorData], method: str = "model", model: Optional[Any] = None) -> np.ndarray:
         """
         Infer joint angles from sensor data using specified method.
         
         Args:
-            data: GloveSensorData object containing tensile sensor readings
+            data: GloveFrame or GloveSensorData containing tensile sensor readings
             method: Inference method to use ("linear" for linear mapping, "model" for ML model)
+            model: ONNX session for "model", or LinearModel for "linear" (default: `self.linear_model`)
             
         Returns:
             np.ndarray: Array of joint angles in radians for each finger joint
         """
         if method == "linear":
-            # TODO: add linear mapping implementation here
-            raise NotImplementedError
+            return self.fused_linear_model(model).predict(data.tensile_data)
         elif method == "model":
             if model is None:
                 raise ValueError("Model is required for model-based inference")
             delta_input = (data.tensile_data - self.avg_val).astype(np.float32)
-            outputs = model.run(None, {'input': delta_input[self.SENSOR_ORDER].reshape(1, -1)})
-            return outputs[0][0]
+            if self.inference_cache is not None:
+                return self.inference_cache.get_or_compute(
+                    delta_input, lambda: self._run_model(model, delta_input), owner=model
+                )
+            return self._run_model(model, delta_input)
         else:
             raise NotImplementedError
\ No newline at end of file
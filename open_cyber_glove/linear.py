@@ -0,0 +1,131 @@
+import numpy as np
+from typing import Optional, Sequence
+
+
+class LinearModel:
+    """
+    Linear mapping from calibrated tensile values to joint angles.
+
+    The model operates on normalized features, i.e. tensile values with the static
+    average removed, divided by the min/max calibration range and reordered by
+    `Glove.SENSOR_ORDER` (see `Glove.normalize_tensile`). Prediction is a single
+    matrix product, so batched input of shape (N, 19) is supported directly.
+
+    Attributes:
+        weights: Coefficient matrix of shape (num_features, num_angles)
+        bias: Offset vector of shape (num_angles,)
+    """
+
+    def __init__(self, weights: np.ndarray, bias: Optional[np.ndarray] = None):
+        """
+        Initialize a linear model from its coefficients.
+
+        Args:
+            weights: Coefficient matrix of shape (num_features, num_angles)
+            bias: Offset vector of shape (num_angles,), zeros if omitted
+        """
+        self.weights = np.ascontiguousarray(weights, dtype=np.float32)
+        if self.weights.ndim != 2:
+            raise ValueError(f"Weights must be 2D, got shape {self.weights.shape}")
+        if bias is None:
+            bias = np.zeros(self.weights.shape[1])
+        self.bias = np.ascontiguousarray(bias, dtype=np.float32).reshape(-1)
+        if self.bias.shape[0] != self.weights.shape[1]:
+            raise ValueError(
+                f"Bias length {self.bias.shape[0]} does not match weights shape {self.weights.shape}"
+            )
+
+    @property
+    def num_features(self) -> int:
+        return self.weights.shape[0]
+
+    @property
+    def num_angles(self) -> int:
+        return self.weights.shape[1]
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """
+        Map features to joint angles.
+
+        Args:
+            features: Array of shape (num_features,) or (N, num_features)
+
+        Returns:
+            np.ndarray: Joint angles of shape (num_angles,) or (N, num_angles)
+        """
+        return np.asarray(features, dtype=np.float32) @ self.weights + self.bias
+
+    __call__ = predict
+
+    def fuse(self, min_val: Sequence[float], max_val: Sequence[float],
+             avg_val: Sequence[float], order: Optional[Sequence[int]] = None) -> "LinearModel":
+        """
+        Fold calibration normalization into the coefficients.
+
+        The returned model maps raw tensile values (in device sensor order) straight
+        to joint angles, so per-frame inference needs no normalization step.
+
+        Args:
+            min_val: Per-sensor minimum from min/max calibration
+            max_val: Per-sensor maximum from min/max calibration
+            avg_val: Per-sensor static average from average calibration
+            order: Sensor reordering applied to normalized features (default: identity)
+
+        Returns:
+            LinearModel: Model operating on raw tensile values
+        """
+        scale = 1.0 / calibration_range(min_val, max_val)
+        avg = np.asarray(avg_val, dtype=np.float64)
+        if order is None:
+            order = np.arange(self.num_features)
+        weights = np.zeros((len(scale), self.num_angles))
+        weights[np.asarray(order)] = self.weights
+        weights *= scale[:, None]
+        bias = self.bias - avg @ weights
+        return LinearModel(weights, bias)
+
+    @classmethod
+    def fit(cls, features: np.ndarray, angles: np.ndarray, ridge: float = 0.0) -> "LinearModel":
+        """
+        Fit coefficients offline by (ridge-regularized) least squares.
+
+        Args:
+            features: Normalized features of shape (N, num_features)
+            angles: Target joint angles of shape (N, num_angles)
+            ridge: L2 regularization strength applied to the weights (not the bias)
+
+        Returns:
+            LinearModel: Fitted model
+        """
+        x = np.asarray(features, dtype=np.float64)
+        y = np.asarray(angles, dtype=np.float64)
+        if x.ndim != 2 or y.ndim != 2 or x.shape[0] != y.shape[0]:
+            raise ValueError(f"Expected (N, F) features and (N, A) angles, got {x.shape} and {y.shape}")
+        x_aug = np.hstack([x, np.ones((x.shape[0], 1))])
+        if ridge > 0:
+            reg = ridge * np.eye(x_aug.shape[1])
+            reg[-1, -1] = 0.0
+            coef = np.linalg.solve(x_aug.T @ x_aug + reg, x_aug.T @ y)
+        else:
+            coef, *_ = np.linalg.lstsq(x_aug, y, rcond=None)
+        return cls(coef[:-1], coef[-1])
+
+    def save(self, path: str) -> None:
+        """Save coefficients to a .npz file."""
+        np.savez(path, weights=self.weights, bias=self.bias)
+
+    @classmethod
+    def load(cls, path: str) -> "LinearModel":
+        """Load coefficients from a .npz file written by `save`."""
+        try:
+            with np.load(path) as data:
+                return cls(data['weights'], data['bias'])
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Linear model file not found: {path}")
+        except KeyError as e:
+            raise RuntimeError(f"Error loading linear model from {path}: missing {e}")
+
+
+def calibration_range(min_val: Sequence[float], max_val: Sequence[float]) -> np.ndarray:
+    """Per-sensor calibration range, clamped to 1 to avoid division by zero for unused sensors."""
+    return np.maximum(np.asarray(max_val, dtype=np.float64) - np.asarray(min_val, dtype=np.float64), 1.0)
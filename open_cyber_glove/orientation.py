@@ -0,0 +1,335 @@
+import math
+import threading
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+TIMESTAMP_WRAP = 1 << 32
+
+
+def quaternion_to_matrix(q: np.ndarray) -> np.ndarray:
+    """
+    Rotation matrices of unit quaternions.
+
+    Args:
+        q: Quaternions (w, x, y, z) of shape (..., 4)
+
+    Returns:
+        np.ndarray: Rotation matrices of shape (..., 3, 3)
+    """
+    q = np.asarray(q, dtype=np.float64)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    R = np.empty(q.shape[:-1] + (3, 3))
+    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    R[..., 0, 1] = 2 * (x * y - w * z)
+    R[..., 0, 2] = 2 * (x * z + w * y)
+    R[..., 1, 0] = 2 * (x * y + w * z)
+    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    R[..., 1, 2] = 2 * (y * z - w * x)
+    R[..., 2, 0] = 2 * (x * z - w * y)
+    R[..., 2, 1] = 2 * (y * z + w * x)
+    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return R
+
+
+def quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product a * b of quaternions (w, x, y, z), broadcasting over leading axes."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=-1)
+
+
+def initial_quaternion(acc: Sequence[float], mag: Optional[Sequence[float]] = None) -> np.ndarray:
+    """
+    Orientation from a single accelerometer (and magnetometer) reading.
+
+    The accelerometer gives the earth z axis (up) in sensor coordinates, the horizontal
+    part of the magnetic field the earth x axis. Without a usable magnetometer reading the
+    sensor x axis projected onto the horizontal plane is taken as earth x.
+
+    Returns:
+        np.ndarray: Quaternion (w, x, y, z) rotating sensor coordinates into earth coordinates
+    """
+    z = np.asarray(acc, dtype=np.float64)
+    if np.linalg.norm(z) == 0.0:
+        return np.array([1.0, 0.0, 0.0, 0.0])
+    z = z / np.linalg.norm(z)
+    x = np.asarray(mag, dtype=np.float64) if mag is not None else np.zeros(3)
+    x = x - (x @ z) * z
+    if np.linalg.norm(x) < 1e-6:
+        x = np.array([1.0, 0.0, 0.0]) - z[0] * z
+        if np.linalg.norm(x) < 1e-6:
+            x = np.array([0.0, 1.0, 0.0]) - z[1] * z
+    x /= np.linalg.norm(x)
+    y = np.cross(z, x)
+    # Rows are the earth axes in sensor coordinates, i.e. the sensor -> earth rotation
+    R = np.stack([x, y, z])
+    w = math.sqrt(max(0.0, 1.0 + R[0, 0] + R[1, 1] + R[2, 2])) / 2
+    if w > 1e-3:
+        q = np.array([w, (R[2, 1] - R[1, 2]) / (4 * w), (R[0, 2] - R[2, 0]) / (4 * w), (R[1, 0] - R[0, 1]) / (4 * w)])
+    else:
+        # Rotation by ~180 degrees: recover the axis from the largest diagonal element
+        i = int(np.argmax(np.diag(R)))
+        j, k = (i + 1) % 3, (i + 2) % 3
+        s = math.sqrt(max(0.0, 1.0 + R[i, i] - R[j, j] - R[k, k])) * 2
+        q = np.empty(4)
+        q[0] = (R[k, j] - R[j, k]) / s
+        q[1 + i] = s / 4
+        q[1 + j] = (R[j, i] + R[i, j]) / s
+        q[1 + k] = (R[k, i] + R[i, k]) / s
+    return q / np.linalg.norm(q)
+
+
+def _madgwick_step(q0: float, q1: float, q2: float, q3: float,
+                   gx: float, gy: float, gz: float,
+                   ax: float, ay: float, az: float,
+                   mx: float, my: float, mz: float,
+                   beta: float, dt: float) -> Tuple[float, float, float, float]:
+    """
+    One Madgwick update on scalars.
+
+    Accelerometer and magnetometer readings must be normalized; a zero vector disables the
+    respective correction. Written out on Python floats because the recursion cannot be
+    vectorized over time and scalar arithmetic is several times faster than tiny arrays.
+    """
+    # Rate of change from the gyroscope
+    d0 = 0.5 * (-q1 * gx - q2 * gy - q3 * gz)
+    d1 = 0.5 * (q0 * gx + q2 * gz - q3 * gy)
+    d2 = 0.5 * (q0 * gy - q1 * gz + q3 * gx)
+    d3 = 0.5 * (q0 * gz + q1 * gy - q2 * gx)
+
+    if ax != 0.0 or ay != 0.0 or az != 0.0:
+        # Gravity: f = R^T (0, 0, 1) - a, gradient J^T f
+        f0 = 2.0 * (q1 * q3 - q0 * q2) - ax
+        f1 = 2.0 * (q0 * q1 + q2 * q3) - ay
+        f2 = 1.0 - 2.0 * (q1 * q1 + q2 * q2) - az
+        s0 = -2.0 * q2 * f0 + 2.0 * q1 * f1
+        s1 = 2.0 * q3 * f0 + 2.0 * q0 * f1 - 4.0 * q1 * f2
+        s2 = -2.0 * q0 * f0 + 2.0 * q3 * f1 - 4.0 * q2 * f2
+        s3 = 2.0 * q1 * f0 + 2.0 * q2 * f1
+
+        if mx != 0.0 or my != 0.0 or mz != 0.0:
+            # Earth field direction b = (bx, 0, bz) from the measurement rotated into the earth frame
+            hx = (1.0 - 2.0 * (q2 * q2 + q3 * q3)) * mx + 2.0 * (q1 * q2 - q0 * q3) * my + 2.0 * (q1 * q3 + q0 * q2) * mz
+            hy = 2.0 * (q1 * q2 + q0 * q3) * mx + (1.0 - 2.0 * (q1 * q1 + q3 * q3)) * my + 2.0 * (q2 * q3 - q0 * q1) * mz
+            bz = 2.0 * (q1 * q3 - q0 * q2) * mx + 2.0 * (q2 * q3 + q0 * q1) * my + (1.0 - 2.0 * (q1 * q1 + q2 * q2)) * mz
+            bx = math.sqrt(hx * hx + hy * hy)
+            # f = R^T b - m, gradient J^T f
+            g0 = bx * (1.0 - 2.0 * (q2 * q2 + q3 * q3)) + 2.0 * bz * (q1 * q3 - q0 * q2) - mx
+            g1 = 2.0 * bx * (q1 * q2 - q0 * q3) + 2.0 * bz * (q0 * q1 + q2 * q3) - my
+            g2 = 2.0 * bx * (q0 * q2 + q1 * q3) + bz * (1.0 - 2.0 * (q1 * q1 + q2 * q2)) - mz
+            s0 += -2.0 * bz * q2 * g0 + (-2.0 * bx * q3 + 2.0 * bz * q1) * g1 + 2.0 * bx * q2 * g2
+            s1 += 2.0 * bz * q3 * g0 + (2.0 * bx * q2 + 2.0 * bz * q0) * g1 + (2.0 * bx * q3 - 4.0 * bz * q1) * g2
+            s2 += (-4.0 * bx * q2 - 2.0 * bz * q0) * g0 + (2.0 * bx * q1 + 2.0 * bz * q3) * g1 + (2.0 * bx * q0 - 4.0 * bz * q2) * g2
+            s3 += (-4.0 * bx * q3 + 2.0 * bz * q1) * g0 + (-2.0 * bx * q0 + 2.0 * bz * q2) * g1 + 2.0 * bx * q1 * g2
+
+        norm = math.sqrt(s0 * s0 + s1 * s1 + s2 * s2 + s3 * s3)
+        if norm > 0.0:
+            norm = beta / norm
+            d0 -= norm * s0
+            d1 -= norm * s1
+            d2 -= norm * s2
+            d3 -= norm * s3
+
+    q0 += d0 * dt
+    q1 += d1 * dt
+    q2 += d2 * dt
+    q3 += d3 * dt
+    norm = 1.0 / math.sqrt(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3)
+    return q0 * norm, q1 * norm, q2 * norm, q3 * norm
+
+
+def _normalized(v: Sequence[float]) -> Tuple[float, float, float]:
+    """Unit vector of a single 3-vector as floats; a zero vector stays zero."""
+    x, y, z = float(v[0]), float(v[1]), float(v[2])
+    norm = math.sqrt(x * x + y * y + z * z)
+    if norm == 0.0:
+        return 0.0, 0.0, 0.0
+    return x / norm, y / norm, z / norm
+
+
+def _normalized_rows(v: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit length; zero rows stay zero."""
+    v = np.asarray(v, dtype=np.float64)
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    return np.divide(v, norm, out=np.zeros_like(v), where=norm > 0)
+
+
+def timestamp_deltas(timestamps: np.ndarray, max_dt: float) -> np.ndarray:
+    """
+    Seconds between consecutive uint32 microsecond device timestamps.
+
+    The counter wrap is handled with modular differences; steps larger than `max_dt`
+    (dropped packets, device reset) are clamped to `max_dt`. The first entry is 0.
+    """
+    ts = np.asarray(timestamps, dtype=np.int64)
+    dt = np.zeros(len(ts))
+    dt[1:] = np.minimum((np.diff(ts) % TIMESTAMP_WRAP) * 1e-6, max_dt)
+    return dt
+
+
+class OrientationFilter:
+    """
+    Madgwick gradient-descent orientation filter for the glove IMU.
+
+    Fuses gyroscope (rad/s), accelerometer and, optionally, magnetometer readings into the
+    orientation of the glove IMU relative to an earth frame (z up, x along magnetic north,
+    or an arbitrary heading without magnetometer). The integration step is taken from the
+    device timestamps, so host scheduling jitter does not affect it. The first sample
+    initializes the orientation from gravity and the magnetic field instead of identity.
+
+    `update` processes one packet; `update_batch` runs the same filter over a whole
+    recording with vectorized preprocessing. Both continue from the current state.
+
+    Attributes:
+        quaternion: Current orientation (w, x, y, z), sensor -> earth
+    """
+
+    def __init__(self, beta: float = 0.1, use_mag: bool = True, max_dt: float = 0.05):
+        """
+        Args:
+            beta: Gain of the accelerometer/magnetometer correction (rad/s); larger values
+                converge faster but pass more acceleration noise
+            use_mag: Correct heading with the magnetometer
+            max_dt: Largest integration step in seconds; longer gaps are clamped
+        """
+        self.beta = beta
+        self.use_mag = use_mag
+        self.max_dt = max_dt
+        self.quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+        self._reference = np.array([1.0, 0.0, 0.0, 0.0])
+        self._last_timestamp: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        return self._last_timestamp is not None
+
+    def update(self, acc: Sequence[float], gyro: Sequence[float], mag: Optional[Sequence[float]],
+               timestamp: int) -> np.ndarray:
+        """
+        Add one IMU sample.
+
+        Args:
+            acc: Accelerometer reading (m/s²)
+            gyro: Gyroscope reading (rad/s)
+            mag: Magnetometer reading (μT), ignored if None or use_mag is False
+            timestamp: Raw device timestamp in microseconds
+
+        Returns:
+            np.ndarray: Updated orientation quaternion (w, x, y, z)
+        """
+        mag = mag if self.use_mag else None
+        timestamp = int(timestamp)
+        with self._lock:
+            if self._last_timestamp is None:
+                self.quaternion = initial_quaternion(acc, mag)
+                self._last_timestamp = timestamp
+                return self.quaternion.copy()
+            dt = min(((timestamp - self._last_timestamp) % TIMESTAMP_WRAP) * 1e-6, self.max_dt)
+            self._last_timestamp = timestamp
+            a = _normalized(acc)
+            m = _normalized(mag) if mag is not None else (0.0, 0.0, 0.0)
+            q = self.quaternion.tolist()
+            self.quaternion = np.array(_madgwick_step(
+                q[0], q[1], q[2], q[3], float(gyro[0]), float(gyro[1]), float(gyro[2]),
+                a[0], a[1], a[2], m[0], m[1], m[2], self.beta, dt))
+            return self.quaternion.copy()
+
+    def update_frame(self, frame) -> np.ndarray:
+        """Add the IMU sample of a GloveFrame or GloveSensorData."""
+        return self.update(frame.acc_data, frame.gyro_data, frame.mag_data, frame.timestamp)
+
+    def update_batch(self, acc: np.ndarray, gyro: np.ndarray, mag: Optional[np.ndarray],
+                     timestamps: np.ndarray) -> np.ndarray:
+        """
+        Run the filter over a sequence of samples, e.g. a whole recording.
+
+        Normalization and integration steps are computed for all samples at once; only the
+        recursion itself runs per sample.
+
+        Args:
+            acc: Accelerometer readings (N, 3)
+            gyro: Gyroscope readings (N, 3)
+            mag: Magnetometer readings (N, 3) or None
+            timestamps: Raw device timestamps (N,)
+
+        Returns:
+            np.ndarray: Orientation after every sample, shape (N, 4)
+        """
+        n = len(timestamps)
+        out = np.empty((n, 4))
+        if n == 0:
+            return out
+        use_mag = self.use_mag and mag is not None
+        with self._lock:
+            start = 0
+            if self._last_timestamp is None:
+                self.quaternion = initial_quaternion(acc[0], mag[0] if use_mag else None)
+                out[0] = self.quaternion
+                start = 1
+                previous = int(timestamps[0])
+            else:
+                previous = self._last_timestamp
+            dt = timestamp_deltas(np.concatenate([[previous], timestamps[start:]]), self.max_dt)[1:]
+            a = _normalized_rows(acc[start:]).tolist()
+            m = _normalized_rows(mag[start:]).tolist() if use_mag else [(0.0, 0.0, 0.0)] * (n - start)
+            g = np.asarray(gyro[start:], dtype=np.float64).tolist()
+            q = tuple(self.quaternion.tolist())  # Python floats: NumPy scalar arithmetic is ~3x slower
+            beta = self.beta
+            step = _madgwick_step
+            result = []
+            for i, dt_i in enumerate(dt.tolist()):
+                gi, ai, mi = g[i], a[i], m[i]
+                q = step(q[0], q[1], q[2], q[3], gi[0], gi[1], gi[2], ai[0], ai[1], ai[2],
+                         mi[0], mi[1], mi[2], beta, dt_i)
+                result.append(q)
+            if result:
+                out[start:] = result
+            self.quaternion = out[-1].copy()
+            self._last_timestamp = int(timestamps[-1])
+        return out
+
+    def tare(self) -> None:
+        """Use the current orientation as the reference for `rotation_matrix` (e.g. hand flat, facing forward)."""
+        with self._lock:
+            self._reference = self.quaternion * np.array([1.0, -1.0, -1.0, -1.0])
+
+    def rotation_matrix(self, relative: bool = True) -> np.ndarray:
+        """
+        Current orientation as a rotation matrix.
+
+        Args:
+            relative: Relative to the orientation at the last `tare` instead of the earth frame
+
+        Returns:
+            np.ndarray: (3, 3) rotation matrix
+        """
+        with self._lock:
+            q = quaternion_multiply(self._reference, self.quaternion) if relative else self.quaternion
+        return quaternion_to_matrix(q)
+
+    def reset(self) -> None:
+        """Forget the state; the next sample re-initializes the orientation."""
+        with self._lock:
+            self.quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+            self._reference = np.array([1.0, 0.0, 0.0, 0.0])
+            self._last_timestamp = None
+
+
+def orientation_batch(acc: np.ndarray, gyro: np.ndarray, mag: Optional[np.ndarray], timestamps: np.ndarray,
+                      beta: float = 0.1, max_dt: float = 0.05) -> np.ndarray:
+    """
+    Orientation quaternions (N, 4) for a whole recording, e.g. `np.fromfile(path, PACKET_DTYPE)`:
+
+        orientation_batch(rec['acc'], rec['gyro'], rec['mag'], rec['timestamp'])
+
+    See `OrientationFilter.update_batch`.
+    """
+    return OrientationFilter(beta, mag is not None, max_dt).update_batch(acc, gyro, mag, timestamps)
@@ -0,0 +1,210 @@
+import threading
+import time
+import numpy as np
+from typing import Optional, Sequence
+
+
+class DeviceClock:
+    """
+    Maps device timestamps onto the host clock.
+
+    The glove stamps packets with a wrapping uint32 microsecond counter. Offsets between
+    host receive time (time.perf_counter) and unwrapped device time are tracked with a
+    minimum filter: the smallest offset seen belongs to the packet with the least transfer
+    and scheduling delay, so it is the best estimate of the clock offset. The estimate
+    relaxes upwards slowly so it follows clock drift between the two oscillators.
+    """
+    WRAP = 1 << 32
+
+    def __init__(self, drift_rate: float = 1e-4):
+        """
+        Args:
+            drift_rate: Rate (seconds per second) at which the offset estimate may rise
+        """
+        self.drift_rate = drift_rate
+        self.offset: Optional[float] = None
+        self._last_raw: Optional[int] = None
+        self._wraps = 0
+        self._last_host: Optional[float] = None
+
+    def unwrap(self, timestamp: int) -> float:
+        """Convert a raw device timestamp to monotonically increasing device seconds."""
+        timestamp = int(timestamp)
+        if self._last_raw is not None and timestamp < self._last_raw and self._last_raw - timestamp > self.WRAP // 2:
+            self._wraps += 1
+        self._last_raw = timestamp
+        return (self._wraps * self.WRAP + timestamp) * 1e-6
+
+    def update(self, timestamp: int, host_time: float) -> float:
+        """
+        Register a packet and return its timestamp mapped to host time.
+
+        Args:
+            timestamp: Raw device timestamp in microseconds
+            host_time: Host time (time.perf_counter) at which the packet was received
+
+        Returns:
+            float: Estimated host time at which the device sampled the packet
+        """
+        device_time = self.unwrap(timestamp)
+        sample = host_time - device_time
+        if self.offset is None or sample < self.offset:
+            self.offset = sample
+        elif self._last_host is not None:
+            self.offset = min(sample, self.offset + self.drift_rate * (host_time - self._last_host))
+        self._last_host = host_time
+        return device_time + self.offset
+
+    def to_host(self, device_time: float) -> float:
+        """Map unwrapped device seconds to host time."""
+        if self.offset is None:
+            raise RuntimeError("Device clock has not been synchronized yet")
+        return device_time + self.offset
+
+
+class PosePredictor:
+    """
+    Latency-compensating extrapolation of joint angles.
+
+    Keeps a short ring buffer of recent angle vectors stamped with the device sample time
+    (mapped to host time by DeviceClock), fits a per-joint velocity by least squares over
+    the buffer and extrapolates to a requested host time. Gyro readings of the most recent
+    packet give the matching wrist rotation increment.
+
+    Everything is vectorized over the joints, so an update costs a few array writes and a
+    prediction one small reduction over the history.
+
+    Attributes:
+        pipeline_delay: Smoothed delay in seconds between device sampling and the end of
+            inference; the default prediction horizon
+    """
+
+    def __init__(self, num_angles: int = 22, history: int = 6, max_horizon: float = 0.1,
+                 transport_latency: float = 0.0015, delay_smoothing: float = 0.05):
+        """
+        Args:
+            num_angles: Length of the angle vector
+            history: Number of recent frames used for the velocity fit
+            max_horizon: Maximum extrapolation in seconds past the newest sample
+            transport_latency: Serial transfer time of one packet not observable from timestamps (s)
+            delay_smoothing: Exponential smoothing factor for `pipeline_delay`
+        """
+        if history < 2:
+            raise ValueError("History must hold at least two frames")
+        self.history = history
+        self.max_horizon = max_horizon
+        self.transport_latency = transport_latency
+        self.delay_smoothing = delay_smoothing
+        self.clock = DeviceClock()
+        self.pipeline_delay: Optional[float] = None
+        self._times = np.zeros(history)
+        self._angles = np.zeros((history, num_angles))
+        self._gyro = np.zeros(3)
+        self._count = 0
+        self._head = 0
+        self._lock = threading.Lock()
+
+    def update(self, angles: np.ndarray, timestamp: int, receive_time: float,
+               gyro: Optional[Sequence[float]] = None, done_time: Optional[float] = None) -> None:
+        """
+        Add a new frame.
+
+        Args:
+            angles: Joint angles inferred for the frame
+            timestamp: Raw device timestamp of the frame in microseconds
+            receive_time: Host time at which the packet was read from the serial port
+            gyro: Gyroscope reading (rad/s) of the frame
+            done_time: Host time at which inference finished (default: now)
+        """
+        sample_time = self.clock.update(timestamp, receive_time) - self.transport_latency
+        if done_time is None:
+            done_time = time.perf_counter()
+        delay = done_time - sample_time
+        with self._lock:
+            if self._count and sample_time <= self._times[(self._head - 1) % self.history]:
+                return  # Same packet as before or out of order
+            self._times[self._head] = sample_time
+            self._angles[self._head] = angles
+            if gyro is not None:
+                self._gyro[:] = gyro
+            self._head = (self._head + 1) % self.history
+            self._count = min(self._count + 1, self.history)
+            if self.pipeline_delay is None:
+                self.pipeline_delay = delay
+            else:
+                self.pipeline_delay += self.delay_smoothing * (delay - self.pipeline_delay)
+
+    @property
+    def latest_time(self) -> Optional[float]:
+        """Host-time sample stamp of the newest frame, or None if empty."""
+        if not self._count:
+            return None
+        return float(self._times[(self._head - 1) % self.history])
+
+    def _horizon(self, target_time: Optional[float]) -> float:
+        """
+        Clamped extrapolation interval from the newest sample to target_time.
+
+        Without a target the horizon is the smoothed `pipeline_delay`, i.e. the pose is
+        carried forward by the measured sampling-to-inference latency.
+        """
+        if target_time is None:
+            horizon = self.pipeline_delay or 0.0
+        else:
+            horizon = target_time - float(self._times[(self._head - 1) % self.history])
+        return min(max(horizon, 0.0), self.max_horizon)
+
+    def predict(self, target_time: Optional[float] = None) -> np.ndarray:
+        """
+        Extrapolate the joint angles to a host time.
+
+        Args:
+            target_time: Host time (time.perf_counter) to predict for; by default the newest
+                sample is extrapolated by `pipeline_delay`, which compensates the measured
+                latency but no downstream delay
+
+        Returns:
+            np.ndarray: Predicted joint angles
+
+        Raises:
+            RuntimeError: If no frame has been added yet
+        """
+        with self._lock:
+            if not self._count:
+                raise RuntimeError("No frames to predict from")
+            newest = (self._head - 1) % self.history
+            latest = self._angles[newest].copy()
+            if self._count < 2:
+                return latest
+            horizon = self._horizon(target_time)
+            dt = self._times[:self._count] - self._times[:self._count].mean()
+            denom = dt @ dt
+            if denom <= 0.0:
+                return latest
+            # Least-squares slope; dt sums to zero, so the angle mean drops out
+            velocity = dt @ self._angles[:self._count]
+        latest += velocity * (horizon / denom)
+        return latest
+
+    def predict_rotation(self, target_time: Optional[float] = None) -> np.ndarray:
+        """
+        Wrist rotation between the newest sample and a host time, from the latest gyro reading.
+
+        Args:
+            target_time: Host time (time.perf_counter) to predict for (default: as in `predict`)
+
+        Returns:
+            np.ndarray: Rotation vector (axis * angle, radians) in the glove IMU frame
+        """
+        with self._lock:
+            if not self._count:
+                raise RuntimeError("No frames to predict from")
+            return self._gyro * self._horizon(target_time)
+
+    def reset(self) -> None:
+        """Drop the history (e.g. after recalibration or a reconnect)."""
+        with self._lock:
+            self._count = 0
+            self._head = 0
+            self.pipeline_delay = None
+        self.clock = DeviceClock(self.clock.drift_rate)
@@ -0,0 +1,200 @@
+import threading
+import time
+import numpy as np
+from typing import Callable, Optional
+
+from .prediction import DeviceClock
+
+
+class Resampler:
+    """
+    Interpolates a jittery ~120 Hz stream (angles or tensile values) to arbitrary host times.
+
+    Samples are stamped with their device timestamps mapped to host time (DeviceClock), so
+    USB and scheduling jitter on the receive side does not distort the signal. They are
+    kept in a small ring buffer; a query walks back from the newest sample, which for
+    the usual "now" or "now minus a fixed delay" queries ends after one or two steps, and
+    evaluates the interpolant on one interval. A query therefore touches a constant
+    number of samples and costs a few microseconds.
+
+    Interpolation is 'linear' or 'cubic' (cubic Hermite with finite-difference tangents,
+    i.e. C1 continuous velocities across samples). Queries past the newest
+    sample extrapolate along the last slope by at most `max_extrapolation` seconds; later
+    queries hold the value at that bound. Queries before the oldest sample return it.
+
+    Attributes:
+        delay: Seconds subtracted from every query time; about one sample period turns
+            most queries into interpolation instead of extrapolation
+    """
+    METHODS = ('linear', 'cubic')
+    OUTPUT_SPIN = 0.0002  # Seconds busy-waited before each fixed-rate tick
+
+    def __init__(self, num_values: int = 22, history: int = 8, method: str = 'cubic',
+                 max_extrapolation: float = 0.02, delay: float = 0.0, transport_latency: float = 0.0015):
+        """
+        Args:
+            num_values: Length of each sample vector
+            history: Number of samples kept (at least 2)
+            method: 'linear' or 'cubic'
+            max_extrapolation: Longest extrapolation past the newest sample in seconds
+            delay: Seconds subtracted from every query time
+            transport_latency: Serial transfer time of one packet not observable from timestamps (s)
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Invalid method: {method}, expected one of {self.METHODS}")
+        if history < 2:
+            raise ValueError("History must hold at least two samples")
+        self.method = method
+        self.history = history
+        self.max_extrapolation = max_extrapolation
+        self.delay = delay
+        self.transport_latency = transport_latency
+        self.clock = DeviceClock()
+        self._times = [0.0] * history  # Python floats: scalar math on them is cheaper than on NumPy scalars
+        self._values = np.zeros((history, num_values))
+        self._head = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._output_thread: Optional[threading.Thread] = None
+        self._output_stop = threading.Event()
+
+    def push(self, values: np.ndarray, timestamp: int, receive_time: float) -> None:
+        """
+        Add a sample.
+
+        Args:
+            values: Sample vector (e.g. joint angles)
+            timestamp: Raw device timestamp in microseconds
+            receive_time: Host time (time.perf_counter) at which the packet was read
+        """
+        sample_time = self.clock.update(timestamp, receive_time) - self.transport_latency
+        with self._lock:
+            if self._count and sample_time <= self._times[(self._head - 1) % self.history]:
+                return  # Same packet as before or out of order
+            self._times[self._head] = float(sample_time)
+            self._values[self._head] = np.ravel(values)
+            self._head = (self._head + 1) % self.history
+            self._count = min(self._count + 1, self.history)
+
+    @property
+    def latest_time(self) -> Optional[float]:
+        """Host-time stamp of the newest sample, or None if empty."""
+        if not self._count:
+            return None
+        return self._times[(self._head - 1) % self.history]
+
+    def sample(self, target_time: Optional[float] = None) -> np.ndarray:
+        """
+        Value at a host time.
+
+        Args:
+            target_time: Host time (time.perf_counter), default now; `delay` is subtracted
+
+        Returns:
+            np.ndarray: Interpolated (or boundedly extrapolated) sample vector
+
+        Raises:
+            RuntimeError: If no sample has been pushed yet
+        """
+        if target_time is None:
+            target_time = time.perf_counter()
+        t = target_time - self.delay
+        with self._lock:
+            count = self._count
+            if not count:
+                raise RuntimeError("No samples to resample from")
+            h = self.history
+            times = self._times
+            values = self._values
+            newest = (self._head - 1) % h
+            if count == 1:
+                return values[newest].copy()
+            if t >= times[newest]:
+                # Extrapolate along the last interval, at most max_extrapolation ahead
+                prev = (newest - 1) % h
+                t0, t1 = times[prev], times[newest]
+                horizon = min(t - t1, self.max_extrapolation)
+                return values[newest] + (values[newest] - values[prev]) * (horizon / (t1 - t0))
+            # Walk back to the interval [i0, i1] containing t
+            i1 = newest
+            for _ in range(count - 1):
+                i0 = (i1 - 1) % h
+                if times[i0] <= t:
+                    break
+                i1 = i0
+            else:
+                return values[i1].copy()  # Older than the history
+            t0, t1 = times[i0], times[i1]
+            dt = t1 - t0
+            u = (t - t0) / dt
+            p0, p1 = values[i0], values[i1]
+            if self.method == 'linear':
+                return p0 + (p1 - p0) * u
+            # Cubic Hermite with finite-difference tangents (one-sided at the ends of the
+            # buffer), expanded into scalar weights on the four surrounding samples
+            u2 = u * u
+            u3 = u2 * u
+            h00 = 2 * u3 - 3 * u2 + 1
+            h10 = (u3 - 2 * u2 + u) * dt
+            h01 = 1 - h00
+            h11 = (u3 - u2) * dt
+            oldest = (self._head - count) % h
+            im = (i0 - 1) % h if i0 != oldest else i0
+            ip = (i1 + 1) % h if i1 != newest else i1
+            # m0 = (p1 - pm) / (t1 - tm), m1 = (pp - p0) / (tp - t0)
+            c0 = h10 / (t1 - times[im])
+            c1 = h11 / (times[ip] - t0)
+            weights = np.array([-c0, h00 - c1, h01 + c0, c1])
+            return weights @ values[[im, i0, i1, ip]]
+
+    def start_output(self, rate: float, callback: Callable[[float, np.ndarray], None]) -> None:
+        """
+        Call `callback(tick_time, values)` at a fixed rate from a background thread.
+
+        Ticks are scheduled on absolute deadlines (tick_time = start + k / rate), so jitter
+        of one tick does not shift later ones. Ticks before the first sample are skipped.
+
+        Args:
+            rate: Output rate in Hz
+            callback: Receives the scheduled host time of the tick and the resampled values
+        """
+        if self._output_thread is not None:
+            raise RuntimeError("Fixed-rate output already running")
+        self._output_stop.clear()
+        self._output_thread = threading.Thread(target=self._output_loop, args=(rate, callback), daemon=True)
+        self._output_thread.start()
+
+    def stop_output(self) -> None:
+        """Stop the fixed-rate output thread."""
+        if self._output_thread is not None:
+            self._output_stop.set()
+            self._output_thread.join()
+            self._output_thread = None
+
+    def _output_loop(self, rate: float, callback: Callable[[float, np.ndarray], None]) -> None:
+        period = 1.0 / rate
+        start = time.perf_counter()
+        tick = 0
+        while not self._output_stop.is_set():
+            deadline = start + tick * period
+            remaining = deadline - time.perf_counter()
+            if remaining > self.OUTPUT_SPIN:
+                # Sleep most of the way, then spin briefly to hit the tick precisely
+                time.sleep(remaining - self.OUTPUT_SPIN)
+                continue
+            while time.perf_counter() < deadline:
+                pass
+            if self._count:
+                callback(deadline, self.sample(deadline))
+            tick += 1
+            late = time.perf_counter() - (start + tick * period)
+            if late > period:
+                tick += int(late / period)  # Drop ticks we can no longer make
+
+    def reset(self) -> None:
+        """Drop the history (e.g. after recalibration or a reconnect)."""
+        with self._lock:
+            self._count = 0
+            self._head = 0
+        self.clock = DeviceClock(self.clock.drift_rate)
+
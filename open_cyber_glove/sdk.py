@@ -1,9 +1,19 @@
+import logging
 import threading
-from typing import Optional
-from .glove import Glove, GloveSensorData
-import matplotlib.pyplot as plt
+import time
+from typing import Dict, Optional, Tuple
+from .glove import Glove, GloveFrame, PACKET_DTYPE
+from .linear import LinearModel
+from .session import SessionConfig, warm_up
+from .executor import load_session
+from .prediction import PosePredictor
+from .cache import InferenceCache
+from .orientation import OrientationFilter
+from .gesture import GestureDetector
+from .resampler import Resampler
 import numpy as np
-import onnxruntime as ort
+
+logger = logging.getLogger(__name__)
 
 class OpenCyberGlove:
     """
@@ -14,6 +24,11 @@ class OpenCyberGlove:
                  right_port: Optional[str] = None,
                  model_path: Optional[str] = None,
                  glove_cls=Glove,
+                 linear_model_path: Optional[str] = None,
+                 session_config: Optional[SessionConfig] = None,
+                 backend: str = 'onnxruntime',
+                 weight_dtype: str = 'float32',
+                 io_mode: str = Glove.IO_MODE_POLL,
                  ):
         if not left_port and not right_port:
             raise ValueError("At least one of left_port or right_port must be provided.")
@@ -21,31 +36,64 @@ class OpenCyberGlove:
         self.right_glove: Optional[Glove] = glove_cls('right') if right_port else None
         self.left_port = left_port
         self.right_port = right_port
+        self.io_mode = io_mode
         self._running = False
 
+        self.session_config = session_config or SessionConfig()
         self.model = None
         if model_path:
-            self.model = ort.InferenceSession(model_path)
+            self.model = load_session(model_path, backend, self.session_config, weight_dtype)
+
+        self.linear_model: Optional[LinearModel] = None
+        if linear_model_path:
+            self.linear_model = LinearModel.load(linear_model_path)
+
+        self.predictors: Dict[str, PosePredictor] = {}
+        self.orientation_filters: Dict[str, OrientationFilter] = {}
+        self.gesture_detectors: Dict[str, GestureDetector] = {}
+        self._gesture_inputs: Dict[str, str] = {}
+        self.resamplers: Dict[str, Resampler] = {}
+        self._resampler_inputs: Dict[str, str] = {}
+        self._feed_threads: Dict[str, threading.Thread] = {}
+        # Newest feeder result per hand as (sequence, angles), and the sequence last handed
+        # out by get_angles; the condition wakes get_angles callers on every new result
+        self._feed_results: Dict[str, Tuple[int, np.ndarray]] = {}
+        self._feed_taken: Dict[str, int] = {}
+        self._feed_condition = threading.Condition()
+        # Several threads may call get_angles for one hand: the lock keeps the packet fetch,
+        # last_receive_time and the per-hand filters together. The shared model needs no
+        # lock: onnxruntime sessions and NumpySession are safe to run concurrently
+        self._hand_locks = {'left': threading.Lock(), 'right': threading.Lock()}
 
     def start(self) -> None:
-        """Start available gloves' background data readers."""
+        """Start available gloves' background data readers and warm up the inference session."""
+        self.warm_up()
         if self.left_glove and self.left_port:
-            self.left_glove.connect(self.left_port)
+            self.left_glove.connect(self.left_port, io_mode=self.io_mode)
             self.left_glove.start_reader()
         if self.right_glove and self.right_port:
-            self.right_glove.connect(self.right_port)
+            self.right_glove.connect(self.right_port, io_mode=self.io_mode)
             self.right_glove.start_reader()
         self._running = True
 
+    def warm_up(self) -> None:
+        """Run dummy inferences so the first live frame runs at steady-state latency."""
+        if self.model is not None:
+            warm_up(self.model, self.session_config.warmup_runs)
+
     def stop(self) -> None:
-        """Stop all running gloves' background data readers."""
+        """Stop all resampling feeder threads and running gloves' background data readers."""
         self._running = False
+        for thread in self._feed_threads.values():
+            # Feeders wait for packets with a short timeout, so they notice the stop promptly
+            thread.join()
+        self._feed_threads.clear()
         if self.left_glove:
             self.left_glove.stop_reader()
         if self.right_glove:
             self.right_glove.stop_reader()
 
-    def get_data(self, hand_type: str) -> GloveSensorData:
+    def get_data(self, hand_type: str) -> GloveFrame:
         """
         Get sensor data from the specified glove.
         
@@ -53,7 +101,7 @@ class OpenCyberGlove:
             hand_type (str): Type of hand ('left' or 'right')
             
         Returns:
-            GloveSensorData: Sensor data from the specified glove
+            GloveFrame: Sensor data from the specified glove
             
         Raises:
             ValueError: If hand_type is invalid
@@ -74,6 +122,11 @@ class OpenCyberGlove:
         """
         Get joint angles from the specified glove.
         
+        Blocks until a packet newer than the previous call's is available. While a
+        resampling feeder runs for the hand (see `enable_resampling`), the feeder owns the
+        glove's packets and this returns the feeder's newest result, computed with the
+        feeder's inference method, instead of reading the glove itself.
+        
         Args:
             hand_type (str): Type of hand ('left' or 'right')
             method (str): Method to use for inference ('model' or 'linear')
@@ -85,18 +138,273 @@ class OpenCyberGlove:
             ValueError: If hand_type is invalid
             RuntimeError: If the specified glove is not available
         """
-        data = self.get_data(hand_type)
         if hand_type == 'left':
             if not self.left_glove:
                 raise RuntimeError("Left glove not available")
-            return self.left_glove.inference(data, method, model=self.model)
+            glove = self.left_glove
         elif hand_type == 'right':
             if not self.right_glove:
                 raise RuntimeError("Right glove not available")
-            return self.right_glove.inference(data, method, model=self.model)
+            glove = self.right_glove
         else:
             raise ValueError(f"Invalid hand type: {hand_type}")
+        if hand_type in self._feed_threads:
+            return self._next_feed_result(hand_type)
+        with self._hand_locks[hand_type]:
+            return self._get_angles(glove, hand_type, method)
+
+    def _get_angles(self, glove: Glove, hand_type: str, method: str, timeout: Optional[float] = None) -> np.ndarray:
+        """Fetch, infer and feed the per-hand consumers (caller holds the hand lock)."""
+        data = glove.get_data(timeout)
+        angles = glove.inference(data, method, model=self._model_for(method))
+        predictor = self.predictors.get(hand_type)
+        if predictor is not None:
+            predictor.update(angles, data.timestamp, glove.last_receive_time, data.gyro_data)
+        orientation = self.orientation_filters.get(hand_type)
+        if orientation is not None:
+            # Integrate every packet since the last call, not just the newest one
+            packets = glove.last_packets
+            if len(packets) > 1:
+                records = np.frombuffer(b''.join(packets), dtype=PACKET_DTYPE)
+                orientation.update_batch(records['acc'], records['gyro'], records['mag'], records['timestamp'])
+            else:
+                orientation.update_frame(data)
+        detector = self.gesture_detectors.get(hand_type)
+        if detector is not None:
+            inputs = self._gesture_inputs[hand_type]
+            if inputs == 'angles':
+                features = angles
+            else:
+                tensile = glove.normalize_tensile(data.tensile_data)
+                features = tensile if inputs == 'tensile' else np.concatenate([np.ravel(angles), tensile])
+            detector.update(np.ravel(features), glove.last_receive_time)
+        resampler = self.resamplers.get(hand_type)
+        if resampler is not None:
+            values = angles if self._resampler_inputs[hand_type] == 'angles' else data.tensile_data
+            resampler.push(values, data.timestamp, glove.last_receive_time)
+        return angles
+
+    def enable_prediction(self, hand_type: Optional[str] = None, **kwargs) -> None:
+        """
+        Track angle history for latency-compensating prediction.
+        
+        Args:
+            hand_type (str): 'left', 'right' or None for all available gloves
+            **kwargs: Options forwarded to PosePredictor (history, max_horizon, ...)
+        """
+        hands = [hand_type] if hand_type else [h for h, g in (('left', self.left_glove), ('right', self.right_glove)) if g]
+        for hand in hands:
+            self.predictors[hand] = PosePredictor(**kwargs)
+
+    def enable_orientation(self, hand_type: Optional[str] = None, **kwargs) -> None:
+        """
+        Track wrist orientation from the glove IMU on every `get_angles` call.
+        
+        Every packet received since the previous call is integrated, so the filter sees
+        the full IMU rate even if `get_angles` is called less often.
+        
+        Args:
+            hand_type (str): 'left', 'right' or None for all available gloves
+            **kwargs: Options forwarded to OrientationFilter (beta, use_mag, max_dt)
+        """
+        hands = [hand_type] if hand_type else [h for h, g in (('left', self.left_glove), ('right', self.right_glove)) if g]
+        for hand in hands:
+            self.orientation_filters[hand] = OrientationFilter(**kwargs)
+
+    def get_wrist_rotation(self, hand_type: str, relative: bool = True) -> np.ndarray:
+        """
+        Current wrist orientation, e.g. for `forward_kinematics(..., wrist_rotation=...)`.
+        
+        Args:
+            hand_type (str): Type of hand ('left' or 'right')
+            relative (bool): Relative to the last `OrientationFilter.tare` instead of the earth frame
+
+        Returns:
+            np.ndarray: (3, 3) rotation matrix
+        """
+        orientation = self.orientation_filters.get(hand_type)
+        if orientation is None:
+            raise RuntimeError(f"Orientation tracking not enabled for {hand_type} hand")
+        return orientation.rotation_matrix(relative)
+
+    def enable_gesture_detection(self, hand_type: Optional[str] = None, inputs: str = 'angles',
+                                 **kwargs) -> Dict[str, GestureDetector]:
+        """
+        Match every `get_angles` result against registered gesture templates.
+        
+        Args:
+            hand_type (str): 'left', 'right' or None for all available gloves
+            inputs (str): Features to match: 'angles' (22), 'tensile' (19 normalized values,
+                see `Glove.normalize_tensile`) or 'both' (angles followed by tensile)
+            **kwargs: Options forwarded to GestureDetector (window, method, scale, refractory)
+
+        Returns:
+            Dict[str, GestureDetector]: The new detectors by hand; register templates on them
+        """
+        num_features = {'angles': 22, 'tensile': Glove.NUM_TENSILE_SENSORS, 'both': 22 + Glove.NUM_TENSILE_SENSORS}
+        if inputs not in num_features:
+            raise ValueError(f"Invalid gesture inputs: {inputs}")
+        hands = [hand_type] if hand_type else [h for h, g in (('left', self.left_glove), ('right', self.right_glove)) if g]
+        for hand in hands:
+            self.gesture_detectors[hand] = GestureDetector(num_features[inputs], **kwargs)
+            self._gesture_inputs[hand] = inputs
+        return {hand: self.gesture_detectors[hand] for hand in hands}
+
+    def enable_resampling(self, hand_type: Optional[str] = None, inputs: str = 'angles', feed: bool = True,
+                          inference_method: str = 'model', **kwargs) -> Dict[str, Resampler]:
+        """
+        Make angles or tensile values available at arbitrary host times (see `get_resampled`).
+        
+        A feeder thread takes over the hand: it reads and infers every packet, and updates
+        the resampler, predictor, orientation filter and gesture detector. `get_angles`
+        for that hand then returns the feeder's newest result instead of reading packets
+        itself, so the resampler still sees the full stream. `stop()` ends the feeders.
         
+        Args:
+            hand_type (str): 'left', 'right' or None for all available gloves
+            inputs (str): 'angles' or 'tensile' (raw values)
+            feed (bool): Start a background thread that runs `get_angles` for every packet
+                (requires `start()`); otherwise the resampler is only fed by your own
+                `get_angles` calls
+            inference_method (str): Inference method used by the feeder thread ('model' or 'linear')
+            **kwargs: Options forwarded to Resampler (history, method, max_extrapolation, delay)
+
+        Returns:
+            Dict[str, Resampler]: The new resamplers by hand, e.g. for `start_output`
+        """
+        if inputs not in ('angles', 'tensile'):
+            raise ValueError(f"Invalid resampling inputs: {inputs}")
+        if feed and not self._running:
+            raise RuntimeError("Call start() before enabling resampling with a feeder thread")
+        hands = [hand_type] if hand_type else [h for h, g in (('left', self.left_glove), ('right', self.right_glove)) if g]
+        if feed:
+            # Fail here rather than in the feeder thread
+            gloves = {'left': self.left_glove, 'right': self.right_glove}
+            if inference_method not in ('model', 'linear'):
+                raise ValueError(f"Invalid inference method: {inference_method}")
+            if inference_method == 'model' and self.model is None:
+                raise ValueError("Model is required for model-based inference")
+            if inference_method == 'linear' and self.linear_model is None and any(
+                    gloves[hand] is None or gloves[hand].linear_model is None for hand in hands):
+                raise ValueError("Linear model is required for linear inference")
+        num_values = 22 if inputs == 'angles' else Glove.NUM_TENSILE_SENSORS
+        for hand in hands:
+            self.resamplers[hand] = Resampler(num_values, **kwargs)
+            self._resampler_inputs[hand] = inputs
+            if feed and hand not in self._feed_threads:
+                with self._feed_condition:
+                    self._feed_results.pop(hand, None)
+                    self._feed_taken.pop(hand, None)
+                thread = threading.Thread(target=self._feed_loop, args=(hand, inference_method), daemon=True)
+                self._feed_threads[hand] = thread
+                thread.start()
+        return {hand: self.resamplers[hand] for hand in hands}
+
+    def _feed_loop(self, hand_type: str, method: str) -> None:
+        """Run inference on every packet so the resampler sees the full packet rate."""
+        glove = self.left_glove if hand_type == 'left' else self.right_glove
+        sequence = 0
+        while self._running and hand_type in self.resamplers:
+            try:
+                with self._hand_locks[hand_type]:
+                    angles = self._get_angles(glove, hand_type, method, timeout=0.1)
+            except TimeoutError:
+                continue
+            except Exception as e:
+                if self._running:
+                    logger.error(f"Error in {hand_type} resampling feeder: {e}")
+                    time.sleep(0.01)
+                continue
+            sequence += 1
+            with self._feed_condition:
+                self._feed_results[hand_type] = (sequence, angles)
+                self._feed_condition.notify_all()
+
+    def _next_feed_result(self, hand_type: str) -> np.ndarray:
+        """Wait for a feeder result newer than the one last returned by `get_angles`."""
+        with self._feed_condition:
+            while True:
+                sequence, angles = self._feed_results.get(hand_type, (0, None))
+                if sequence > self._feed_taken.get(hand_type, 0):
+                    self._feed_taken[hand_type] = sequence
+                    return angles
+                thread = self._feed_threads.get(hand_type)
+                if thread is None or not thread.is_alive():
+                    raise RuntimeError(f"Resampling feeder for {hand_type} glove stopped")
+                self._feed_condition.wait(0.1)
+
+    def get_resampled(self, hand_type: str, target_time: Optional[float] = None) -> np.ndarray:
+        """
+        Angles (or tensile values) interpolated to a host time, e.g. a control loop tick.
+        
+        Cheap enough to call at 1 kHz: no inference or serial I/O happens here.
+        
+        Args:
+            hand_type (str): Type of hand ('left' or 'right')
+            target_time (float): Host time (time.perf_counter), default now
+
+        Returns:
+            np.ndarray: Resampled values
+        """
+        resampler = self.resamplers.get(hand_type)
+        if resampler is None:
+            raise RuntimeError(f"Resampling not enabled for {hand_type} glove")
+        return resampler.sample(target_time)
+
+    def enable_inference_cache(self, hand_type: Optional[str] = None, tolerance=8.0, maxsize: int = 64) -> None:
+        """
+        Skip model runs while the hand is (nearly) static.
+        
+        Args:
+            hand_type (str): 'left', 'right' or None for all available gloves
+            tolerance: Per-channel tolerance in raw tensile units (scalar or 19 values)
+            maxsize (int): Number of recent results kept for reuse
+        """
+        for hand, glove in (('left', self.left_glove), ('right', self.right_glove)):
+            if glove and hand_type in (None, hand):
+                glove.inference_cache = InferenceCache(tolerance, maxsize)
+
+    def inference_cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Hit-rate statistics of the inference caches, per hand."""
+        stats = {}
+        for hand, glove in (('left', self.left_glove), ('right', self.right_glove)):
+            if glove and glove.inference_cache is not None:
+                stats[hand] = glove.inference_cache.stats()
+        return stats
+
+    def get_predicted_angles(self, hand_type: str, target_time: Optional[float] = None,
+                             method: str = 'model') -> np.ndarray:
+        """
+        Get joint angles extrapolated to a future host time.
+        
+        Fetches and infers the latest frame, then extrapolates from recent history to
+        compensate serial transfer, framing, inference and downstream delays.
+        
+        Args:
+            hand_type (str): Type of hand ('left' or 'right')
+            target_time (float): Host time (time.perf_counter) the pose is needed for,
+                e.g. when the robot command takes effect (default: the newest sample plus
+                the measured `pipeline_delay`)
+            method (str): Method to use for inference ('model' or 'linear')
+            
+        Returns:
+            np.ndarray: Predicted joint angles in radians
+            
+        Raises:
+            RuntimeError: If prediction was not enabled for the glove
+        """
+        predictor = self.predictors.get(hand_type)
+        if predictor is None:
+            raise RuntimeError(f"Prediction not enabled for {hand_type} glove")
+        self.get_angles(hand_type, method)
+        return predictor.predict(target_time)
+
+    def _model_for(self, method: str):
+        """Select the model passed to `Glove.inference` for the given method."""
+        if method == 'linear':
+            return self.linear_model
+        return self.model
+
     def visualize(self) -> None:
         """Placeholder for visualization method."""
         pass 
@@ -110,6 +418,7 @@ class OpenCyberGlove:
 
     def diagnose(self) -> None:
         """Diagnose all available gloves with an interactive plot."""
+        import matplotlib.pyplot as plt
         plt.style.use('dark_background')
         plt.ion()
         fig, ax = plt.subplots(figsize=(10, 5))
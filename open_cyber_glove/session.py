@@ -0,0 +1,170 @@
+import hashlib
+import logging
+import os
+import platform
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    'disable': 'ORT_DISABLE_ALL',
+    'basic': 'ORT_ENABLE_BASIC',
+    'extended': 'ORT_ENABLE_EXTENDED',
+    'all': 'ORT_ENABLE_ALL',
+}
+EXECUTION_MODES = {
+    'sequential': 'ORT_SEQUENTIAL',
+    'parallel': 'ORT_PARALLEL',
+}
+ONNX_TYPES = {
+    'tensor(float)': np.float32,
+    'tensor(float16)': np.float16,
+    'tensor(double)': np.float64,
+    'tensor(int32)': np.int32,
+    'tensor(int64)': np.int64,
+}
+
+
+@dataclass
+class SessionConfig:
+    """
+    Options for building the onnxruntime inference session.
+
+    The defaults target the small glove models: a single (1, 19) input is far too little
+    work to benefit from thread pools, so one intra-op thread and sequential execution
+    avoid thread wake-up latency.
+
+    Attributes:
+        graph_optimization_level: 'disable', 'basic', 'extended' or 'all'
+        intra_op_num_threads: Threads used inside an operator (0 lets onnxruntime decide)
+        inter_op_num_threads: Threads used across operators in parallel mode (0 lets onnxruntime decide)
+        execution_mode: 'sequential' or 'parallel'
+        enable_cpu_mem_arena: Use the CPU memory arena allocator
+        enable_mem_pattern: Pre-plan allocations from the first run's memory pattern
+        cache_dir: Directory for optimized graphs keyed by model hash (disabled if None)
+        warmup_runs: Number of dummy runs performed by `warm_up`
+        providers: Execution providers passed to the session (onnxruntime default if None)
+    """
+    graph_optimization_level: str = 'all'
+    intra_op_num_threads: int = 1
+    inter_op_num_threads: int = 1
+    execution_mode: str = 'sequential'
+    enable_cpu_mem_arena: bool = True
+    enable_mem_pattern: bool = True
+    cache_dir: Optional[str] = None
+    warmup_runs: int = 10
+    providers: Optional[List[str]] = None
+
+
+def _session_options(ort: Any, config: SessionConfig, optimization_level: str) -> Any:
+    """Translate a SessionConfig into onnxruntime SessionOptions."""
+    if optimization_level not in GRAPH_OPTIMIZATION_LEVELS:
+        raise ValueError(f"Invalid graph optimization level: {optimization_level}")
+    if config.execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"Invalid execution mode: {config.execution_mode}")
+    options = ort.SessionOptions()
+    options.graph_optimization_level = getattr(ort.GraphOptimizationLevel, GRAPH_OPTIMIZATION_LEVELS[optimization_level])
+    options.execution_mode = getattr(ort.ExecutionMode, EXECUTION_MODES[config.execution_mode])
+    options.intra_op_num_threads = config.intra_op_num_threads
+    options.inter_op_num_threads = config.inter_op_num_threads
+    options.enable_cpu_mem_arena = config.enable_cpu_mem_arena
+    options.enable_mem_pattern = config.enable_mem_pattern
+    return options
+
+
+def model_hash(model_path: str) -> str:
+    """SHA-256 hex digest of a model file."""
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_model_path(model_path: str, config: SessionConfig, ort_version: str,
+                      providers: Sequence[Any] = ()) -> str:
+    """
+    Location of the optimized graph for a model in the cache directory.
+
+    The key covers the model contents, the optimization level, the onnxruntime version,
+    the machine architecture and the execution providers, since graphs optimized at the
+    'all' level may contain runtime-, hardware- and provider-specific kernels.
+    """
+    provider_key = ','.join(sorted(str(provider) for provider in providers))
+    key = hashlib.sha256(
+        f"{model_hash(model_path)}:{config.graph_optimization_level}:{ort_version}:{platform.machine()}:{provider_key}".encode()
+    ).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    return os.path.join(config.cache_dir, f"{stem}-{key}.onnx")
+
+
+def create_session(model_path: str, config: Optional[SessionConfig] = None) -> Any:
+    """
+    Build an onnxruntime inference session with tuned options.
+
+    Args:
+        model_path: Path to the ONNX model
+        config: Session options (defaults to SessionConfig())
+
+    Returns:
+        onnxruntime.InferenceSession: Session ready for `run`
+
+    Note:
+        With `config.cache_dir` set, the first call saves the optimized graph to the cache
+        and later calls load it with graph optimization disabled, skipping that cost.
+    """
+    import onnxruntime as ort
+    if config is None:
+        config = SessionConfig()
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model file not found: {model_path}")
+
+    kwargs: Dict[str, Any] = {}
+    if config.providers is not None:
+        kwargs['providers'] = config.providers
+
+    if config.cache_dir is None or config.graph_optimization_level == 'disable':
+        options = _session_options(ort, config, config.graph_optimization_level)
+        return ort.InferenceSession(model_path, sess_options=options, **kwargs)
+
+    os.makedirs(config.cache_dir, exist_ok=True)
+    # Without explicit providers onnxruntime uses every available one
+    providers = config.providers if config.providers is not None else ort.get_available_providers()
+    cached = cached_model_path(model_path, config, ort.__version__, providers)
+    if os.path.exists(cached):
+        try:
+            options = _session_options(ort, config, 'disable')
+            return ort.InferenceSession(cached, sess_options=options, **kwargs)
+        except Exception as e:
+            logger.warning(f"Ignoring unusable optimized model cache {cached}: {e}")
+
+    options = _session_options(ort, config, config.graph_optimization_level)
+    tmp_path = f"{cached}.{os.getpid()}.tmp"
+    options.optimized_model_filepath = tmp_path
+    session = ort.InferenceSession(model_path, sess_options=options, **kwargs)
+    if os.path.exists(tmp_path):
+        os.replace(tmp_path, cached)
+    return session
+
+
+def warm_up(session: Any, runs: int = 10) -> None:
+    """
+    Run the session on zero inputs so the first live frame runs at steady-state latency.
+
+    Args:
+        session: onnxruntime.InferenceSession (or any object with the same run/get_inputs API)
+        runs: Number of dummy runs
+
+    Note:
+        Dynamic dimensions are set to 1, matching the per-frame (1, 19) input.
+    """
+    if runs <= 0:
+        return
+    feeds = {}
+    for inp in session.get_inputs():
+        shape = [dim if isinstance(dim, int) and dim > 0 else 1 for dim in inp.shape]
+        feeds[inp.name] = np.zeros(shape, dtype=ONNX_TYPES.get(inp.type, np.float32))
+    for _ in range(runs):
+        session.run(None, feeds)
@@ -1,6 +1,6 @@
+import math
 import numpy as np
 import pickle
-from scipy.spatial.transform import Rotation
 from typing import Dict, List, Tuple, Optional
 
 # Constants
@@ -37,8 +37,19 @@ def recover_joint_position(cs: np.ndarray, link_length: float, flexion: float, a
     return t + R @ (link_length * dir_local)
 
 def rotation_matrix(axis: np.ndarray, theta: float) -> np.ndarray:
-    """Create rotation matrix using scipy's Rotation class."""
-    return Rotation.from_rotvec(axis * theta).as_matrix()
+    """Rotation matrix of the rotation vector axis * theta (Rodrigues' formula)."""
+    x, y, z = (float(v) * float(theta) for v in axis)
+    angle = math.sqrt(x * x + y * y + z * z)
+    if angle < 1e-12:
+        return np.eye(3)
+    x, y, z = x / angle, y / angle, z / angle
+    s, c = math.sin(angle), math.cos(angle)
+    t = 1.0 - c
+    return np.array([
+        [c + t * x * x, t * x * y - s * z, t * x * z + s * y],
+        [t * x * y + s * z, c + t * y * y, t * y * z - s * x],
+        [t * x * z - s * y, t * y * z + s * x, c + t * z * z],
+    ])
 
 def get_nested_value(data: dict, keys: List[str], default=None):
     """Safely get nested dictionary value."""
@@ -179,36 +190,274 @@ def process_finger_joints(hand_model: dict, pred_angles: dict, finger: str,
         prev_cs[:3, 3] = curr_pos
         fk_rot[curr_idx, ...] = rotated_cs
 
-def forward_kinematics(hand_model: dict, pred_angles: dict, hand_type: str = 'right') -> Tuple[np.ndarray, np.ndarray]:
+def apply_wrist_rotation(fk_joints: np.ndarray, fk_rot: np.ndarray, wrist_rotation: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rotate FK results about the wrist joint.
+    
+    fk_joints: (..., 21, 3), fk_rot: (..., 21, 3, 3), wrist_rotation: (3, 3) or (..., 3, 3),
+    e.g. `OrientationFilter.rotation_matrix()`.
+    """
+    wrist_rotation = np.asarray(wrist_rotation, dtype=np.float64)
+    wrist = fk_joints[..., :1, :]
+    fk_joints = wrist + np.einsum('...ij,...nj->...ni', wrist_rotation, fk_joints - wrist)
+    fk_rot = wrist_rotation[..., None, :, :] @ fk_rot
+    return fk_joints, fk_rot
+
+def forward_kinematics(hand_model: dict, pred_angles: dict, hand_type: str = 'right',
+                       wrist_rotation: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
     """
     Forward kinematics for the hand model.
+    
+    If wrist_rotation (3, 3) is given, the whole hand is rotated about the wrist joint.
+    Computed by `forward_kinematics_batch` with a single pose; angles missing from
+    pred_angles are taken as zero.
+    
+    Returns:
+        Tuple of joint positions (21, 3) and joint rotations (21, 3, 3)
+    """
+    pose = [get_nested_value(pred_angles, name.split('_'), 0.0) for name in DEFAULT_GT_ORDER]
+    fk_joints, fk_rot = forward_kinematics_batch(hand_model, pose, hand_type, wrist_rotation)
+    return fk_joints[0], fk_rot[0]
+
+def rotation_matrices(axes: np.ndarray, thetas: np.ndarray) -> np.ndarray:
     """
-    # Initialize output arrays
-    fk_joints = np.zeros((NUM_JOINTS, 3))
-    fk_rot = np.concatenate([np.eye(3)[None, ...]] * NUM_JOINTS, axis=0)
+    Batched rotation matrices for rotation vectors axes * thetas.
     
-    # Extract model parameters
+    Same convention as `rotation_matrix` (the rotation angle is |axis * theta|),
+    computed with Rodrigues' formula. axes: (N, 3), thetas: (N,). Returns (N, 3, 3).
+    """
+    if len(axes) == 1:
+        # Single pose (`forward_kinematics`): the scalar path avoids per-ufunc overhead
+        return rotation_matrix(axes[0], thetas[0])[None]
+    rotvec = np.asarray(axes, dtype=np.float64) * np.asarray(thetas, dtype=np.float64)[..., None]
+    angle = np.linalg.norm(rotvec, axis=-1)
+    k = rotvec / np.where(angle > 1e-12, angle, 1.0)[..., None]
+    K = np.zeros(rotvec.shape[:-1] + (3, 3))
+    K[..., 0, 1] = -k[..., 2]
+    K[..., 0, 2] = k[..., 1]
+    K[..., 1, 0] = k[..., 2]
+    K[..., 1, 2] = -k[..., 0]
+    K[..., 2, 0] = -k[..., 1]
+    K[..., 2, 1] = k[..., 0]
+    return np.eye(3) + np.sin(angle)[..., None, None] * K + (1.0 - np.cos(angle))[..., None, None] * (K @ K)
+
+def forward_kinematics_batch(hand_model: dict, angles: np.ndarray, hand_type: str = 'right',
+                             wrist_rotation: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized forward kinematics for many poses at once.
+    
+    The kinematic chain behind `forward_kinematics`, with angles given as an array in
+    DEFAULT_GT_ORDER instead of a nested dict.
+    
+    Args:
+        hand_model: Hand model for one hand (e.g. `load_hand_model(path)['right']`)
+        angles: Joint angles of shape (N, 22) or (22,) in DEFAULT_GT_ORDER
+        hand_type: 'left' or 'right'
+        wrist_rotation: Optional wrist orientation (3, 3) or (N, 3, 3) applied about the wrist joint
+        
+    Returns:
+        Tuple of joint positions (N, 21, 3) and joint rotations (N, 21, 3, 3)
+    """
+    angles = np.atleast_2d(np.asarray(angles, dtype=np.float64))
+    n = angles.shape[0]
+    order = {name: i for i, name in enumerate(DEFAULT_GT_ORDER)}
+    zeros = np.zeros(n)
+
+    def column(finger: str, joint: str, dof: str) -> np.ndarray:
+        i = order.get(f"{finger}_{joint}_{dof}")
+        return angles[:, i] if i is not None else zeros
+
+    fk_joints = np.zeros((n, NUM_JOINTS, 3))
+    fk_rot = np.tile(np.eye(3), (n, NUM_JOINTS, 1, 1))
     joint_names = hand_model['joint_names']
     hand_model_joint_pos = hand_model['joint_pos']
+    fk_joints[:, 0] = hand_model_joint_pos[0]
+    joint_map = build_joint_map(joint_names)
+
+    for f_idx, finger in enumerate(FINGER_NAMES):
+        names = joint_names[f_idx]
+        mcp_idx = joint_map[f"{finger}_{names[1]}"]
+        if finger == 'thumb':
+            wrist_cs = np.asarray(hand_model['all_coordinates'][0][0], dtype=np.float64)
+            calib_flexion = get_nested_value(hand_model, ['angles', 'thumb', 'wrist', 'flexion'])
+            calib_abduction = get_nested_value(hand_model, ['angles', 'thumb', 'wrist', 'abduction'])
+            if calib_flexion is None or calib_abduction is None:
+                raise ValueError("Missing calibration angles for thumb wrist joint")
+            abduction = column('thumb', 'wrist', 'abduction')
+            if hand_type == 'left':
+                abduction = -abduction
+                calib_abduction = -calib_abduction
+            flexion = column('thumb', 'wrist', 'flexion') + calib_flexion
+            abduction = abduction + calib_abduction
+            dir_local = np.stack([
+                -np.sin(abduction),
+                np.cos(abduction) * np.cos(flexion),
+                np.cos(abduction) * np.sin(flexion)
+            ], axis=-1)
+            link_length = hand_model['link_lengths'].get("wrist_to_thumb_mcp", 0.0)
+            fk_joints[:, mcp_idx] = wrist_cs[:3, 3] + link_length * dir_local @ wrist_cs[:3, :3].T
+        else:
+            fk_joints[:, mcp_idx] = hand_model_joint_pos[mcp_idx]
+
+        frame = np.tile(np.asarray(hand_model['all_coordinates'][f_idx][1], dtype=np.float64)[:3, :3], (n, 1, 1))
+        for j in range(2, len(names)):
+            prev_key = f"{finger}_{names[j-1]}"
+            curr_key = f"{finger}_{names[j]}"
+            has_abduction = f"{prev_key}_abduction" in order
+            flexion = column(finger, names[j-1], 'flexion')
+            abduction = column(finger, names[j-1], 'abduction')
+            if hand_type == 'left':
+                abduction = -abduction
+            if not has_abduction:
+                flexion = -flexion
+            if finger == 'thumb' and not has_abduction:
+                if hand_type == 'left':
+                    flexion = -flexion
+                rot = rotation_matrices(frame[:, :, 2], flexion)
+            else:
+                rot = rotation_matrices(frame[:, :, 2], abduction) @ rotation_matrices(frame[:, :, 0], flexion)
+            frame = rot @ frame
+            link_length = hand_model['link_lengths'].get(f"{prev_key}_to_{curr_key}", 0.0)
+            curr_idx = joint_map[curr_key]
+            fk_joints[:, curr_idx] = fk_joints[:, joint_map[prev_key]] + link_length * frame[:, :, 1]
+            fk_rot[:, curr_idx] = frame
+
+    if wrist_rotation is not None:
+        return apply_wrist_rotation(fk_joints, fk_rot, wrist_rotation)
+    return fk_joints, fk_rot
+
+def angles_to_dict(pose: np.ndarray) -> dict:
+    """Convert an angle vector in DEFAULT_GT_ORDER to the nested dict used by `forward_kinematics`."""
+    angle_dict = {}
+    for i, angle_name in enumerate(DEFAULT_GT_ORDER):
+        finger, joint, dof = angle_name.split('_')
+        angle_dict.setdefault(finger, {}).setdefault(joint, {})[dof] = pose[i]
+    return angle_dict
+
+class IncrementalForwardKinematics:
+    """
+    Forward kinematics that only recomputes the fingers whose angles changed.
     
-    # Set wrist position
-    fk_joints[0] = hand_model_joint_pos[0].copy()
+    Finger chains are independent: each one starts at its MCP joint, and the thumb MCP
+    depends only on the thumb wrist angles. The angles each finger was last computed
+    with are kept, and a finger is recomputed only if one of its angles moved by more
+    than `tolerance` since then, so slow drift still triggers an update. The result of
+    every finger equals `forward_kinematics` for the same angles.
     
-    # Build joint mapping
-    joint_map = build_joint_map(joint_names)
+    Attributes:
+        joints: Joint positions (21, 3) of the latest update
+        rotations: Joint rotations (21, 3, 3) of the latest update
     
-    # Process each finger
-    for f_idx, finger in enumerate(FINGER_NAMES):
-        # Handle MCP joint
+    Both are read-only views of internal buffers that later updates overwrite in place;
+    copy them to keep a pose.
+    """
+    
+    def __init__(self, hand_model: dict, hand_type: str = 'right', tolerance: float = 1e-3):
+        """
+        Args:
+            hand_model: Hand model for one hand (e.g. `load_hand_model(path)['right']`)
+            hand_type: 'left' or 'right'
+            tolerance: Largest angle change (radians) per finger that does not trigger a recomputation
+        """
+        self.hand_model = hand_model
+        self.hand_type = hand_type
+        self.tolerance = tolerance
+        self._joint_map = build_joint_map(hand_model['joint_names'])
+        self._finger_angles = {
+            finger: np.array([i for i, name in enumerate(DEFAULT_GT_ORDER) if name.split('_')[0] == finger])
+            for finger in FINGER_NAMES
+        }
+        # Joints a finger's angles move; the MCP of the four fingers is fixed in the hand model
+        self._finger_joints = {
+            finger: np.array(sorted(idx for key, idx in self._joint_map.items()
+                                    if key.split('_')[0] == finger and (finger == 'thumb' or not key.endswith('_mcp'))))
+            for finger in FINGER_NAMES
+        }
+        # Angles grouped by finger for one vectorized change check per update
+        self._group_order = np.concatenate([self._finger_angles[finger] for finger in FINGER_NAMES])
+        self._group_starts = np.cumsum([0] + [len(self._finger_angles[finger]) for finger in FINGER_NAMES[:-1]])
+        self._local_joints = np.zeros((NUM_JOINTS, 3))
+        self._local_rot = np.tile(np.eye(3), (NUM_JOINTS, 1, 1))
+        hand_model_joint_pos = hand_model['joint_pos']
+        self._local_joints[0] = hand_model_joint_pos[0]
+        for f_idx, finger in enumerate(FINGER_NAMES):
+            if finger != 'thumb':
+                mcp_idx = self._joint_map[f"{finger}_{hand_model['joint_names'][f_idx][1]}"]
+                self._local_joints[mcp_idx] = hand_model_joint_pos[mcp_idx]
+        # Results in the wrist-rotated frame; the local buffers themselves without a rotation
+        self._joints = self._local_joints
+        self._rot = self._local_rot
+        self.reset()
+    
+    @property
+    def joints(self) -> np.ndarray:
+        joints = self._joints.view()
+        joints.flags.writeable = False
+        return joints
+    
+    @property
+    def rotations(self) -> np.ndarray:
+        rotations = self._rot.view()
+        rotations.flags.writeable = False
+        return rotations
+    
+    def reset(self) -> None:
+        """Forget the cached angles; the next update recomputes and reports every joint."""
+        self._angles = np.full(len(DEFAULT_GT_ORDER), np.inf)
+        self._wrist_rotation: Optional[np.ndarray] = None
+        self._initialized = False
+    
+    def _compute_finger(self, finger: str, angles: np.ndarray) -> None:
+        pred_angles = {finger: {}}
+        for i, value in zip(self._finger_angles[finger], angles):
+            _, joint, dof = DEFAULT_GT_ORDER[i].split('_')
+            pred_angles[finger].setdefault(joint, {})[dof] = value
         if finger == 'thumb':
-            process_thumb_mcp(hand_model, pred_angles, joint_map, fk_joints, hand_type)
+            process_thumb_mcp(self.hand_model, pred_angles, self._joint_map, self._local_joints, self.hand_type)
+        process_finger_joints(self.hand_model, pred_angles, finger, self._joint_map,
+                              self._local_joints, self._local_rot, self.hand_type)
+    
+    def update(self, pose: np.ndarray, wrist_rotation: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Update the kinematics for a new pose.
+        
+        Args:
+            pose: Joint angles (22,) in DEFAULT_GT_ORDER
+            wrist_rotation: Optional wrist orientation (3, 3), as in `forward_kinematics`;
+                a change beyond the tolerance marks the whole hand dirty
+            
+        Returns:
+            np.ndarray: Sorted indices of the joints whose position or rotation changed
+                (all joints on the first update)
+        """
+        pose = np.asarray(pose, dtype=np.float64)
+        change = np.maximum.reduceat(np.abs(pose - self._angles)[self._group_order], self._group_starts)
+        dirty = []
+        for f_idx in np.flatnonzero(change > self.tolerance):
+            finger = FINGER_NAMES[f_idx]
+            angle_idx = self._finger_angles[finger]
+            self._angles[angle_idx] = pose[angle_idx]
+            self._compute_finger(finger, pose[angle_idx])
+            dirty.append(self._finger_joints[finger])
+        dirty = np.concatenate(dirty) if dirty else np.zeros(0, dtype=np.int64)
+        
+        if wrist_rotation is None:
+            rotation_changed = self._wrist_rotation is not None
+            self._wrist_rotation = None
+            self._joints, self._rot = self._local_joints, self._local_rot
         else:
-            mcp_name = joint_names[f_idx][1]
-            mcp_key = f"{finger}_{mcp_name}"
-            mcp_idx = joint_map[mcp_key]
-            fk_joints[mcp_idx] = hand_model_joint_pos[mcp_idx].copy()
+            wrist_rotation = np.asarray(wrist_rotation, dtype=np.float64)
+            rotation_changed = (self._wrist_rotation is None
+                                or np.abs(wrist_rotation - self._wrist_rotation).max() > self.tolerance)
+            if rotation_changed:
+                self._wrist_rotation = wrist_rotation
+                self._joints, self._rot = apply_wrist_rotation(self._local_joints, self._local_rot, wrist_rotation)
+            elif len(dirty):
+                wrist = self._local_joints[0]
+                self._joints[dirty] = wrist + (self._local_joints[dirty] - wrist) @ self._wrist_rotation.T
+                self._rot[dirty] = self._wrist_rotation @ self._local_rot[dirty]
         
-        # Process remaining finger joints
-        process_finger_joints(hand_model, pred_angles, finger, joint_map, fk_joints, fk_rot, hand_type)
-    
-    return fk_joints, fk_rot
+        if not self._initialized or rotation_changed:
+            self._initialized = True
+            return np.arange(NUM_JOINTS)
+        return np.sort(dirty)
@@ -1,9 +1,14 @@
 import numpy as np
 import pickle
-import open3d as o3d
+import logging
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from .utils import forward_kinematics, DEFAULT_GT_ORDER
-import queue
+from typing import Optional
+from .utils import forward_kinematics, angles_to_dict, DEFAULT_GT_ORDER, IncrementalForwardKinematics
+
+logger = logging.getLogger(__name__)
 
 class BaseHandVisualizer(ABC):
     """
@@ -46,18 +51,40 @@ class BaseHandVisualizer(ABC):
 class HandVisualizer(BaseHandVisualizer):
     """
     Visualizes a hand model using 3D rendering based on joint angles and calibration data.
+
+    Rendering is limited to a target frame rate. `update` only stores the pose in a
+    per-hand latest-value slot, so its cost does not depend on how slow rendering is.
+    Each render tick takes the newest pose of every hand that changed, skips poses that
+    were overwritten before they could be drawn, runs forward kinematics and moves the
+    existing meshes in place, and then makes a single renderer update for both hands.
+
+    By default the window is created by the constructor and the caller drives rendering
+    by calling `render_once()` from its main loop. With `threaded=True` a background
+    thread owns the window and renders on its own; this is experimental and not available
+    on macOS, where GLFW only allows windows on the main thread.
+
+    Attributes:
+        rendered_frames: Number of renderer updates made
+        dropped_poses: Number of poses overwritten before they were rendered
     """
     HAND_CONNECTIONS = [
         (0, 1), (1, 2), (2, 3), (3, 4), (0, 5), (5, 6), (6, 7), (7, 8),
         (0, 9), (9, 10), (10, 11), (11, 12), (0, 13), (13, 14), (14, 15), (15, 16),
         (0, 17), (17, 18), (18, 19), (19, 20)
     ]
+    HAND_TYPES = ('left', 'right')
 
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, target_fps: float = 60.0, window_name: str = 'OpenCyberGlove',
+                 angle_tolerance: float = 1e-3, threaded: bool = False):
         """
-        Initialize the HandVisualizer with hand model data.
+        Initialize the HandVisualizer with hand model data and open the window.
         Args:
             model_path (str): Path to the hand model file.
+            target_fps (float): Maximum rate of renderer updates.
+            window_name (str): Title of the visualization window.
+            angle_tolerance (float): Per-finger angle change (radians) below which a finger is not redrawn.
+            threaded (bool): Render on a background thread (experimental, not on macOS)
+                instead of from `render_once()` calls on the caller's thread.
         """
         super().__init__(model_path)
         self.hand_model = self._load_hand_model()
@@ -66,11 +93,44 @@ class HandVisualizer(BaseHandVisualizer):
         self.bone_radius = self.hand_model.get('bone_radius', 0.0025)
         self.joint_color = self.hand_model.get('joint_color', [0.9, 0.1, 0.1, 1.0])
         self.bone_color = self.hand_model.get('bone_color', [0.1, 0.1, 0.9, 1.0])
-        
-        # Visualization objects will be created in the background thread
-        self.vis = o3d.visualization.Visualizer()
-        self.vis.create_window()
+        self.target_fps = target_fps
+        self.window_name = window_name
+        self.rendered_frames = 0
+        # Only fingers whose angles changed are recomputed and redrawn
+        self._kinematics = {hand_type: IncrementalForwardKinematics(self.hand_model[hand_type], hand_type, angle_tolerance)
+                            for hand_type in self.HAND_TYPES}
+        self._connections = np.array(self.HAND_CONNECTIONS)
+        self.dropped_poses = 0
+
+        # Latest-value mailbox: one (sequence, pose) slot per hand
+        self._mailbox = {hand_type: (0, None) for hand_type in self.HAND_TYPES}
+        self._rendered_seq = {hand_type: 0 for hand_type in self.HAND_TYPES}
+        self._mailbox_lock = threading.Lock()
+
+        if threaded and sys.platform == 'darwin':
+            raise ValueError("GLFW windows must live on the main thread on macOS; use threaded=False")
+        self.threaded = threaded
+
+        # Visualization objects are created and used only by the rendering thread
+        self.vis = None
         self.node_map = {}
+        self._base_vertices = {}
+        self._camera_set = False
+        self._period = 1.0 / target_fps
+        self._next_tick = time.perf_counter()
+        self._window_open = False
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._render_thread: Optional[threading.Thread] = None
+        if threaded:
+            self._render_thread = threading.Thread(target=self._render_loop, name='HandVisualizer', daemon=True)
+            self._render_thread.start()
+            self._ready.wait()
+        else:
+            self._open_window()
+        if self._error is not None:
+            raise RuntimeError(f"Failed to open visualization window: {self._error}")
         
     def _load_hand_model(self) -> dict:
         """
@@ -114,14 +174,9 @@ class HandVisualizer(BaseHandVisualizer):
         """
         Initialize the hand model with default poses.
         """
-        # If no window was created, skip hand model initialization            
-        print("Creating initial hand poses...")
         init_angles = np.zeros(len(DEFAULT_GT_ORDER))
-        print("Updating right hand...")
         self.update(init_angles, hand_type='right')
-        print("Updating left hand...")
         self.update(init_angles, hand_type='left')
-        print("Hand model initialization complete")
     
     def get_joints(self, pose: np.ndarray, hand_type: str = 'right') -> np.ndarray:
         """
@@ -130,95 +185,206 @@ class HandVisualizer(BaseHandVisualizer):
             pose (np.ndarray): Array of joint angles.
             hand_type (str): Type of hand ('left' or 'right').
         """
-        angle_dict = {}
-        for i, angle_name in enumerate(DEFAULT_GT_ORDER):
-            finger, joint, dof = angle_name.split('_')
-            angle_dict.setdefault(finger, {}).setdefault(joint, {})[dof] = pose[i]
-        joints, _ = forward_kinematics(self.hand_model[hand_type], angle_dict, hand_type)
+        joints, _ = forward_kinematics(self.hand_model[hand_type], angles_to_dict(pose), hand_type)
         joints = joints / 1000
         return joints
     
     def update(self, pose: np.ndarray, hand_type: str = 'right') -> None:
         """
-        Update the visualization with a new hand pose.
+        Publish a new hand pose for rendering. Never blocks on the renderer.
         Args:
             pose (np.ndarray): Array of joint angles.
             hand_type (str): Type of hand ('left' or 'right').
         """ 
-        joints = self.get_joints(pose, hand_type)
-        
-        for idx, pos in enumerate(joints):
+        if hand_type not in self._mailbox:
+            raise ValueError(f"Invalid hand type: {hand_type}")
+        pose = np.array(pose, dtype=np.float64)
+        with self._mailbox_lock:
+            seq, _ = self._mailbox[hand_type]
+            self._mailbox[hand_type] = (seq + 1, pose)
+
+    @property
+    def is_running(self) -> bool:
+        """False once the window was closed or close() was called."""
+        if self._render_thread is not None:
+            return self._render_thread.is_alive()
+        return self._window_open
+
+    def render_once(self) -> bool:
+        """
+        Render a frame if one is due; call this regularly from the main loop when not threaded.
+
+        With a render thread this does nothing, so one main loop works in both modes.
+        Returns:
+            bool: False once the window was closed.
+        """
+        if self._render_thread is None and self._window_open and time.perf_counter() >= self._next_tick:
+            try:
+                if not self._render_frame():
+                    self._close_window()
+            except Exception:
+                self._close_window()
+                raise
+            self._next_tick = max(self._next_tick + self._period, time.perf_counter() - self._period)
+        return self.is_running
+
+    def _open_window(self) -> None:
+        """Create the Open3D window on the calling thread; errors are stored in `_error`."""
+        try:
+            import open3d as o3d
+            self.vis = o3d.visualization.Visualizer()
+            self.vis.create_window(window_name=self.window_name)
+            self._window_open = True
+        except BaseException as e:
+            self._error = e
+
+    def _close_window(self) -> None:
+        if self._window_open:
+            self._window_open = False
+            self.vis.destroy_window()
+
+    def _render_frame(self) -> bool:
+        """
+        Draw pending poses and make one renderer update.
+        Returns:
+            bool: False if the window was closed by the user.
+        """
+        updated = self._render_pending()
+        if updated and not self._camera_set:
+            self._add_camera_and_light()
+            self._camera_set = True
+        if not self.vis.poll_events():
+            return False
+        self.vis.update_renderer()
+        self.rendered_frames += 1
+        return True
+
+    def _render_loop(self) -> None:
+        """Own the Open3D window: create it, render at target_fps and destroy it on exit."""
+        self._open_window()
+        self._ready.set()
+        if self._error is not None:
+            return
+        try:
+            next_tick = time.perf_counter()
+            while not self._stop_event.is_set():
+                if not self._render_frame():
+                    break  # Window closed by the user
+                next_tick += self._period
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                else:
+                    next_tick = time.perf_counter()  # Running late: don't try to catch up
+        except Exception as e:
+            logger.error(f"Render thread stopped: {e}")
+        finally:
+            self._close_window()
+
+    def _render_pending(self) -> bool:
+        """
+        Move the meshes of every hand with a new pose in the mailbox.
+        Returns:
+            bool: True if any hand was updated.
+        """
+        with self._mailbox_lock:
+            pending = {hand_type: slot for hand_type, slot in self._mailbox.items()
+                       if slot[0] != self._rendered_seq[hand_type]}
+        for hand_type, (seq, pose) in pending.items():
+            self.dropped_poses += seq - self._rendered_seq[hand_type] - 1
+            self._rendered_seq[hand_type] = seq
+            kinematics = self._kinematics[hand_type]
+            dirty = kinematics.update(pose)
+            if len(dirty):
+                self._update_hand(kinematics.joints / 1000, hand_type, dirty)
+        return bool(pending)
+
+    def _update_hand(self, joints: np.ndarray, hand_type: str, dirty: Optional[np.ndarray] = None) -> None:
+        """
+        Update the joint and bone meshes of one hand (rendering thread only).
+        Args:
+            joints (np.ndarray): Joint positions in meters, shape (21, 3).
+            hand_type (str): Type of hand ('left' or 'right').
+            dirty (np.ndarray): Indices of the joints that moved; None updates all.
+        """
+        import open3d as o3d
+        if dirty is None:
+            dirty = np.arange(len(joints))
+        for idx in dirty:
+            pos = joints[idx]
             key = f'joint_{hand_type}_{idx}'
             if key not in self.node_map:
                 sphere = o3d.geometry.TriangleMesh.create_sphere(radius=self.joint_radius)
                 sphere.paint_uniform_color(self.joint_color[:3])  # Open3D uses RGB
+                self._base_vertices[key] = np.asarray(sphere.vertices).copy()
                 sphere.translate(pos)
                 self.node_map[key] = sphere
-                self.vis.add_geometry(self.node_map[key])
+                self.vis.add_geometry(sphere)
             else:
                 sphere = self.node_map[key]
-                # To move the sphere to a new absolute position, we compute
-                # the translation vector from its current center to the new position.
-                current_center = sphere.get_center()
-                required_translation = pos - current_center
-                sphere.translate(required_translation)
+                # Write the translated template vertices in place
+                np.add(self._base_vertices[key], pos, out=np.asarray(sphere.vertices))
                 self.vis.update_geometry(sphere)
                 
-        # Update bones
-        for i, j in self.HAND_CONNECTIONS:
+        # Update bones with at least one moved end
+        moved = np.zeros(len(joints), dtype=bool)
+        moved[dirty] = True
+        for i, j in self._connections[moved[self._connections].any(axis=1)]:
             key = f'bone_{hand_type}_{i}_{j}'
             self._add_bone(key, joints[i], joints[j])
-        self.vis.poll_events()
-        self.vis.update_renderer()
             
     def _add_bone(self, key: str, start: np.ndarray, end: np.ndarray) -> None:
         """
         Add or update a bone (cylinder) between two joints in the scene.
+
+        A unit-height cylinder is created once per bone; later updates scale, rotate and
+        translate its template vertices in place instead of rebuilding the mesh.
         Args:
             key (str): Unique key for the bone.
             start (np.ndarray): Start joint position.
             end (np.ndarray): End joint position.
         """
+        import open3d as o3d
         direction = end - start
         length = np.linalg.norm(direction)
         if length < 1e-6:
             return
-            
-        # Create cylinder using Open3D
-        cylinder = o3d.geometry.TriangleMesh.create_cylinder(
-            radius=self.bone_radius, height=length
-        )
-        cylinder.paint_uniform_color(self.bone_color[:3])  # Open3D uses RGB
         
         # Calculate rotation to align cylinder with direction
         z = direction / length
         y = np.array([0, 1, 0])
-        x = np.cross(y, z) if not (np.allclose(z, y) or np.allclose(z, -y)) else np.array([1, 0, 0])
+        x = np.cross(y, z) if not (np.allclose(z, y) or np.allclose(z, -y)) else np.array([1.0, 0, 0])
         x /= np.linalg.norm(x)
         y = np.cross(z, x)
         
-        # Create rotation matrix
-        rot = np.eye(4)
-        rot[:3, 0] = x
-        rot[:3, 1] = y
-        rot[:3, 2] = z
-        rot[:3, 3] = start + direction / 2
-        
-        # Apply transformation
-        cylinder.transform(rot)
+        # Rotation matrix with the length folded into the z axis
+        transform = np.stack([x, y, z * length], axis=1)
+        center = start + direction / 2
         
         if key in self.node_map:
-            # Remove old bone and add new one
-            self.vis.remove_geometry(self.node_map[key], False)
-            self.node_map[key] = cylinder
-            self.vis.add_geometry(cylinder, False)
+            cylinder = self.node_map[key]
+            vertices = np.asarray(cylinder.vertices)
+            np.matmul(self._base_vertices[key], transform.T, out=vertices)
+            vertices += center
+            self.vis.update_geometry(cylinder)
         else:
-            # Add new bone
+            # Create cylinder using Open3D
+            cylinder = o3d.geometry.TriangleMesh.create_cylinder(radius=self.bone_radius, height=1.0)
+            cylinder.paint_uniform_color(self.bone_color[:3])  # Open3D uses RGB
+            self._base_vertices[key] = np.asarray(cylinder.vertices).copy()
+            rot = np.eye(4)
+            rot[:3, :3] = transform
+            rot[:3, 3] = center
+            cylinder.transform(rot)
             self.node_map[key] = cylinder
             self.vis.add_geometry(cylinder, False)
 
     def close(self) -> None:
         """
-        Close the visualization viewer.
+        Stop the render thread (if any) and close the visualization viewer.
         """
-        self.vis.destroy_window()
+        self._stop_event.set()
+        if self._render_thread is not None:
+            self._render_thread.join()
+        else:
+            self._close_window()
@@ -17,6 +17,10 @@ setup(
         "open3d",
         "onnxruntime"
     ],
+    extras_require={
+        "numpy-backend": ["onnx"],
+        "test": ["pytest"],
+    },
     python_requires=">=3.7",
     url="https://github.com/CyberOrigin2077/open-cyber-glove",
     classifiers=[
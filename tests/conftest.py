@@ -0,0 +1,45 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from open_cyber_glove.utils import FINGER_NAMES, NUM_JOINTS
+
+
+def make_hand_model(seed: int) -> dict:
+    """Random hand model with the structure of the shipped hand_model.pkl."""
+    rng = np.random.default_rng(seed)
+
+    def frame():
+        q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+        cs = np.eye(4)
+        cs[:3, :3] = q * np.sign(np.diag(r))
+        cs[:3, :3] *= np.linalg.det(cs[:3, :3])
+        cs[:3, 3] = rng.normal(size=3) * 30
+        return cs
+
+    joint_names = [['wrist', 'mcp', 'pip', 'dip', 'tip'] for _ in FINGER_NAMES]
+    link_lengths = {'wrist_to_thumb_mcp': 45.0}
+    for finger, names in zip(FINGER_NAMES, joint_names):
+        for j in range(1, len(names) - 1):
+            link_lengths[f"{finger}_{names[j]}_to_{finger}_{names[j + 1]}"] = float(rng.uniform(15, 40))
+    return {
+        'joint_names': joint_names,
+        'all_coordinates': [[frame(), frame()] for _ in FINGER_NAMES],
+        'joint_pos': rng.normal(size=(NUM_JOINTS, 3)) * 40,
+        'link_lengths': link_lengths,
+        'angles': {'thumb': {'wrist': {'flexion': 0.3, 'abduction': 0.2}}},
+    }
+
+
+@pytest.fixture(scope='session')
+def hand_models() -> dict:
+    return {'left': make_hand_model(1), 'right': make_hand_model(2)}
+
+
+@pytest.fixture
+def hand_model_path(tmp_path, hand_models) -> str:
+    path = tmp_path / 'hand_model.pkl'
+    with open(path, 'wb') as f:
+        pickle.dump(hand_models, f)
+    return str(path)
@@ -0,0 +1,102 @@
+import numpy as np
+
+from open_cyber_glove.cache import InferenceCache
+
+
+class CountingModel:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        def compute():
+            self.calls += 1
+            return np.asarray(x, dtype=np.float64) * 2.0
+        return compute
+
+
+def lookup(cache, model, x, owner=None):
+    return cache.get_or_compute(np.asarray(x, dtype=np.float64), model(x), owner)
+
+
+def test_change_gate_hit_within_tolerance():
+    cache = InferenceCache(tolerance=8.0, maxsize=0)
+    model = CountingModel()
+    first = lookup(cache, model, [100.0, 200.0])
+    again = lookup(cache, model, [105.0, 195.0])
+    assert model.calls == 1
+    np.testing.assert_array_equal(again, first)
+    assert cache.stats()['gate_hits'] == 1
+
+
+def test_change_gate_miss_beyond_tolerance():
+    cache = InferenceCache(tolerance=8.0, maxsize=0)
+    model = CountingModel()
+    lookup(cache, model, [100.0, 200.0])
+    result = lookup(cache, model, [100.0, 209.0])
+    assert model.calls == 2
+    np.testing.assert_array_equal(result, [200.0, 418.0])
+
+
+def test_gate_compares_against_anchor_not_last_frame():
+    cache = InferenceCache(tolerance=8.0, maxsize=0)
+    model = CountingModel()
+    # Slow drift: every step is within tolerance of the previous frame
+    for x in (100.0, 105.0, 110.0):
+        lookup(cache, model, [x])
+    assert model.calls == 2
+
+
+def test_per_channel_tolerance():
+    cache = InferenceCache(tolerance=[1.0, 100.0], maxsize=0)
+    model = CountingModel()
+    lookup(cache, model, [0.0, 0.0])
+    lookup(cache, model, [0.5, 50.0])
+    assert model.calls == 1
+    lookup(cache, model, [1.5, 0.0])
+    assert model.calls == 2
+
+
+def test_lru_hit_when_returning_to_a_pose():
+    cache = InferenceCache(tolerance=8.0, maxsize=4)
+    model = CountingModel()
+    lookup(cache, model, [100.0])
+    lookup(cache, model, [300.0])
+    result = lookup(cache, model, [101.0])
+    assert model.calls == 2
+    np.testing.assert_array_equal(result, [200.0])
+    assert cache.stats()['lru_hits'] == 1
+    # The LRU hit re-anchors the gate on the cached input
+    lookup(cache, model, [106.0])
+    assert model.calls == 2
+
+
+def test_lru_evicts_least_recently_used():
+    cache = InferenceCache(tolerance=8.0, maxsize=2)
+    model = CountingModel()
+    for x in (100.0, 300.0, 100.0, 500.0):
+        lookup(cache, model, [x])
+    assert model.calls == 3
+    assert cache.stats()['entries'] == 2
+    lookup(cache, model, [100.0])
+    assert model.calls == 3
+    lookup(cache, model, [300.0])
+    assert model.calls == 4
+
+
+def test_results_are_copies():
+    cache = InferenceCache(tolerance=8.0)
+    model = CountingModel()
+    result = lookup(cache, model, [100.0])
+    result[:] = 0.0
+    np.testing.assert_array_equal(lookup(cache, model, [100.0]), [200.0])
+
+
+def test_owner_change_clears_cache():
+    cache = InferenceCache(tolerance=8.0)
+    model = CountingModel()
+    owner_a, owner_b = object(), object()
+    lookup(cache, model, [100.0], owner_a)
+    lookup(cache, model, [100.0], owner_a)
+    lookup(cache, model, [100.0], owner_b)
+    assert model.calls == 2
+    assert cache.hit_rate == 1 / 3
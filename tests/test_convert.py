@@ -0,0 +1,125 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from open_cyber_glove.convert import PROGRESS_FILE, convert, unwrap_timestamps
+from open_cyber_glove.glove import Glove, PACKET_DTYPE
+from open_cyber_glove.linear import LinearModel
+from open_cyber_glove.utils import DEFAULT_GT_ORDER, forward_kinematics_batch
+
+NUM_FRAMES = 1000
+CHUNK_SIZE = 128
+
+
+def write_calibration(path: str, seed: int) -> Glove:
+    rng = np.random.default_rng(seed)
+    glove = Glove('right')
+    glove.min_val = rng.integers(1000, 2000, Glove.NUM_TENSILE_SENSORS).tolist()
+    glove.max_val = rng.integers(7000, 9000, Glove.NUM_TENSILE_SENSORS).tolist()
+    glove.avg_val = rng.uniform(3000, 5000, Glove.NUM_TENSILE_SENSORS)
+    glove.save_calibration(path)
+    return glove
+
+
+@pytest.fixture
+def inputs(tmp_path, hand_model_path):
+    rng = np.random.default_rng(0)
+    packets = np.zeros(NUM_FRAMES, dtype=PACKET_DTYPE)
+    packets['tensile'] = rng.integers(1000, 9000, (NUM_FRAMES, Glove.NUM_TENSILE_SENSORS))
+    # 120 Hz with a uint32 wrap in the middle of the recording
+    packets['timestamp'] = (np.arange(NUM_FRAMES) * 8333 + (1 << 32) - 4_000_000) % (1 << 32)
+    packets.tofile(tmp_path / 'recording.bin')
+    model = LinearModel(rng.normal(0, 0.1, (Glove.NUM_TENSILE_SENSORS, len(DEFAULT_GT_ORDER))),
+                        rng.normal(0, 0.1, len(DEFAULT_GT_ORDER)))
+    model.save(str(tmp_path / 'linear.npz'))
+    return {
+        'recording': str(tmp_path / 'recording.bin'),
+        'calibration': str(tmp_path / 'calib.npz'),
+        'model': str(tmp_path / 'linear.npz'),
+        'out': str(tmp_path / 'out'),
+        'hand_model': hand_model_path,
+        'packets': packets,
+        'linear_model': model,
+        'glove': write_calibration(str(tmp_path / 'calib.npz'), seed=1),
+    }
+
+
+def run(inputs, **overrides):
+    kwargs = {key: inputs[key] for key in ('recording', 'calibration', 'model', 'out', 'hand_model')}
+    kwargs.update(method='linear', chunk_size=CHUNK_SIZE, workers=2, progress=False)
+    kwargs.update(overrides)
+    return convert(**kwargs)
+
+
+def load(out: str, name: str) -> np.ndarray:
+    return np.load(os.path.join(out, f"{name}.npy"))
+
+
+def test_convert_outputs(inputs, hand_models):
+    stats = run(inputs)
+    assert stats['frames'] == NUM_FRAMES
+    packets = inputs['packets']
+    expected = inputs['glove'].fused_linear_model(inputs['linear_model']).predict(packets['tensile'])
+    angles = load(inputs['out'], 'angles')
+    np.testing.assert_allclose(angles, expected, rtol=1e-5, atol=1e-5)
+    joints, _ = forward_kinematics_batch(hand_models['right'], angles, 'right')
+    np.testing.assert_allclose(load(inputs['out'], 'joints'), joints / 1000, atol=1e-6)
+    np.testing.assert_array_equal(load(inputs['out'], 'device_timestamp'), packets['timestamp'])
+    np.testing.assert_allclose(load(inputs['out'], 'time'), np.arange(NUM_FRAMES) * 8333e-6)
+
+
+def test_unwrap_timestamps():
+    ts = np.array([(1 << 32) - 10, (1 << 32) - 5, 0, 5], dtype=np.uint32)
+    np.testing.assert_allclose(unwrap_timestamps(ts), [0.0, 5e-6, 10e-6, 15e-6])
+
+
+def test_resume_converts_only_missing_chunks(inputs):
+    run(inputs)
+    expected = load(inputs['out'], 'angles')
+    progress_path = os.path.join(inputs['out'], PROGRESS_FILE)
+    with open(progress_path) as f:
+        progress = json.load(f)
+    # Simulate an interrupted run: only the first three chunks finished
+    progress['done'] = [0, 1, 2]
+    with open(progress_path, 'w') as f:
+        json.dump(progress, f)
+    angles = np.load(os.path.join(inputs['out'], 'angles.npy'), mmap_mode='r+')
+    angles[3 * CHUNK_SIZE:] = 0
+    angles.flush()
+    del angles
+
+    stats = run(inputs, resume=True)
+    assert stats['frames'] == NUM_FRAMES - 3 * CHUNK_SIZE
+    np.testing.assert_array_equal(load(inputs['out'], 'angles'), expected)
+    with open(progress_path) as f:
+        assert json.load(f)['done'] == list(range(-(-NUM_FRAMES // CHUNK_SIZE)))
+
+
+def test_resume_of_finished_run_converts_nothing(inputs):
+    run(inputs)
+    assert run(inputs, resume=True)['frames'] == 0
+
+
+def test_resume_restarts_when_calibration_changes(inputs):
+    run(inputs)
+    glove = write_calibration(inputs['calibration'], seed=2)
+    stats = run(inputs, resume=True)
+    assert stats['frames'] == NUM_FRAMES
+    expected = glove.fused_linear_model(inputs['linear_model']).predict(inputs['packets']['tensile'])
+    np.testing.assert_allclose(load(inputs['out'], 'angles'), expected, rtol=1e-5, atol=1e-5)
+
+
+def test_resume_restarts_when_model_changes(inputs):
+    run(inputs)
+    model = LinearModel(inputs['linear_model'].weights * 2, inputs['linear_model'].bias)
+    model.save(inputs['model'])
+    assert run(inputs, resume=True)['frames'] == NUM_FRAMES
+
+
+def test_resume_restarts_when_joints_are_added(inputs):
+    run(inputs, hand_model=None)
+    assert not os.path.exists(os.path.join(inputs['out'], 'joints.npy'))
+    assert run(inputs, resume=True)['frames'] == NUM_FRAMES
+    assert load(inputs['out'], 'joints').any()
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from open_cyber_glove.gesture import GestureDetector
+
+TEMPLATE_LENGTH = 20
+
+
+def circle_template() -> np.ndarray:
+    t = np.linspace(0.0, 1.0, TEMPLATE_LENGTH)
+    return np.stack([np.sin(2 * np.pi * t), 0.5 * np.cos(2 * np.pi * t), t], axis=1)
+
+
+def noise(rng, n: int) -> np.ndarray:
+    return rng.normal(0.0, 0.02, (n, 3))
+
+
+def subsequence_dtw_scores(stream: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """Brute-force open-begin DTW: cost / path length of the best match ending at every frame."""
+    cost = np.full((len(stream), len(template)), np.inf)
+    length = np.zeros_like(cost)
+    for i in range(len(stream)):
+        for j in range(len(template)):
+            d = np.sum((stream[i] - template[j]) ** 2)
+            if j == 0:
+                cost[i, j], length[i, j] = d, 1
+                continue
+            options = [(cost[i, j - 1], length[i, j - 1])]
+            if i > 0:
+                options += [(cost[i - 1, j - 1], length[i - 1, j - 1]), (cost[i - 1, j], length[i - 1, j])]
+            c, n = min(options, key=lambda option: option[0])
+            cost[i, j], length[i, j] = d + c, n + 1
+    return cost[:, -1] / length[:, -1]
+
+
+def detect(detector: GestureDetector, stream: np.ndarray):
+    events = []
+    for i, x in enumerate(stream):
+        events += [(i, event) for event in detector.update(x, timestamp=i * 0.01)]
+    return events
+
+
+def test_dtw_detects_occurrences_at_their_end():
+    rng = np.random.default_rng(0)
+    template = circle_template()
+    stretched = np.repeat(template, 2, axis=0)
+    stream = np.concatenate([noise(rng, 40), template, noise(rng, 40), stretched, noise(rng, 40)])
+    ends = [40 + len(template) - 1, 40 + len(template) + 40 + len(stretched) - 1]
+    detector = GestureDetector(3, method='dtw', refractory=0.1)
+    detector.register('circle', template, threshold=0.01)
+    events = detect(detector, stream)
+    assert [event.name for _, event in events] == ['circle', 'circle']
+    for (frame, _), end in zip(events, ends):
+        # The score drops below the threshold as the last template frames are matched
+        assert end - 3 <= frame <= end
+
+
+def test_dtw_scores_match_brute_force():
+    rng = np.random.default_rng(1)
+    template = circle_template()
+    stream = np.concatenate([noise(rng, 30), template[::2], noise(rng, 30)])
+    reference = subsequence_dtw_scores(stream, template)
+    best = int(np.argmin(reference))
+    detector = GestureDetector(3, method='dtw')
+    detector.register('circle', template, threshold=reference[best] + 1e-9)
+    events = detect(detector, stream)
+    assert len(events) == 1
+    frame, event = events[0]
+    assert frame == best
+    assert event.score == pytest.approx(reference[best], rel=1e-9)
+
+
+def test_dtw_templates_of_different_lengths():
+    rng = np.random.default_rng(2)
+    long_template = circle_template()
+    short_template = np.stack([np.linspace(-1, 1, 7), np.zeros(7), np.full(7, -1.0)], axis=1)
+    stream = np.concatenate([noise(rng, 20), short_template, noise(rng, 20), long_template, noise(rng, 20)])
+    detector = GestureDetector(3, method='dtw', refractory=0.1)
+    detector.register('circle', long_template, threshold=0.01)
+    detector.register('swipe', short_template, threshold=0.01)
+    names = [event.name for _, event in detect(detector, stream)]
+    assert names == ['swipe', 'circle']
+
+
+def test_euclidean_detects_exact_window():
+    rng = np.random.default_rng(3)
+    template = circle_template()
+    stream = np.concatenate([noise(rng, 40), template, noise(rng, 40)])
+    detector = GestureDetector(3, window=TEMPLATE_LENGTH, method='euclidean')
+    detector.register('circle', template, threshold=0.01)
+    events = detect(detector, stream)
+    assert [frame for frame, _ in events] == [40 + TEMPLATE_LENGTH - 1]
+
+
+def test_refractory_suppresses_repeated_detections():
+    pose = np.array([0.5, -0.5, 1.0])
+    detector = GestureDetector(3, method='dtw', refractory=0.5)
+    detector.register('hold', pose, threshold=0.01)
+    events = detect(detector, np.tile(pose, (100, 1)))
+    # 100 frames at 10 ms: one detection every 0.5 s
+    assert [frame for frame, _ in events] == [0, 50]
+
+
+def test_callbacks_receive_events():
+    received = []
+    detector = GestureDetector(3, method='dtw')
+    detector.add_callback(received.append)
+    detector.register('hold', np.zeros(3), threshold=0.01, callback=received.append)
+    detector.update(np.zeros(3), timestamp=1.0)
+    assert [event.name for event in received] == ['hold', 'hold']
+
+
+def test_register_validates_shape():
+    detector = GestureDetector(3)
+    with pytest.raises(ValueError):
+        detector.register('bad', np.zeros((5, 4)), threshold=1.0)
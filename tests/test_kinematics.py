@@ -0,0 +1,179 @@
+import numpy as np
+import pytest
+
+from open_cyber_glove.orientation import quaternion_to_matrix
+from open_cyber_glove.utils import (
+    DEFAULT_GT_ORDER, FINGER_NAMES, NUM_JOINTS, IncrementalForwardKinematics, angles_to_dict, build_joint_map,
+    forward_kinematics, forward_kinematics_batch, process_finger_joints, process_thumb_mcp, rotation_matrices,
+    rotation_matrix,
+)
+
+HAND_TYPES = ('left', 'right')
+
+
+def reference_forward_kinematics(hand_model: dict, pred_angles: dict, hand_type: str):
+    """Joint-by-joint chain on the nested angle dict, independent of the batched code."""
+    joints = np.zeros((NUM_JOINTS, 3))
+    rotations = np.tile(np.eye(3), (NUM_JOINTS, 1, 1))
+    joints[0] = hand_model['joint_pos'][0]
+    joint_map = build_joint_map(hand_model['joint_names'])
+    for f_idx, finger in enumerate(FINGER_NAMES):
+        if finger == 'thumb':
+            process_thumb_mcp(hand_model, pred_angles, joint_map, joints, hand_type)
+        else:
+            mcp_idx = joint_map[f"{finger}_{hand_model['joint_names'][f_idx][1]}"]
+            joints[mcp_idx] = hand_model['joint_pos'][mcp_idx]
+        process_finger_joints(hand_model, pred_angles, finger, joint_map, joints, rotations, hand_type)
+    return joints, rotations
+
+
+def random_poses(n: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).uniform(-0.6, 0.6, (n, len(DEFAULT_GT_ORDER)))
+
+
+def random_rotations(n: int, seed: int = 0) -> np.ndarray:
+    q = np.random.default_rng(seed).normal(size=(n, 4))
+    return quaternion_to_matrix(q / np.linalg.norm(q, axis=1, keepdims=True))
+
+
+def test_rotation_matrices_match_scalar_version():
+    rng = np.random.default_rng(0)
+    axes = rng.normal(size=(16, 3))
+    thetas = rng.uniform(-3, 3, 16)
+    thetas[0] = 0.0
+    batch = rotation_matrices(axes, thetas)
+    for axis, theta, rot in zip(axes, thetas, batch):
+        np.testing.assert_allclose(rot, rotation_matrix(axis, theta), atol=1e-12)
+    np.testing.assert_allclose(rotation_matrices(axes[1:2], thetas[1:2])[0], batch[1], atol=1e-12)
+
+
+@pytest.mark.parametrize('hand_type', HAND_TYPES)
+def test_forward_kinematics_shapes(hand_models, hand_type):
+    joints, rotations = forward_kinematics(hand_models[hand_type], angles_to_dict(random_poses(1)[0]), hand_type)
+    assert joints.shape == (NUM_JOINTS, 3)
+    assert rotations.shape == (NUM_JOINTS, 3, 3)
+    np.testing.assert_allclose(rotations @ rotations.transpose(0, 2, 1), np.broadcast_to(np.eye(3), rotations.shape),
+                               atol=1e-9)
+
+
+@pytest.mark.parametrize('hand_type', HAND_TYPES)
+def test_forward_kinematics_matches_reference_chain(hand_models, hand_type):
+    hand_model = hand_models[hand_type]
+    for pose in random_poses(8, seed=2):
+        joints, rotations = forward_kinematics(hand_model, angles_to_dict(pose), hand_type)
+        ref_joints, ref_rotations = reference_forward_kinematics(hand_model, angles_to_dict(pose), hand_type)
+        np.testing.assert_allclose(joints, ref_joints, atol=1e-9)
+        np.testing.assert_allclose(rotations, ref_rotations, atol=1e-12)
+
+
+@pytest.mark.parametrize('hand_type', HAND_TYPES)
+def test_batch_matches_single_pose(hand_models, hand_type):
+    hand_model = hand_models[hand_type]
+    poses = random_poses(8)
+    joints, rotations = forward_kinematics_batch(hand_model, poses, hand_type)
+    assert joints.shape == (8, NUM_JOINTS, 3)
+    for pose, batch_joints, batch_rotations in zip(poses, joints, rotations):
+        single_joints, single_rotations = forward_kinematics(hand_model, angles_to_dict(pose), hand_type)
+        np.testing.assert_allclose(batch_joints, single_joints, atol=1e-9)
+        np.testing.assert_allclose(batch_rotations, single_rotations, atol=1e-12)
+
+
+@pytest.mark.parametrize('hand_type', HAND_TYPES)
+def test_batch_with_per_frame_wrist_rotation(hand_models, hand_type):
+    hand_model = hand_models[hand_type]
+    poses = random_poses(4, seed=1)
+    wrist_rotations = random_rotations(4)
+    joints, rotations = forward_kinematics_batch(hand_model, poses, hand_type, wrist_rotations)
+    for i, pose in enumerate(poses):
+        single_joints, single_rotations = forward_kinematics(hand_model, angles_to_dict(pose), hand_type,
+                                                             wrist_rotations[i])
+        np.testing.assert_allclose(joints[i], single_joints, atol=1e-9)
+        np.testing.assert_allclose(rotations[i], single_rotations, atol=1e-12)
+    # The wrist stays in place
+    np.testing.assert_allclose(joints[:, 0], np.broadcast_to(hand_model['joint_pos'][0], (4, 3)))
+
+
+def test_missing_angles_are_zero(hand_models):
+    hand_model = hand_models['right']
+    pose = random_poses(1)[0]
+    pose[[i for i, name in enumerate(DEFAULT_GT_ORDER) if name.startswith('pinky')]] = 0.0
+    partial = {finger: joints for finger, joints in angles_to_dict(pose).items() if finger != 'pinky'}
+    expected = forward_kinematics(hand_model, angles_to_dict(pose))
+    actual = forward_kinematics(hand_model, partial)
+    np.testing.assert_allclose(actual[0], expected[0])
+    np.testing.assert_allclose(actual[1], expected[1])
+
+
+def finger_angles(finger: str) -> list:
+    return [i for i, name in enumerate(DEFAULT_GT_ORDER) if name.startswith(finger)]
+
+
+def mixed_poses(seed: int = 3) -> list:
+    """A random start, then single-finger moves, repeats and full-hand changes."""
+    rng = np.random.default_rng(seed)
+    pose = random_poses(1, seed)[0]
+    poses = [pose.copy()]
+    for step in range(12):
+        if step % 4 == 3:
+            pose = random_poses(1, seed + step)[0]
+        elif step % 4 != 2:
+            pose[finger_angles(FINGER_NAMES[step % len(FINGER_NAMES)])] += rng.uniform(-0.2, 0.2)
+        poses.append(pose.copy())
+    return poses
+
+
+@pytest.mark.parametrize('hand_type', HAND_TYPES)
+def test_incremental_matches_forward_kinematics(hand_models, hand_type):
+    hand_model = hand_models[hand_type]
+    fk = IncrementalForwardKinematics(hand_model, hand_type, tolerance=0.0)
+    for pose in mixed_poses():
+        fk.update(pose)
+        joints, rotations = forward_kinematics(hand_model, angles_to_dict(pose), hand_type)
+        np.testing.assert_allclose(fk.joints, joints, atol=1e-9)
+        np.testing.assert_allclose(fk.rotations, rotations, atol=1e-12)
+
+
+@pytest.mark.parametrize('hand_type', HAND_TYPES)
+def test_incremental_matches_forward_kinematics_with_wrist_rotation(hand_models, hand_type):
+    hand_model = hand_models[hand_type]
+    fk = IncrementalForwardKinematics(hand_model, hand_type, tolerance=0.0)
+    wrist_rotations = random_rotations(3, seed=4)
+    for i, pose in enumerate(mixed_poses()):
+        # Hold each rotation for a few frames, with a frame without rotation in between
+        wrist_rotation = None if i == 6 else wrist_rotations[i // 5]
+        fk.update(pose, wrist_rotation)
+        joints, rotations = forward_kinematics(hand_model, angles_to_dict(pose), hand_type, wrist_rotation)
+        np.testing.assert_allclose(fk.joints, joints, atol=1e-9)
+        np.testing.assert_allclose(fk.rotations, rotations, atol=1e-12)
+
+
+def test_incremental_results_are_read_only(hand_models):
+    fk = IncrementalForwardKinematics(hand_models['right'])
+    fk.update(random_poses(1)[0], random_rotations(1)[0])
+    with pytest.raises(ValueError):
+        fk.joints[0] = 0.0
+    with pytest.raises(ValueError):
+        fk.rotations[0] = np.eye(3)
+
+
+def test_incremental_reports_dirty_joints(hand_models):
+    hand_model = hand_models['right']
+    joint_map = build_joint_map(hand_model['joint_names'])
+    fk = IncrementalForwardKinematics(hand_model)
+    pose = random_poses(1)[0]
+    np.testing.assert_array_equal(fk.update(pose), np.arange(NUM_JOINTS))
+    assert len(fk.update(pose)) == 0
+    # Moves below the tolerance are ignored
+    pose[finger_angles('index')] += 1e-4
+    assert len(fk.update(pose)) == 0
+    # The MCP of the four fingers is fixed; the thumb MCP follows its wrist angles
+    pose[finger_angles('index')] += 0.1
+    assert fk.update(pose).tolist() == sorted(joint_map[f"index_{joint}"] for joint in ('pip', 'dip', 'tip'))
+    pose[finger_angles('thumb')] += 0.1
+    assert fk.update(pose).tolist() == sorted(joint_map[f"thumb_{joint}"] for joint in ('mcp', 'pip', 'dip', 'tip'))
+    # A new wrist rotation moves the whole hand, the same one again nothing
+    wrist_rotation = random_rotations(1)[0]
+    np.testing.assert_array_equal(fk.update(pose, wrist_rotation), np.arange(NUM_JOINTS))
+    assert len(fk.update(pose, wrist_rotation)) == 0
+    fk.reset()
+    np.testing.assert_array_equal(fk.update(pose, wrist_rotation), np.arange(NUM_JOINTS))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from open_cyber_glove.prediction import DeviceClock, PosePredictor
+
+
+def test_device_clock_tracks_minimum_offset():
+    clock = DeviceClock(drift_rate=0.0)
+    # Device samples every 10 ms; the host receives them 5 ms later plus jitter
+    jitter = [0.004, 0.0, 0.002, 0.007, 0.001]
+    for i, extra in enumerate(jitter):
+        clock.update(i * 10_000, 100.0 + i * 0.01 + 0.005 + extra)
+    assert clock.offset == pytest.approx(100.005)
+    assert clock.to_host(0.05) == pytest.approx(100.055)
+
+
+def test_device_clock_maps_to_least_delayed_packet():
+    clock = DeviceClock(drift_rate=0.0)
+    clock.update(0, 10.003)
+    host = clock.update(10_000, 10.011)
+    assert host == pytest.approx(10.001 + 0.01)
+
+
+def test_device_clock_unwraps_timestamps():
+    clock = DeviceClock()
+    last = DeviceClock.WRAP - 1000
+    assert clock.unwrap(last) == pytest.approx(last * 1e-6)
+    assert clock.unwrap(500) == pytest.approx((DeviceClock.WRAP + 500) * 1e-6)
+
+
+def test_device_clock_relaxes_towards_drift():
+    # The device clock runs 500 ppm slow: every packet arrives with a slightly larger offset
+    clock = DeviceClock(drift_rate=1e-3)
+    for i in range(101):
+        clock.update(i * 10_000, 1.0 + i * 0.01 * 1.0005)
+    assert clock.offset == pytest.approx(1.0 + 100 * 0.01 * 0.0005)
+    # Faster drift than drift_rate: the estimate rises at drift_rate only
+    clock = DeviceClock(drift_rate=1e-4)
+    for i in range(101):
+        clock.update(i * 10_000, 1.0 + i * 0.01 * 1.0005)
+    assert clock.offset == pytest.approx(1.0 + 1e-4 * 100 * 0.01 * 1.0005)
+
+
+def test_predictor_uses_pipeline_delay_as_default_horizon():
+    predictor = PosePredictor(num_angles=1, transport_latency=0.0, delay_smoothing=1.0)
+    for i in range(6):
+        t = i * 0.01
+        predictor.update(np.array([t]), int(t * 1e6), 50.0 + t, done_time=50.0 + t + 0.02)
+    assert predictor.pipeline_delay == pytest.approx(0.02)
+    assert predictor.predict()[0] == pytest.approx(0.05 + 0.02)
+    assert predictor.predict(predictor.latest_time + 0.03)[0] == pytest.approx(0.05 + 0.03)
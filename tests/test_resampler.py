@@ -0,0 +1,174 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from open_cyber_glove.resampler import Resampler
+from open_cyber_glove.sdk import OpenCyberGlove
+
+PERIOD = 8333e-6  # ~120 Hz in whole device microseconds
+OFFSET = 50.0  # Host time of device time zero
+
+
+def feed(resampler: Resampler, values, jitter=None) -> np.ndarray:
+    """Push samples at 120 Hz; returns their host sample times."""
+    times = np.arange(len(values)) * PERIOD
+    for i, (t, v) in enumerate(zip(times, values)):
+        extra = 0.0 if jitter is None else jitter[i]
+        resampler.push(np.atleast_1d(v), int(round(t * 1e6)), OFFSET + t + extra)
+    return OFFSET + times
+
+
+def make(method: str, **kwargs) -> Resampler:
+    kwargs.setdefault('transport_latency', 0.0)
+    return Resampler(num_values=1, method=method, **kwargs)
+
+
+def test_linear_interpolation_is_exact_on_a_ramp():
+    resampler = make('linear')
+    times = feed(resampler, 2.0 * np.arange(8))
+    for t in np.linspace(times[0], times[-1], 50):
+        assert resampler.sample(t)[0] == pytest.approx(2.0 * (t - OFFSET) / PERIOD, abs=1e-6)
+
+
+@pytest.mark.parametrize('method', Resampler.METHODS)
+def test_interpolation_passes_through_samples(method):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=8)
+    resampler = make(method)
+    times = feed(resampler, values)
+    for t, v in zip(times[:-1], values[:-1]):
+        assert resampler.sample(t)[0] == pytest.approx(v, abs=1e-9)
+
+
+def test_cubic_hermite_is_exact_on_a_quadratic_inside_the_buffer():
+    resampler = make('cubic')
+    k = np.arange(8)
+    times = feed(resampler, (k - 3.0) ** 2)
+    # Central-difference tangents are exact for a quadratic on a uniform grid; the first
+    # and last intervals use one-sided tangents
+    for t in np.linspace(times[1], times[-2], 41):
+        u = (t - OFFSET) / PERIOD
+        assert resampler.sample(t)[0] == pytest.approx((u - 3.0) ** 2, abs=1e-6)
+
+
+def test_cubic_is_smoother_than_linear_on_a_sine():
+    k = np.arange(8)
+    values = np.sin(0.4 * k)
+    linear, cubic = make('linear'), make('cubic')
+    times = feed(linear, values)
+    feed(cubic, values)
+    query = np.linspace(times[1], times[-2], 60)
+    truth = np.sin(0.4 * (query - OFFSET) / PERIOD)
+    linear_error = np.abs([linear.sample(t)[0] for t in query] - truth).max()
+    cubic_error = np.abs([cubic.sample(t)[0] for t in query] - truth).max()
+    assert cubic_error < linear_error / 4
+
+
+@pytest.mark.parametrize('method', Resampler.METHODS)
+def test_extrapolation_is_bounded(method):
+    resampler = make(method, max_extrapolation=0.01)
+    times = feed(resampler, np.arange(4.0))
+    slope = 1.0 / PERIOD
+    assert resampler.sample(times[-1] + 0.005)[0] == pytest.approx(3.0 + 0.005 * slope, abs=1e-6)
+    assert resampler.sample(times[-1] + 1.0)[0] == pytest.approx(3.0 + 0.01 * slope, abs=1e-6)
+
+
+def test_queries_before_history_return_oldest_sample():
+    resampler = make('cubic', history=4)
+    times = feed(resampler, np.arange(10.0))
+    assert resampler.sample(times[0])[0] == pytest.approx(6.0)
+    assert resampler.sample(times[6] - 0.001)[0] == pytest.approx(6.0)
+
+
+def test_delay_shifts_queries():
+    resampler = make('linear', delay=PERIOD)
+    times = feed(resampler, np.arange(8.0))
+    assert resampler.sample(times[-1])[0] == pytest.approx(6.0, abs=1e-6)
+
+
+def test_receive_jitter_does_not_distort_the_signal():
+    rng = np.random.default_rng(0)
+    jitter = rng.uniform(0.0, 0.004, 8)
+    jitter[0] = 0.0
+    resampler = make('linear')
+    feed(resampler, np.arange(8.0), jitter)
+    for k in range(8):
+        assert resampler.sample(OFFSET + k * PERIOD)[0] == pytest.approx(k, abs=1e-2)
+
+
+def test_duplicate_and_out_of_order_packets_are_ignored():
+    resampler = make('linear')
+    feed(resampler, np.arange(4.0))
+    latest = resampler.latest_time
+    resampler.push(np.array([100.0]), int(round(2 * PERIOD * 1e6)), OFFSET + 2 * PERIOD)
+    resampler.push(np.array([100.0]), int(round(3 * PERIOD * 1e6)), OFFSET + 3 * PERIOD)
+    assert resampler.latest_time == latest
+    assert resampler.sample(latest)[0] == pytest.approx(3.0)
+
+
+def test_invalid_use_raises():
+    with pytest.raises(ValueError):
+        Resampler(method='nearest')
+    with pytest.raises(ValueError):
+        Resampler(history=1)
+    with pytest.raises(RuntimeError):
+        Resampler().sample(0.0)
+
+
+class FakeGlove:
+    """Serves one packet every 2 ms; inference returns the packet's sequence number."""
+
+    def __init__(self, hand_type: str):
+        self.hand_type = hand_type
+        self.linear_model = None
+        self.running = False
+        self.count = 0
+        self.last_receive_time = None
+        self.last_packets = []
+        self.readers = set()
+
+    def connect(self, port, io_mode=None):
+        pass
+
+    def start_reader(self):
+        self.running = True
+
+    def stop_reader(self):
+        self.running = False
+
+    def get_data(self, timeout=None):
+        if not self.running:
+            raise RuntimeError("Reader not running.")
+        self.readers.add(threading.get_ident())
+        time.sleep(0.002)
+        self.count += 1
+        self.last_receive_time = time.perf_counter()
+        return SimpleNamespace(timestamp=self.count * 2000, tensile_data=np.zeros(19), gyro_data=np.zeros(3))
+
+    def inference(self, data, method, model=None):
+        return np.full(22, float(data.timestamp // 2000))
+
+
+def test_feeder_owns_the_glove_and_stops(monkeypatch):
+    pushed = []
+    push = Resampler.push
+    monkeypatch.setattr(Resampler, 'push', lambda self, values, *args: (pushed.append(values[0]), push(self, values, *args)))
+    sdk = OpenCyberGlove(right_port='fake', glove_cls=FakeGlove)
+    sdk.linear_model = object()
+    sdk.start()
+    sdk.enable_resampling('right', inference_method='linear')
+    seen = [sdk.get_angles('right')[0] for _ in range(5)]
+    feeder = sdk._feed_threads['right']
+    sdk.stop()
+    assert not feeder.is_alive()
+    # Only the feeder read packets; get_angles hands out its results, each one once and in order
+    assert sdk.right_glove.readers == {feeder.ident}
+    assert seen == sorted(set(seen))
+    assert set(seen) <= set(pushed)
+    # The resampler received every packet, not only those returned to the caller
+    assert pushed == list(range(1, len(pushed) + 1))
+    with pytest.raises(RuntimeError):
+        sdk.get_angles('right')